@@ -5,43 +5,122 @@ Deployed as a single Vercel serverless function; `next.config.mjs` rewrites
 original request path to the function.
 """
 
+import json
 import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # The function's working directory is the bundle root, not this file's parent.
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from screening import config
+from screening import result as result_shape
+from screening.batch import screen_batch_async, stream_batch_async
 from screening.services.documents import (
     SUPPORTED_FORMATS,
+    ArchiveTooLarge,
     DocumentError,
-    extract_text,
+    extract_document_async,
+    resumes_in_async,
+    text_budget,
+    text_cache,
+    worker_pool,
 )
+from screening.services.deadline import Deadline
+from screening.services.jd_registry import JDRegistry
+from screening.services.jd_registry import jd_id as _jd_key
 
 logging.basicConfig(level=logging.INFO)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Extraction workers are spawned before the first upload rather than by
+    # it. Serverless platforms that skip lifespan just start them on demand.
+    pool = worker_pool()
+    if pool:
+        try:
+            pool.warm()
+        except Exception:
+            logging.exception("Extraction workers did not start; reading in-process")
+    yield
+    if pool:
+        pool.close()
+
+
+class _BodyLimit:
+    """Refuses an oversized upload while it arrives, not after.
+
+    The multipart parser reads a request's whole body before the route runs, so
+    a size check in the route comes after every byte has been received and
+    spooled. Here a declared Content-Length over the limit is answered with a
+    413 without reading the body at all, and an undeclared one is counted as it
+    streams in and cut off at the first chunk past the limit.
+    """
+
+    def __init__(self, app, limits: dict[str, int]) -> None:
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send) -> None:
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length", b"")
+        if declared.isdigit() and int(declared) > limit:
+            await JSONResponse({"detail": _too_large(limit)}, status_code=413)(
+                scope, receive, send
+            )
+            return
+
+        received = 0
+
+        async def limited():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=413, detail=_too_large(limit))
+            return message
+
+        await self.app(scope, limited, send)
+
+
+def _too_large(limit: int) -> str:
+    return f"The upload exceeds the {limit // (1024 * 1024)} MB limit."
+
+
 app = FastAPI(
     title="Agentic Resume Screening System",
     version="1.0.0",
     docs_url="/api/py/docs",
     openapi_url="/api/py/openapi.json",
+    lifespan=lifespan,
 )
+# A single screening's body is the resume plus the JD and the form's framing.
+app.add_middleware(_BodyLimit, limits={
+    "/api/py/screen": config.MAX_UPLOAD_BYTES + 4 * config.MAX_JD_CHARS + 64 * 1024,
+    "/api/py/screen/batch": config.MAX_BATCH_UPLOAD_BYTES,
+})
 
 # Built once per container and reused across warm invocations.
 _orchestrator = None
+_registry = None
 
 
 def get_orchestrator():
     global _orchestrator
     if _orchestrator is None:
         if config.ORCHESTRATOR == "graph":
-            # Imported lazily: langgraph is a heavy import, and the linear
-            # default must not pay for it on every cold start.
+            # Imported lazily, so a process only loads the route it serves.
             from screening.graph_orchestrator import GraphOrchestrator
 
             _orchestrator = GraphOrchestrator()
@@ -52,6 +131,13 @@ def get_orchestrator():
     return _orchestrator
 
 
+def get_registry() -> JDRegistry:
+    global _registry
+    if _registry is None:
+        _registry = JDRegistry()
+    return _registry
+
+
 @app.get("/api/py/health")
 def health() -> dict:
     llm = get_orchestrator().llm
@@ -61,14 +147,20 @@ def health() -> dict:
         "llm_status": llm.status,
         "model": config.GEMINI_MODEL if llm.available else None,
         "orchestrator": config.ORCHESTRATOR,
+        "llm_cache": llm.cache_stats,
+        "llm_coalesced": llm.coalesced,
+        "llm_retries": llm.retries,
+        "llm_overdue": llm.overdue,
+        "llm_limiter": llm.limiter.stats(),
+        "llm_breaker": llm.breaker.stats(),
+        "llm_hedging": llm.hedger.stats(),
+        "jd_registry": get_registry().stats(),
+        "text_cache": text_cache().stats() if text_cache() else None,
+        "extract_workers": worker_pool().stats() if worker_pool() else None,
     }
 
 
-@app.post("/api/py/screen")
-async def screen(
-    resume: UploadFile = File(..., description="Candidate resume — PDF or DOCX"),
-    job_description: str = Form(..., description="Job description text"),
-) -> JSONResponse:
+def _checked_jd(job_description: str | None) -> str:
     jd_text = (job_description or "").strip()
     if len(jd_text) < 40:
         raise HTTPException(
@@ -80,6 +172,137 @@ async def screen(
             status_code=413,
             detail=f"The job description exceeds {config.MAX_JD_CHARS:,} characters.",
         )
+    return jd_text
+
+
+async def _read_upload(upload: UploadFile, limit: int, what: str) -> bytes:
+    """The upload's bytes, read in chunks and abandoned at the first past `limit`."""
+    too_large = HTTPException(
+        status_code=413, detail=f"{what} exceeds the {limit // (1024 * 1024)} MB limit."
+    )
+    if upload.size is not None and upload.size > limit:
+        raise too_large
+
+    chunks: list[bytes] = []
+    received = 0
+    while chunk := await upload.read(_UPLOAD_CHUNK_BYTES):
+        received += len(chunk)
+        if received > limit:
+            raise too_large
+        chunks.append(chunk)
+    # One copy into the final buffer; a single-chunk upload is not copied at all.
+    return b"".join(chunks)
+
+
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+def _deadline() -> Deadline | None:
+    """The time this request has to be answered in, from when it arrived."""
+    if config.SCREEN_DEADLINE_SECONDS <= 0:
+        return None
+    return Deadline(config.SCREEN_DEADLINE_SECONDS)
+
+
+def _registered(key: str) -> dict | None:
+    jd_data = get_registry().get(key)
+    if jd_data is None:
+        return None
+    return dict(jd_data, note=f"Parsed at registration and reused — JD {key}")
+
+
+_NDJSON = "application/x-ndjson"
+_SSE = "text/event-stream"
+
+
+def _stream_format(request: Request) -> str | None:
+    """NDJSON or server-sent events if the client's Accept asks for either."""
+    accept = request.headers.get("accept", "")
+    return _SSE if _SSE in accept else _NDJSON if _NDJSON in accept else None
+
+
+def _streamed(events, media_type: str) -> StreamingResponse:
+    """Send events as they come. A failure mid-stream can no longer change the
+    status code, so it is sent as a last `{"type": "error"}` event instead."""
+
+    async def body():
+        try:
+            async for event in events:
+                yield _framed(event, media_type)
+        except Exception as exc:
+            logging.exception("Screening failed mid-stream")
+            yield _framed({"type": "error", "detail": f"Screening failed: {exc}"}, media_type)
+
+    return StreamingResponse(
+        body(), media_type=media_type,
+        # Proxies that buffer (nginx, Render's edge) would hold every event back.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _framed(event: dict, media_type: str) -> str:
+    data = json.dumps(event)
+    return f"event: {event['type']}\ndata: {data}\n\n" if media_type == _SSE else data + "\n"
+
+
+async def _parse_and_register(jd_text: str, key: str, deadline: Deadline | None) -> dict:
+    orchestrator = get_orchestrator()
+    jd_data = await orchestrator.jd_agent.parse_async(jd_text, deadline)
+    # A parse that fell back to rules is kept for this process only, so a
+    # Gemini outage — an open breaker included — does not pin a posting to its
+    # deterministic reading. Without Gemini configured, rules are the reading.
+    get_registry().put(
+        key, jd_data,
+        persist=jd_data["source"] == "llm" or not orchestrator.llm.configured,
+    )
+    return jd_data
+
+
+def _resolve_jd(job_description: str | None, jd_id: str | None) -> tuple[str, dict | None]:
+    """The JD text to screen against, and its registered parse if there is one."""
+    if jd_id:
+        parsed_jd = _registered(jd_id)
+        if parsed_jd is None:
+            raise HTTPException(
+                status_code=404, detail="No job description is registered under that id."
+            )
+        return "", parsed_jd
+
+    jd_text = _checked_jd(job_description)
+    # Pasting a registered posting reuses its parse just the same.
+    return jd_text, _registered(_jd_key(jd_text))
+
+
+@app.post("/api/py/jd")
+async def register_jd(
+    job_description: str = Form(..., description="Job description text"),
+) -> JSONResponse:
+    """Parse a JD once; screen against the returned `jd_id` from then on."""
+    deadline = _deadline()
+    jd_text = _checked_jd(job_description)
+    key = _jd_key(jd_text)
+
+    jd_data = get_registry().get(key) or await _parse_and_register(jd_text, key, deadline)
+    return JSONResponse({"jd_id": key, **result_shape.role(jd_data)})
+
+
+@app.get("/api/py/jd/{key}")
+def get_jd(key: str) -> JSONResponse:
+    jd_data = get_registry().get(key)
+    if jd_data is None:
+        raise HTTPException(status_code=404, detail="No job description is registered under that id.")
+    return JSONResponse({"jd_id": key, **result_shape.role(jd_data)})
+
+
+@app.post("/api/py/screen")
+async def screen(
+    request: Request,
+    resume: UploadFile = File(..., description="Candidate resume — PDF or DOCX"),
+    job_description: str | None = Form(None, description="Job description text"),
+    jd_id: str | None = Form(None, description="Id from POST /api/py/jd, instead of the text"),
+) -> Response:
+    deadline = _deadline()
+    jd_text, parsed_jd = _resolve_jd(job_description, jd_id)
 
     filename = resume.filename or ""
     if filename and not filename.lower().endswith(SUPPORTED_FORMATS):
@@ -88,20 +311,33 @@ async def screen(
             detail=f"The resume must be a {' or '.join(f.upper()[1:] for f in SUPPORTED_FORMATS)}.",
         )
 
-    data = await resume.read()
-    if len(data) > config.MAX_UPLOAD_BYTES:
-        raise HTTPException(
-            status_code=413,
-            detail=f"The resume exceeds the {config.MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit.",
-        )
+    data = await _read_upload(resume, config.MAX_UPLOAD_BYTES, "The resume")
 
+    orchestrator = get_orchestrator()
     try:
-        resume_text = extract_text(data, filename)
+        resume = await extract_document_async(
+            data, filename, text_budget(orchestrator.llm.available)
+        )
     except DocumentError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
+    stream = _stream_format(request)
+    if stream:
+        return _streamed(
+            orchestrator.stream_from_text(
+                resume["text"], jd_text, parsed_jd=parsed_jd, pages=resume["pages"],
+                deadline=deadline,
+            ),
+            stream,
+        )
+
     try:
-        result = get_orchestrator().run_from_text(resume_text, jd_text)
+        # The async path: Gemini calls and PDF parsing wait off the event loop,
+        # so one slow screening no longer stalls /api/py/health and the rest.
+        result = await orchestrator.run_from_text_async(
+            resume["text"], jd_text, parsed_jd=parsed_jd, pages=resume["pages"],
+            deadline=deadline,
+        )
     except Exception as exc:
         # The agents already degrade internally, so reaching here means
         # something genuinely unexpected broke.
@@ -113,6 +349,82 @@ async def screen(
     return JSONResponse(result)
 
 
+@app.post("/api/py/screen/batch")
+async def screen_batch(
+    request: Request,
+    resumes: list[UploadFile] = File(..., description="Resumes — PDF, DOCX, or zips of them"),
+    job_description: str | None = Form(None, description="Job description text"),
+    jd_id: str | None = Form(None, description="Id from POST /api/py/jd, instead of the text"),
+) -> Response:
+    """Screen many resumes against one JD and rank them by final score.
+
+    The JD is parsed once (and registered, so the next batch against it skips
+    even that). A resume that cannot be read is listed under `errors` rather
+    than failing the batch. With an NDJSON or SSE Accept header each candidate
+    is sent as it finishes, and the ranking last.
+    """
+    deadline = _deadline()
+    jd_text, parsed_jd = _resolve_jd(job_description, jd_id)
+
+    # Each file is unpacked against what the batch has left of its limits, so
+    # a zip is refused while it inflates rather than once it has.
+    uploads: list[tuple[str, bytes]] = []
+    held = 0
+    for upload in resumes:
+        filename = upload.filename or ""
+        data = await _read_upload(upload, config.MAX_BATCH_UPLOAD_BYTES, filename or "An upload")
+        try:
+            found = await resumes_in_async(
+                filename, data,
+                max_members=config.MAX_BATCH_RESUMES - len(uploads),
+                max_bytes=config.MAX_BATCH_UPLOAD_BYTES - held,
+            )
+        except ArchiveTooLarge as exc:
+            raise HTTPException(status_code=413, detail=str(exc)) from exc
+        except DocumentError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        uploads.extend(found)
+        held += sum(len(content) for _, content in found)
+        if len(uploads) > config.MAX_BATCH_RESUMES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"A batch holds at most {config.MAX_BATCH_RESUMES} resumes.",
+            )
+
+    if not uploads:
+        raise HTTPException(status_code=422, detail="No resumes were found in the upload.")
+
+    key = jd_id or _jd_key(jd_text)
+    if parsed_jd is None:
+        parsed_jd = dict(
+            await _parse_and_register(jd_text, key, deadline),
+            note=f"Parsed once for this batch of {len(uploads)} — JD {key}",
+        )
+
+    stream = _stream_format(request)
+    if stream:
+        async def events():
+            yield {"type": "role", "jd_id": key, "role": result_shape.role(parsed_jd)}
+            async for event in stream_batch_async(
+                get_orchestrator(), uploads, jd_text, parsed_jd, deadline
+            ):
+                yield event
+
+        return _streamed(events(), stream)
+
+    try:
+        batch = await screen_batch_async(
+            get_orchestrator(), uploads, jd_text, parsed_jd, deadline
+        )
+    except Exception as exc:
+        logging.exception("Batch screening failed")
+        raise HTTPException(
+            status_code=500, detail=f"Screening failed: {exc}"
+        ) from exc
+
+    return JSONResponse({"jd_id": key, **batch})
+
+
 # Single-origin hosting (Render, Docker, anywhere that isn't Vercel): the
 # interface is exported to out/ at build time and served from here, so the
 # front end reaches /api/py/* directly with no rewrite in between.
@@ -0,0 +1,69 @@
+"""Screening throughput against requests in flight, in LLM mode.
+
+    python -m benchmarks.async_screening
+
+Gemini is replaced by an in-process client that sleeps LATENCY seconds and
+answers with canned JSON, so what is measured is how the orchestrator waits,
+not the model. "blocking" calls `run_from_text` from a coroutine, which is
+what the API handler used to do. "async" awaits `run_from_text_async`. A
+blocking call holds the event loop, so its throughput stays flat however much
+is in flight. The async path should scale until LLM_WORKERS threads are busy.
+"""
+
+import asyncio
+import os
+import time
+
+os.environ["USE_LLM"] = "false"
+
+from screening.orchestrator import Orchestrator  # noqa: E402
+from tests.fakes import JD_REPLY, FakeClient, FakeModels  # noqa: E402
+
+LATENCY = 0.2
+IN_FLIGHT = (1, 4, 16, 32)
+ROUNDS = 2
+
+RESUME = "Backend engineer, 4 years of experience with Python, Django and PostgreSQL."
+JD = "We need a Python developer with Django and PostgreSQL, 2-4 years of experience."
+
+
+class _Models(FakeModels):
+    def answer(self, contents: str) -> dict:
+        if "screening a resume" in contents:
+            return {"skills": ["Python", "Django", "PostgreSQL"], "experience_years": 4}
+        return JD_REPLY
+
+
+def _orchestrator() -> Orchestrator:
+    orchestrator = Orchestrator()
+    orchestrator.llm._client = FakeClient(_Models(latency=LATENCY))
+    return orchestrator
+
+
+async def _throughput(screen, in_flight: int) -> float:
+    total = in_flight * ROUNDS
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await asyncio.gather(*[screen() for _ in range(in_flight)])
+    return total / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    orchestrator = _orchestrator()
+
+    async def blocking():
+        return orchestrator.run_from_text(RESUME, JD)
+
+    async def non_blocking():
+        return await orchestrator.run_from_text_async(RESUME, JD)
+
+    print(f"fake Gemini latency {LATENCY * 1000:.0f} ms, two calls per screening\n")
+    print(f"{'in flight':>9}  {'blocking /s':>11}  {'async /s':>9}")
+    for in_flight in IN_FLIGHT:
+        before = await _throughput(blocking, in_flight)
+        after = await _throughput(non_blocking, in_flight)
+        print(f"{in_flight:>9}  {before:>11.1f}  {after:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
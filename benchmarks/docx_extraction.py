@@ -0,0 +1,98 @@
+"""DOCX text extraction: the streamed reader against python-docx.
+
+    python -m benchmarks.docx_extraction
+
+Needs python-docx, which builds the documents and is the path being compared
+against. Each shape is read with `_from_docx` (incremental XML straight from
+the zip) and `_from_docx_object_model` (the full python-docx object model), in
+process and uncached; time is the median of ROUNDS, memory is the peak traced
+allocation. Both must return the same text. The last lines are what each path
+adds to a cold start: a fresh interpreter importing it.
+"""
+
+import io
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from docx import Document
+
+from screening.services import documents
+
+ROUNDS = 15
+
+
+def _prose(doc) -> None:
+    for i in range(200):
+        doc.add_paragraph(f"Built and operated Python services, item {i}, with Django and Kafka.")
+
+
+def _table_layout(doc) -> None:
+    # The common template: the whole resume in a two-column table.
+    table = doc.add_table(rows=60, cols=2)
+    for i, row in enumerate(table.rows):
+        row.cells[0].text = f"2019 – 2023 · role {i}"
+        row.cells[1].text = f"Led a team of {i % 7 + 2} on PostgreSQL and FastAPI.\nShipped weekly."
+
+
+def _table_heavy(doc) -> None:
+    for t in range(10):
+        table = doc.add_table(rows=30, cols=4)
+        for i, row in enumerate(table.rows):
+            for j, cell in enumerate(row.cells):
+                cell.text = f"skill {t}.{i}.{j}"
+        table.cell(0, 0).merge(table.cell(0, 3))
+
+
+SHAPES = {"prose": _prose, "table layout": _table_layout, "table-heavy": _table_heavy}
+
+
+def _build(fill) -> bytes:
+    doc = Document()
+    fill(doc)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _measure(read, data: bytes) -> tuple[float, float, str]:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        text = read(data)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    read(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024, text
+
+
+def _import_ms(module: str) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    print(f"{'shape':<14}{'KB':>6}  {'stream ms':>9}  {'docx ms':>8}  "
+          f"{'stream KiB':>10}  {'docx KiB':>9}")
+
+    for name, fill in SHAPES.items():
+        data = _build(fill)
+        stream_ms, stream_kib, stream_text = _measure(documents._from_docx, data)
+        docx_ms, docx_kib, docx_text = _measure(documents._from_docx_object_model, data)
+        assert stream_text == docx_text, name
+        print(f"{name:<14}{len(data) // 1024:>6}  {stream_ms:>9.1f}  {docx_ms:>8.1f}  "
+              f"{stream_kib:>10.0f}  {docx_kib:>9.0f}")
+
+    print()
+    print(f"cold import, xml.etree.ElementTree: {_import_ms('xml.etree.ElementTree'):.0f} ms")
+    print(f"cold import, docx:                  {_import_ms('docx'):.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""A local stand-in for the Gemini API, for load-testing the LLM path.
+
+    python -m benchmarks.fake_gemini --port 8090 --latency-ms 400 --error-rate 0.05
+
+then run the API against it:
+
+    GEMINI_API_KEY=fake GEMINI_BASE_URL=http://127.0.0.1:8090 uvicorn api.index:app
+
+It answers `generateContent` the way Gemini does — same path, same response
+envelope, same error bodies — so the SDK and everything above it run unchanged.
+Answers are worked out with the deterministic extractors, so verdicts stay
+plausible under load. Faults are drawn per request:
+
+- latency is log-normal around --latency-ms (spread --jitter), and a
+  --spike-rate share of requests take --spike-ms instead;
+- --error-rate answers 429 RESOURCE_EXHAUSTED or 503 UNAVAILABLE, half each;
+- --empty-rate, --prose-rate and --fenced-rate answer with no text, with a
+  sentence instead of JSON, or with the JSON in a ```json fence.
+
+GET /stats reports what was served, by outcome.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from screening.services import taxonomy
+
+
+def _resume(text: str) -> dict:
+    doc = taxonomy.AnalysedText(text)
+    return {
+        "skills": taxonomy.extract_skills(doc),
+        "experience_years": taxonomy.extract_experience_years(doc),
+        "projects": [],
+    }
+
+
+def _job(text: str) -> dict:
+    skills = taxonomy.extract_required_skills(text)
+    return {
+        "required_skills": skills,
+        "experience_required": taxonomy.extract_experience_requirement(text),
+        "jd_clarity": "clear" if len(skills) >= 2 else "vague",
+    }
+
+
+def answer(prompt: str) -> dict:
+    """What a well-behaved model would return for each of LLMService's prompts."""
+    if "### Resume 0" in prompt:
+        parts = re.split(r"^### Resume (\d+)\n", prompt, flags=re.MULTILINE)[1:]
+        return {"resumes": [
+            dict(_resume(text), id=int(i)) for i, text in zip(parts[::2], parts[1::2])
+        ]}
+    if "Job description:\n" in prompt and "Resume:\n" in prompt:
+        resume, job = prompt.split("Resume:\n", 1)[1].split("\n\nJob description:\n", 1)
+        return {"resume": _resume(resume), "job": _job(job)}
+    if "Job description:\n" in prompt:
+        return _job(prompt.split("Job description:\n", 1)[1])
+    return _resume(prompt.split("Resume:\n", 1)[-1])
+
+
+class FakeGemini:
+    def __init__(self, latency_ms: float, jitter: float, spike_rate: float, spike_ms: float,
+                 error_rate: float, empty_rate: float, prose_rate: float,
+                 fenced_rate: float, seed: int | None = None) -> None:
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.spike_rate = spike_rate
+        self.spike_ms = spike_ms
+        self.error_rate = error_rate
+        self.empty_rate = empty_rate
+        self.prose_rate = prose_rate
+        self.fenced_rate = fenced_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.served: Counter = Counter()
+
+    def respond(self, prompt: str) -> tuple[int, dict]:
+        """(status, body) for one request, after its drawn latency."""
+        with self._lock:
+            spike = self._random.random() < self.spike_rate
+            delay_ms = self.spike_ms if spike else self.latency_ms * math.exp(
+                self._random.gauss(0, self.jitter)
+            )
+            draw = self._random.random()
+        time.sleep(delay_ms / 1000)
+
+        outcome, status, body = self._outcome(draw, prompt)
+        with self._lock:
+            self.served[outcome] += 1
+            if spike:
+                self.served["spike"] += 1
+        return status, body
+
+    def _outcome(self, draw: float, prompt: str) -> tuple[str, int, dict]:
+        for outcome, rate in (("error", self.error_rate), ("empty", self.empty_rate),
+                              ("prose", self.prose_rate), ("fenced", self.fenced_rate)):
+            if draw < rate:
+                break
+            draw -= rate
+        else:
+            outcome = "ok"
+
+        if outcome == "error":
+            if self._random.random() < 0.5:
+                return "429", 429, _error(429, "Resource has been exhausted (e.g. check quota).",
+                                          "RESOURCE_EXHAUSTED")
+            return "503", 503, _error(503, "The model is overloaded. Please try again later.",
+                                      "UNAVAILABLE")
+        if outcome == "empty":
+            return outcome, 200, _reply("")
+        if outcome == "prose":
+            return outcome, 200, _reply("Here is a summary of the candidate's background.")
+
+        text = json.dumps(answer(prompt))
+        if outcome == "fenced":
+            text = f"```json\n{text}\n```"
+        return outcome, 200, _reply(text)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.served)
+
+
+def _reply(text: str) -> dict:
+    return {
+        "candidates": [{
+            "content": {"parts": [{"text": text}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0,
+        }],
+        "usageMetadata": {"promptTokenCount": 0, "candidatesTokenCount": 0},
+    }
+
+
+def _error(code: int, message: str, status: str) -> dict:
+    return {"error": {"code": code, "message": message, "status": status}}
+
+
+def serve(fake: FakeGemini, host: str, port: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            if not self.path.split("?", 1)[0].endswith(":generateContent"):
+                self._send(404, _error(404, f"No route for {self.path}", "NOT_FOUND"))
+                return
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            prompt = "".join(
+                part.get("text", "")
+                for content in request.get("contents", [])
+                for part in content.get("parts", [])
+            )
+            self._send(*fake.respond(prompt))
+
+        def do_GET(self) -> None:
+            if self.path == "/stats":
+                self._send(200, fake.stats())
+            else:
+                self._send(404, _error(404, f"No route for {self.path}", "NOT_FOUND"))
+
+        def _send(self, status: int, body: dict) -> None:
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # one line per request drowns the load driver's output
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=400)
+    parser.add_argument("--jitter", type=float, default=0.3)
+    parser.add_argument("--spike-rate", type=float, default=0.0)
+    parser.add_argument("--spike-ms", type=float, default=8000)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--empty-rate", type=float, default=0.0)
+    parser.add_argument("--prose-rate", type=float, default=0.0)
+    parser.add_argument("--fenced-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    fake = FakeGemini(args.latency_ms, args.jitter, args.spike_rate, args.spike_ms,
+                      args.error_rate, args.empty_rate, args.prose_rate,
+                      args.fenced_rate, args.seed)
+    server = serve(fake, args.host, args.port)
+    print(f"fake Gemini on http://{args.host}:{args.port} — GET /stats for counts")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""The graph route on screening.dag against the same graph on LangGraph.
+
+    python -m benchmarks.graph_runtime
+
+Needs langgraph, which the app itself no longer does (pip install langgraph).
+
+"cold import" is the median over COLD_RUNS fresh interpreters of the time to
+import each runtime, then the whole graph route with it: the price a
+serverless cold start pays before the first request. "per node" runs a chain
+of NODES no-op nodes, each appending to a reduced list, RUNS times. The
+remaining rows time the panel itself in deterministic mode, with no Gemini
+calls to hide the runtime behind: one screening through `invoke`, and one
+through `ainvoke`.
+"""
+
+import asyncio
+import operator
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Annotated, TypedDict
+
+os.environ["USE_LLM"] = "false"
+
+from langgraph.graph import StateGraph as LangGraphStateGraph  # noqa: E402
+
+from screening.dag import StateGraph  # noqa: E402
+from screening.graph_orchestrator import GraphOrchestrator  # noqa: E402
+
+COLD_RUNS = 5
+NODES = 20
+RUNS = 200
+
+RESUME = "Backend engineer, 4 years of experience with Python, Django and PostgreSQL."
+JD = "We need a Python developer with Django and PostgreSQL, 2-4 years of experience."
+
+_IMPORTS = {
+    "screening.dag": ("import screening.dag",
+                      "import screening.graph_orchestrator"),
+    "langgraph": ("import langgraph.graph",
+                  "import langgraph.graph, screening.graph_orchestrator"),
+}
+
+
+class _Chain(TypedDict, total=False):
+    seen: Annotated[list[int], operator.add]
+
+
+def _cold_import(statement: str) -> float:
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    samples = [
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             check=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}).stdout)
+        for _ in range(COLD_RUNS)
+    ]
+    return statistics.median(samples)
+
+
+def _chain(graph_type):
+    graph = graph_type(_Chain)
+    for i in range(NODES):
+        graph.add_node(f"n{i}", lambda state, i=i: {"seen": [i]})
+        if i:
+            graph.add_edge(f"n{i - 1}", f"n{i}")
+    graph.set_entry_point("n0")
+    return graph.compile()
+
+
+def _per_call(fn, runs: int) -> float:
+    fn()  # warm
+    started = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - started) / runs
+
+
+def main() -> None:
+    print(f"{'':>24}  {'screening.dag':>13}  {'langgraph':>9}")
+
+    runtime, route = zip(*(
+        (_cold_import(runtime), _cold_import(route)) for runtime, route in _IMPORTS.values()
+    ))
+    print(f"{'cold import, runtime':>24}  {runtime[0] * 1000:>10.0f} ms  {runtime[1] * 1000:>6.0f} ms")
+    print(f"{'cold import, graph route':>24}  {route[0] * 1000:>10.0f} ms  {route[1] * 1000:>6.0f} ms")
+
+    chains = [_chain(StateGraph), _chain(LangGraphStateGraph)]
+    per_node = [_per_call(lambda: chain.invoke({"seen": []}), RUNS) / NODES for chain in chains]
+    print(f"{'per node':>24}  {per_node[0] * 1e6:>10.1f} µs  {per_node[1] * 1e6:>6.1f} µs")
+
+    panels = [GraphOrchestrator(), GraphOrchestrator()]
+    panels[1].graph = panels[1]._build(LangGraphStateGraph)
+    panels[1].async_graph = panels[1]._build(LangGraphStateGraph, asynchronous=True)
+    sync = [_per_call(lambda: panel.run_from_text(RESUME, JD), RUNS) for panel in panels]
+    print(f"{'screening, invoke':>24}  {sync[0] * 1000:>10.2f} ms  {sync[1] * 1000:>6.2f} ms")
+
+    async def screen(panel):
+        return await panel.run_from_text_async(RESUME, JD)
+
+    loop = asyncio.new_event_loop()
+    try:
+        asynchronous = [
+            _per_call(lambda: loop.run_until_complete(screen(panel)), RUNS) for panel in panels
+        ]
+    finally:
+        loop.close()
+    print(f"{'screening, ainvoke':>24}  {asynchronous[0] * 1000:>10.2f} ms"
+          f"  {asynchronous[1] * 1000:>6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
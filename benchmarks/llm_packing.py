@@ -0,0 +1,78 @@
+"""Bulk resume extraction: one Gemini request per resume against packed requests.
+
+    python -m benchmarks.llm_packing
+
+Gemini is replaced by an in-process client whose latency is a fixed round trip
+plus a cost per character of prompt, so a packed request is slower than a
+single one, as it would be. Calls go through the service's limiter, set to
+IN_FLIGHT concurrent requests and PER_MINUTE requests a minute: the quota a
+bulk job actually runs into. RESUMES extractions are awaited at once, as a
+batch screening awaits them, with LLM_PACK_RESUMES at each of PACK_SIZES (1 is
+one request per resume). "failed" counts extractions the limiter refused after
+LLM_QUEUE_SECONDS in the queue — each a resume that would have fallen back to
+rules.
+"""
+
+import asyncio
+import os
+import time
+
+os.environ["USE_LLM"] = "false"
+
+from screening import config  # noqa: E402
+from screening.services.limiter import Limiter  # noqa: E402
+from screening.services.llm_service import LLMService  # noqa: E402
+from tests.fakes import FakeClient, FakeModels  # noqa: E402
+
+ROUND_TRIP = 0.3
+SECONDS_PER_CHAR = 20e-6
+IN_FLIGHT = 8
+PER_MINUTE = 600
+RESUMES = 96
+PACK_SIZES = (1, 2, 4, 8)
+
+RESUME = ("Backend engineer, 4 years of experience with Python, Django and PostgreSQL. "
+          "Built and operated payment services; on call for the ledger. ") * 20
+
+
+class _Models(FakeModels):
+    def delay(self, contents: str) -> float:
+        return ROUND_TRIP + SECONDS_PER_CHAR * len(contents)
+
+    def answer(self, contents: str) -> dict:
+        entry = {"skills": ["Python", "Django", "PostgreSQL"], "experience_years": 4}
+        count = contents.count("### Resume ")
+        if not count:
+            return entry
+        return {"resumes": [dict(entry, id=i) for i in range(count)]}
+
+
+async def _run(pack_size: int) -> tuple[float, int, int]:
+    config.LLM_PACK_RESUMES = pack_size
+    llm = LLMService()
+    llm._client = FakeClient(_Models())
+    llm.limiter = Limiter(per_minute=PER_MINUTE, max_in_flight=IN_FLIGHT)
+
+    # Distinct texts, so nothing is coalesced as a repeat.
+    texts = [f"Candidate {i}. {RESUME}" for i in range(RESUMES)]
+    started = time.perf_counter()
+    answers = await asyncio.gather(
+        *(llm.extract_resume_info_async(text) for text in texts), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - started
+    failed = sum(isinstance(a, Exception) for a in answers)
+    return RESUMES / elapsed, llm._client.models.calls, failed
+
+
+async def main() -> None:
+    print(f"{RESUMES} resumes of {len(RESUME):,} chars; fake round trip "
+          f"{ROUND_TRIP * 1000:.0f} ms + {SECONDS_PER_CHAR * 1e6:.0f} µs/char; "
+          f"{IN_FLIGHT} in flight, {PER_MINUTE}/min\n")
+    print(f"{'per request':>11}  {'requests':>8}  {'resumes/s':>9}  {'failed':>6}")
+    for pack_size in PACK_SIZES:
+        rate, calls, failed = await _run(pack_size)
+        print(f"{pack_size:>11}  {calls:>8}  {rate:>9.1f}  {failed:>6}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
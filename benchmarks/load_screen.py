@@ -0,0 +1,160 @@
+"""Load driver for /api/py/screen.
+
+    python -m benchmarks.load_screen --url http://127.0.0.1:8000 --requests 400 --concurrency 32
+
+Needs httpx. Screens one resume against one JD (by default the first
+samples), `--concurrency` requests at a time, and reports latency percentiles,
+throughput, status codes and how often a parser fell back to rules. Retries,
+refusals and the breaker's state are read from /api/py/health before and
+after. With `--fake` naming a fake_gemini server, what it served is reported
+too.
+
+Each request carries a reference number in both documents — the resume is
+re-sent as a DOCX of its text — so no request is answered by the text cache,
+the LLM cache or another request in flight. `--repeat` sends the files as they
+are, to measure the cached path instead.
+
+To size a deployment without spending quota, run the API with GEMINI_BASE_URL
+pointed at `benchmarks.fake_gemini` and shape the fake's latency and faults to
+match the outage being rehearsed.
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import time
+import zipfile
+from collections import Counter
+from xml.sax.saxutils import escape
+
+import httpx
+
+from screening.services.documents import extract_text
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "public", "samples")
+
+
+def _docx(text: str) -> bytes:
+    """A minimal DOCX of `text`, one paragraph per line."""
+    body = "".join(f"<w:p><w:r><w:t>{escape(line)}</w:t></w:r></w:p>" for line in text.splitlines())
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        package.writestr("_rels/.rels", (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="word/document.xml" Type="http://schemas.'
+            'openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+            '</Relationships>'
+        ))
+        package.writestr("word/document.xml", (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>"
+        ))
+    return buffer.getvalue()
+
+
+def _percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))]
+
+
+async def _screen(client: httpx.AsyncClient, url: str, resume: bytes, filename: str,
+                  jd: str) -> tuple[float, int, dict | None]:
+    started = time.perf_counter()
+    try:
+        response = await client.post(
+            f"{url}/api/py/screen",
+            files={"resume": (filename, resume)},
+            data={"job_description": jd},
+        )
+    except httpx.HTTPError:
+        return time.perf_counter() - started, 0, None
+    elapsed = time.perf_counter() - started
+    body = response.json() if response.status_code == 200 else None
+    return elapsed, response.status_code, body
+
+
+def _fell_back(result: dict) -> list[str]:
+    return [
+        step["agent"] for step in result["trace"][:2]
+        if (step.get("note") or "").startswith("Deterministic fallback")
+    ]
+
+
+async def run(url: str, requests: int, concurrency: int, resume_path: str,
+              jd_path: str, fake: str | None, repeat: bool) -> None:
+    with open(resume_path, "rb") as f:
+        resume = f.read()
+    with open(jd_path, encoding="utf-8") as f:
+        jd = f.read()
+    filename = os.path.basename(resume_path)
+    resume_text = extract_text(resume, filename)
+
+    def documents(i: int) -> tuple[bytes, str, str]:
+        if repeat:
+            return resume, filename, jd
+        return (_docx(f"{resume_text}\nReference {i}"), f"load-{i}.docx",
+                f"{jd}\n\nReference {i}")
+
+    async with httpx.AsyncClient(timeout=None) as client:
+        before = (await client.get(f"{url}/api/py/health")).json()
+        gate = asyncio.Semaphore(concurrency)
+
+        async def one(i: int):
+            async with gate:
+                return await _screen(client, url, *documents(i))
+
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(*(one(i) for i in range(requests)))
+        wall = time.perf_counter() - started
+        after = (await client.get(f"{url}/api/py/health")).json()
+        served = (await client.get(f"{fake}/stats")).json() if fake else None
+
+    latencies = [elapsed * 1000 for elapsed, _, _ in outcomes]
+    statuses = Counter(status for _, status, _ in outcomes)
+    results = [body for _, _, body in outcomes if body is not None]
+    fallbacks = Counter(agent for result in results for agent in _fell_back(result))
+    modes = Counter(result["mode"] for result in results)
+
+    print(f"{requests} screenings, {concurrency} at a time, against {url} "
+          f"({before['mode']}, {before['orchestrator']})\n")
+    print(f"throughput   {requests / wall:.1f} screenings/s over {wall:.1f}s")
+    print(f"latency ms   p50 {_percentile(latencies, 50):.0f}   p95 {_percentile(latencies, 95):.0f}"
+          f"   p99 {_percentile(latencies, 99):.0f}   max {max(latencies):.0f}"
+          f"   mean {statistics.fmean(latencies):.0f}")
+    print(f"status       {dict(sorted(statuses.items()))}   (0: no response)")
+    print(f"mode         {dict(modes)}")
+    if results:
+        print(f"fallback     ResumeParser {fallbacks['ResumeParser'] / len(results):.1%}"
+              f"   JDParser {fallbacks['JDParser'] / len(results):.1%}")
+    print(f"retries      {after.get('llm_retries', 0) - before.get('llm_retries', 0)}")
+    if "llm_limiter" in after:
+        limiter = after["llm_limiter"]
+        print(f"limiter      refused {limiter['refused'] - before['llm_limiter']['refused']}"
+              f"   mean wait {limiter['mean_wait_ms']} ms   max wait {limiter['max_wait_ms']} ms")
+    if "llm_breaker" in after:
+        breaker = after["llm_breaker"]
+        print(f"breaker      {breaker['state']}, opened "
+              f"{breaker['opened'] - before['llm_breaker']['opened']} times")
+    if served is not None:
+        print(f"fake served  {served}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--resume", default=os.path.join(SAMPLES, "resume_01_priya_sharma.pdf"))
+    parser.add_argument("--jd", default=os.path.join(SAMPLES, "jd_01_backend_python_standard.txt"))
+    parser.add_argument("--fake", help="fake_gemini base URL, to report what it served")
+    parser.add_argument("--repeat", action="store_true",
+                        help="send the same files every time, so caches answer")
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.requests, args.concurrency, args.resume, args.jd,
+                    args.fake, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
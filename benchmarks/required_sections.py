@@ -0,0 +1,59 @@
+"""Requirements-section scanning on adversarial job descriptions.
+
+    python -m benchmarks.required_sections
+
+The public endpoint accepts postings up to MAX_JD_CHARS, so worst-case
+latency matters as much as the typical case. Each shape is timed at growing
+sizes with the line scanner `extract_required_skills` uses, and with the
+lazy-lookahead regex it replaced. The regex is only run up to LEGACY_LIMIT
+characters, because past that the blank-run shapes take minutes.
+"""
+
+import re
+import time
+
+from screening import config
+from screening.services import taxonomy
+
+SIZES = (5_000, 10_000, 20_000, config.MAX_JD_CHARS)
+LEGACY_LIMIT = 10_000
+
+_LEGACY_RE = re.compile(
+    r"(?:required|requirements|must[\s-]have|qualifications|"
+    r"technical\s+requirements|skills)\b(.*?)"
+    r"(?=\n\s*(?:nice[\s-]to[\s-]have|preferred|benefits|what\s+we\s+offer|"
+    r"how\s+to\s+apply|about\s+(?:us|the\s+company))|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+SHAPES = {
+    "header-free": lambda n: ("python developer building services. " * n)[:n],
+    "header-dense": lambda n: ("Skills: python\nRequirements: sql\n" * n)[:n],
+    "alternating": lambda n: ("Skills: python\nPreferred: go\n" * n)[:n],
+    "blank lines": lambda n: ("Skills: python" + "\n" * n)[:n],
+    "spaced lines": lambda n: ("Skills: python\n" + " \n" * n)[:n],
+}
+
+
+def _ms(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    print(f"{'shape':<14}{'chars':>8}  {'scanner ms':>10}  {'regex ms':>10}")
+
+    for name, build in SHAPES.items():
+        for size in SIZES:
+            text = build(size)
+            scanner = _ms(lambda: taxonomy._required_sections(text))
+            legacy = (
+                f"{_ms(lambda: [m.group(1) for m in _LEGACY_RE.finditer(text)]):>10.1f}"
+                if size <= LEGACY_LIMIT else f"{'—':>10}"
+            )
+            print(f"{name:<14}{size:>8,}  {scanner:>10.1f}  {legacy}")
+
+
+if __name__ == "__main__":
+    main()
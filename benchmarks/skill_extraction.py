@@ -0,0 +1,91 @@
+"""Skill extraction cost against vocabulary size.
+
+    python -m benchmarks.skill_extraction
+
+Scans a 40,000-character posting with the shipped vocabulary and with one
+padded to ten times its size by synthetic aliases, once with the trie scanner
+`extract_skills` uses and once with the per-alias regex loop it replaced. The
+scanner should stay roughly flat as the vocabulary grows; the loop should not.
+"""
+
+import random
+import re
+import string
+import time
+
+from screening import config
+from screening.services import taxonomy
+
+TEXT_CHARS = config.MAX_JD_CHARS
+GROWTH = 10
+REPEATS = 3
+
+
+def _posting() -> str:
+    rng = random.Random(7)
+    aliases = list(taxonomy._LOOKUP)
+    filler = ["built", "services", "with", "the", "team", "and", "owned",
+              "production", "for", "customers", "using", "daily"]
+    lines, size = [], 0
+    while size < TEXT_CHARS:
+        words = [rng.choice(filler) for _ in range(10)]
+        words[rng.randrange(10)] = rng.choice(aliases)
+        line = "- " + " ".join(words) + "."
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)[:TEXT_CHARS]
+
+
+def _vocabulary(factor: int) -> list[str]:
+    rng = random.Random(11)
+    aliases = list(taxonomy._ALIASES_BY_LENGTH)
+    while len(aliases) < len(taxonomy._ALIASES_BY_LENGTH) * factor:
+        aliases.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 14))))
+    return sorted(aliases, key=len, reverse=True)
+
+
+def _patterns(aliases: list[str]) -> list[re.Pattern[str]]:
+    return [
+        re.compile(
+            r"(?<![a-z0-9+#.])" + re.escape(alias) + r"(?![a-z0-9+#]|\.[a-z])",
+            re.IGNORECASE,
+        )
+        for alias in aliases
+    ]
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    lines = _posting().splitlines()
+
+    print(f"{len(lines)} lines, {sum(map(len, lines)):,} chars\n")
+    print(f"{'aliases':>8}  {'trie ms':>9}  {'regex ms':>9}")
+
+    for factor in (1, GROWTH):
+        aliases = _vocabulary(factor)
+        trie = taxonomy._build_trie(aliases)
+        patterns = _patterns(aliases)
+
+        def scanner() -> None:
+            for line in lines:
+                taxonomy._scan(taxonomy._fold(line), trie)
+
+        def per_alias() -> None:
+            for line in lines:
+                for pattern in patterns:
+                    for _ in pattern.finditer(line):
+                        pass
+
+        print(f"{len(aliases):>8}  {_best_of(scanner):>9.1f}  {_best_of(per_alias):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,15 @@ export interface TraceStep {
   agent: string;
   description: string;
   duration_ms: number;
+  /** Wall-clock of the parsing stage, on the two parser steps only. The linear
+   *  orchestrator runs them side by side, so this is less than their sum. */
+  stage_ms?: number;
+  /** On the ResumeParser step: how much of an uploaded PDF was read before
+   *  the text budget was met. null for a DOCX or pasted text. */
+  pages?: { read: number; skipped: number } | null;
+  /** The step's share of the request's deadline (SCREEN_DEADLINE_SECONDS):
+   *  what it used and what was left when it finished. Absent without one. */
+  budget?: { used_ms: number; left_ms: number };
   source: Source | null;
   note: string | null;
   /** "skipped" only occurs under ORCHESTRATOR=graph, which routes around
@@ -54,6 +63,12 @@ export interface ScreeningResult {
   trace: TraceStep[];
 }
 
+/** One line of a streamed /api/py/screen (NDJSON) or one SSE `data:`. */
+export type ScreeningEvent =
+  | { type: "step"; step: TraceStep }
+  | { type: "result"; result: ScreeningResult }
+  | { type: "error"; detail: string };
+
 export interface Health {
   status: string;
   mode: Mode;
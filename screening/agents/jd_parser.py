@@ -1,5 +1,8 @@
+import asyncio
 import logging
 
+from screening import config
+from screening.services.deadline import Deadline
 from screening.services.llm_service import LLMService
 from screening.services import taxonomy
 
@@ -17,26 +20,71 @@ class JDParserAgent:
     def __init__(self, llm: LLMService | None = None) -> None:
         self.llm = llm or LLMService()
 
-    def parse(self, jd_text: str) -> dict:
+    def parse(self, jd_text: str, deadline: Deadline | None = None) -> dict:
+        """`deadline` bounds the Gemini call; with too little of it left, the
+        call is not made and the rules answer instead."""
         if self.llm.available:
+            if config.LLM_SOFT_DEADLINE_SECONDS > 0:
+                # The rules read the document while the call is out, and stand
+                # in for an answer that misses the soft deadline.
+                soft = Deadline(config.LLM_SOFT_DEADLINE_SECONDS)  # from the send
+                pending = self.llm.start(self.llm.extract_jd_info, jd_text, deadline)
+                rules = self._rule_based(jd_text)
+                answer = self.llm.answer_within(pending, deadline, soft)
+                return self.parse_answer(jd_text, answer, rules)
             try:
-                data = self.llm.extract_jd_info(jd_text)
-                skills = taxonomy.canonical_set(data.get("required_skills", []))
-                return {
-                    "required_skills": skills,
-                    "experience_required": _clean_requirement(
-                        data.get("experience_required")
-                    ),
-                    "jd_clarity": _clarity(data.get("jd_clarity"), skills),
-                    "source": "llm",
-                    "note": None,
-                }
+                return self._from_llm(self.llm.extract_jd_info(jd_text, deadline))
             except Exception as exc:
-                logger.warning("JD LLM parse failed, falling back to rules: %s", exc)
-                fallback = self._rule_based(jd_text)
-                fallback["note"] = f"Deterministic fallback used — {exc}"
-                return fallback
+                return self._fallback(jd_text, exc)
 
+        return self._deterministic(jd_text)
+
+    async def parse_async(self, jd_text: str, deadline: Deadline | None = None) -> dict:
+        """`parse`, without holding the event loop through the Gemini call."""
+        if self.llm.available:
+            if config.LLM_SOFT_DEADLINE_SECONDS > 0:
+                soft = Deadline(config.LLM_SOFT_DEADLINE_SECONDS)
+                pending = asyncio.ensure_future(self.llm.extract_jd_info_async(jd_text, deadline))
+                await asyncio.sleep(0)  # the call goes out before the rules run
+                rules = self._rule_based(jd_text)
+                answer = await self.llm.answer_within_async(pending, deadline, soft)
+                return self.parse_answer(jd_text, answer, rules)
+            try:
+                return self._from_llm(await self.llm.extract_jd_info_async(jd_text, deadline))
+            except Exception as exc:
+                return self._fallback(jd_text, exc)
+
+        return self._deterministic(jd_text)
+
+    def parse_answer(self, jd_text: str, answer, rules: dict | None = None) -> dict:
+        """`parse`, given the model's answer from a combined call — or the
+        exception that stands in for it (see `LLMService.extract_both`).
+        `rules` is the rule-based reading, if it has been made already."""
+        try:
+            if isinstance(answer, Exception):
+                raise answer
+            return self._from_llm(answer)
+        except Exception as exc:
+            return self._fallback(jd_text, exc, rules)
+
+    @staticmethod
+    def _from_llm(data: dict) -> dict:
+        skills = taxonomy.canonical_set(data.get("required_skills", []))
+        return {
+            "required_skills": skills,
+            "experience_required": _clean_requirement(data.get("experience_required")),
+            "jd_clarity": _clarity(data.get("jd_clarity"), skills),
+            "source": "llm",
+            "note": data.get("_note"),
+        }
+
+    def _fallback(self, jd_text: str, exc: Exception, rules: dict | None = None) -> dict:
+        logger.warning("JD LLM parse failed, falling back to rules: %s", exc)
+        fallback = rules or self._rule_based(jd_text)
+        fallback["note"] = f"Deterministic fallback used — {exc}"
+        return fallback
+
+    def _deterministic(self, jd_text: str) -> dict:
         result = self._rule_based(jd_text)
         result["note"] = f"Deterministic mode — {self.llm.status}"
         return result
@@ -0,0 +1,149 @@
+"""One job description against many resumes.
+
+The JD is parsed once, by the caller, and handed to every screening as
+`parsed_jd`. Resumes are then read and screened side by side, at most
+BATCH_CONCURRENCY at a time: text extraction waits on its own pool and Gemini
+calls on the LLM service's, so a batch moves as fast as those allow rather than
+one HTTP round trip at a time.
+
+A resume that cannot be read fails on its own. It is reported in `errors` and
+the rest of the batch is ranked as usual.
+
+`screen_batch_async` answers with the whole ranked set; `stream_batch_async`
+sends each candidate as soon as it is screened and the ranking last. Given a
+`deadline`, every screening in the batch shares it, so resumes still waiting
+when it runs low are read by rules rather than the batch overrunning.
+"""
+
+import asyncio
+import logging
+
+from screening import config
+from screening import result as result_shape
+from screening.services.deadline import Deadline
+from screening.services.documents import DocumentError, extract_document_async, text_budget
+
+logger = logging.getLogger(__name__)
+
+
+async def screen_batch_async(orchestrator, uploads: list[tuple[str, bytes]],
+                             jd_text: str, parsed_jd: dict,
+                             deadline: Deadline | None = None) -> dict:
+    """Screen every (filename, bytes) upload against one parsed JD, ranked."""
+    results: dict[int, dict] = {}
+    errors: dict[int, dict] = {}
+    async for index, outcome in _screen_all(orchestrator, uploads, jd_text, parsed_jd,
+                                            deadline):
+        (errors if "error" in outcome else results)[index] = outcome
+
+    ranked = []
+    for rank, index in enumerate(_ranked(results), start=1):
+        ranked.append(dict(results[index], rank=rank))
+
+    return {
+        "role": result_shape.role(parsed_jd),
+        "screened": len(results),
+        "failed": len(errors),
+        "results": ranked,
+        "errors": [errors[index] for index in sorted(errors)],
+    }
+
+
+async def stream_batch_async(orchestrator, uploads: list[tuple[str, bytes]],
+                             jd_text: str, parsed_jd: dict,
+                             deadline: Deadline | None = None):
+    """`screen_batch_async` as events, each candidate sent the moment it is done.
+
+    Yields `{"type": "candidate", "index": i, "result": ...}` or
+    `{"type": "failed", "index": i, "filename": ..., "error": ...}` per upload,
+    in completion order, then one `{"type": "ranking", ...}`. Only each
+    candidate's score is kept for the ranking, so memory does not grow with the
+    results already sent.
+    """
+    scores: dict[int, dict] = {}
+    failed = 0
+    async for index, outcome in _screen_all(orchestrator, uploads, jd_text, parsed_jd,
+                                            deadline):
+        if "error" in outcome:
+            failed += 1
+            yield {"type": "failed", "index": index, **outcome}
+        else:
+            scores[index] = {"filename": outcome["filename"],
+                             "final_score": outcome["final_score"]}
+            yield {"type": "candidate", "index": index, "result": outcome}
+
+    yield {
+        "type": "ranking",
+        "role": result_shape.role(parsed_jd),
+        "screened": len(scores),
+        "failed": failed,
+        "ranking": [
+            {"rank": rank, "index": index, **scores[index]}
+            for rank, index in enumerate(_ranked(scores), start=1)
+        ],
+    }
+
+
+async def _screen_all(orchestrator, uploads: list[tuple[str, bytes]],
+                      jd_text: str, parsed_jd: dict, deadline: Deadline | None):
+    """(upload index, result or failure) for each upload, as each finishes."""
+    gate = asyncio.Semaphore(config.BATCH_CONCURRENCY)
+
+    async def screen_one(index: int, filename: str, data: bytes) -> tuple[int, dict]:
+        async with gate:
+            return index, await _screen_one(
+                orchestrator, filename, data, jd_text, parsed_jd, deadline
+            )
+
+    pending = [
+        asyncio.ensure_future(screen_one(index, filename, data))
+        for index, (filename, data) in enumerate(uploads)
+    ]
+    try:
+        for finished in asyncio.as_completed(pending):
+            yield await finished
+    finally:
+        # Stops the rest of the batch if the consumer gives up part way.
+        for task in pending:
+            task.cancel()
+
+
+async def _screen_one(orchestrator, filename: str, data: bytes,
+                      jd_text: str, parsed_jd: dict, deadline: Deadline | None) -> dict:
+    if len(data) > config.MAX_UPLOAD_BYTES:
+        return _failed(
+            filename,
+            f"The resume exceeds the {config.MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit.",
+        )
+    try:
+        resume = await extract_document_async(
+            data, filename, text_budget(orchestrator.llm.available)
+        )
+    except DocumentError as exc:
+        return _failed(filename, str(exc))
+
+    try:
+        result = await orchestrator.run_from_text_async(
+            resume["text"], jd_text, parsed_jd=parsed_jd, pages=resume["pages"],
+            deadline=deadline,
+        )
+    except Exception as exc:
+        # As for a single screening this is a genuine bug, but it is this
+        # candidate's bug: the other results still stand.
+        logger.exception("Screening failed for %s", filename)
+        return _failed(filename, f"Screening failed: {exc}")
+
+    return {"filename": filename, **result}
+
+
+def _ranked(by_index: dict[int, dict]) -> list[int]:
+    """Upload indices, best final_score first.
+
+    Abstentions report 0.0 and so sink below every scored candidate; ties keep
+    upload order.
+    """
+    return sorted(by_index, key=lambda i: (-by_index[i]["final_score"], i))
+
+
+def _failed(filename: str, error: str) -> dict:
+    return {"filename": filename, "error": error}
@@ -1,6 +1,7 @@
 """Runtime configuration, read once at import."""
 
 import os
+import tempfile
 
 
 def _flag(name: str, default: str = "true") -> bool:
@@ -10,14 +11,21 @@ def _flag(name: str, default: str = "true") -> bool:
 # Gemini is optional. Without a key the pipeline runs in deterministic mode.
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "").strip()
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "models/gemini-flash-lite-latest").strip()
+# Where the SDK sends requests; empty is Google's endpoint. Point it at
+# benchmarks/fake_gemini.py to load-test the LLM path without spending quota.
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "").strip()
 
 USE_LLM = _flag("USE_LLM") and bool(GEMINI_API_KEY)
 
-# "linear" runs all six agents in order. "graph" runs them through LangGraph
-# with conditional routing, so a vague role skips the matching agents entirely.
-# Linear is the default: langgraph pulls in a sizeable dependency tree, and
-# paying that import on every cold start is only worth it if you want the
-# routing.
+# Read the resume and the JD in one Gemini call instead of two side by side.
+# One round trip rather than two in flight: less spent per screening and less
+# quota, for a wall-clock that is about the same or a little shorter. Each half
+# still falls back to rules on its own. Unused when the JD is already parsed.
+LLM_COMBINED = _flag("LLM_COMBINED", "false")
+
+# "linear" runs all six agents in order. "graph" runs them as a graph (see
+# screening/dag.py) with conditional routing, so a vague role skips the
+# matching agents entirely; their trace steps come back marked "skipped".
 ORCHESTRATOR = os.getenv("ORCHESTRATOR", "linear").strip().lower()
 
 # Serverless functions bill by wall-clock, so the LLM gets a hard ceiling and a
@@ -25,9 +33,140 @@ ORCHESTRATOR = os.getenv("ORCHESTRATOR", "linear").strip().lower()
 LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "20"))
 LLM_RETRY_DELAY_SECONDS = float(os.getenv("LLM_RETRY_DELAY_SECONDS", "1.5"))
 
+# Every API request must be answered within SCREEN_DEADLINE_SECONDS, under
+# vercel.json's maxDuration of 60 with room to send the response. Gemini calls
+# wait only for what is left of it, and once less than LLM_MIN_BUDGET_SECONDS
+# remains a parser reads its document by rules instead of asking the model.
+# A batch shares one deadline, so its last resumes may be read by rules. 0 is
+# no deadline, for hosts without a time limit.
+SCREEN_DEADLINE_SECONDS = float(os.getenv("SCREEN_DEADLINE_SECONDS", "50"))
+LLM_MIN_BUDGET_SECONDS = float(os.getenv("LLM_MIN_BUDGET_SECONDS", "2"))
+
+# With a soft deadline set, each parser reads its document by rules while its
+# Gemini call is in flight, and uses Gemini's answer only if it arrives within
+# LLM_SOFT_DEADLINE_SECONDS of the call being sent. A later answer is still cached for next time. 0
+# waits for Gemini however long it takes, as far as the deadline allows.
+LLM_SOFT_DEADLINE_SECONDS = float(os.getenv("LLM_SOFT_DEADLINE_SECONDS", "0"))
+
+# Threads that may sit in a Gemini call at once. The async API path parks each
+# call on one of these, so this is how many LLM screenings a process keeps in
+# flight before the rest queue.
+LLM_WORKERS = int(os.getenv("LLM_WORKERS", "32"))
+
+# The linear orchestrator reads the JD on a worker thread while the resume is
+# read on the request's own. Each such parse may sit in a Gemini call, so the
+# pool is as large as LLM_WORKERS: a smaller one would queue a JD behind other
+# requests' calls and lose the overlap.
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(LLM_WORKERS)))
+
+# Gemini's quota, enforced on our side: requests started per minute (set it to
+# the key's RPM; 0 is unlimited) and requests in flight at once, across sync
+# and async callers. A request that cannot start within LLM_QUEUE_SECONDS is
+# refused and its agent falls back to rules, rather than sending a call the
+# quota would reject and then sleeping on the retry.
+LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "0"))
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "16"))
+LLM_QUEUE_SECONDS = float(os.getenv("LLM_QUEUE_SECONDS", "5"))
+
+# When half of the last LLM_BREAKER_WINDOW Gemini calls (and at least
+# LLM_BREAKER_MIN_CALLS) have failed or taken over LLM_BREAKER_SLOW_SECONDS,
+# screenings stop asking and run deterministically. After the cooldown one
+# request probes whether Gemini is back.
+LLM_BREAKER_WINDOW = int(os.getenv("LLM_BREAKER_WINDOW", "20"))
+LLM_BREAKER_MIN_CALLS = int(os.getenv("LLM_BREAKER_MIN_CALLS", "5"))
+LLM_BREAKER_FAILURE_RATIO = float(os.getenv("LLM_BREAKER_FAILURE_RATIO", "0.5"))
+LLM_BREAKER_SLOW_SECONDS = float(os.getenv("LLM_BREAKER_SLOW_SECONDS", "10"))
+LLM_BREAKER_COOLDOWN_SECONDS = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+
+# With LLM_HEDGE on, a Gemini call still running past the LLM_HEDGE_PERCENTILE
+# of recent call times is sent a second time, and the first answer back wins.
+# Hedges are capped at LLM_HEDGE_RATIO of calls, so the extra traffic is too.
+LLM_HEDGE = _flag("LLM_HEDGE", "false")
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+LLM_HEDGE_RATIO = float(os.getenv("LLM_HEDGE_RATIO", "0.1"))
+
+# Uploaded PDFs and DOCX files are read in this many worker processes, each
+# lent to one API thread at a time — so a batch's extraction uses the cores,
+# and a hostile file cannot stall or exhaust the server. A read that overruns
+# its deadline is killed and reported as unreadable. Set EXTRACT_ISOLATION=false
+# to read in-process instead, where spawning processes is not allowed.
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", str(min(os.cpu_count() or 1, 8))))
+EXTRACT_ISOLATION = _flag("EXTRACT_ISOLATION")
+EXTRACT_TIMEOUT_SECONDS = float(os.getenv("EXTRACT_TIMEOUT_SECONDS", "10"))
+# A worker is replaced after this many files, or once its peak RSS passes
+# EXTRACT_MAX_RSS_MB. EXTRACT_MEMORY_LIMIT_MB is a hard ceiling on its address
+# space: a file that needs more fails rather than taking the host with it.
+EXTRACT_MAX_JOBS = int(os.getenv("EXTRACT_MAX_JOBS", "200"))
+EXTRACT_MAX_RSS_MB = float(os.getenv("EXTRACT_MAX_RSS_MB", "256"))
+EXTRACT_MEMORY_LIMIT_MB = float(os.getenv("EXTRACT_MEMORY_LIMIT_MB", "1024"))
+
+# Expensive answers are cached under here: Gemini's validated extractions and
+# registered job descriptions. The default is the temp directory, the only
+# writable place on Vercel; point it at a persistent disk to keep them across
+# restarts.
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(tempfile.gettempdir(), "quorum"))
+
+# Keyed on model and prompt, so a JD screened against hundreds of resumes is
+# read by the model once.
+LLM_CACHE = _flag("LLM_CACHE")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(CACHE_DIR, "llm.sqlite3"))
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+# Job descriptions registered through /api/py/jd, parsed once and screened
+# against by id. Postings stay open for weeks, hence the longer default.
+JD_REGISTRY_PATH = os.getenv("JD_REGISTRY_PATH", os.path.join(CACHE_DIR, "jd.sqlite3"))
+JD_REGISTRY_TTL_SECONDS = float(os.getenv("JD_REGISTRY_TTL_SECONDS", str(30 * 24 * 3600)))
+JD_REGISTRY_MAX_ENTRIES = int(os.getenv("JD_REGISTRY_MAX_ENTRIES", "2000"))
+# A JD read by rules during a Gemini outage is kept in memory only, and only
+# this long, so the next screening against it once Gemini is back reads it
+# with the model.
+JD_REGISTRY_FALLBACK_TTL_SECONDS = float(os.getenv("JD_REGISTRY_FALLBACK_TTL_SECONDS", "300"))
+
+# Text extracted from uploads, keyed by a hash of the file's bytes. The same
+# resume is uploaded again for every role it is screened against, and reading
+# a PDF is most of what a deterministic screening costs. The most recent are
+# also kept in memory.
+TEXT_CACHE = _flag("TEXT_CACHE")
+TEXT_CACHE_PATH = os.getenv("TEXT_CACHE_PATH", os.path.join(CACHE_DIR, "text.sqlite3"))
+TEXT_CACHE_TTL_SECONDS = float(os.getenv("TEXT_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+TEXT_CACHE_MAX_ENTRIES = int(os.getenv("TEXT_CACHE_MAX_ENTRIES", "20000"))
+TEXT_CACHE_MEMORY_ENTRIES = int(os.getenv("TEXT_CACHE_MEMORY_ENTRIES", "256"))
+
+# /api/py/screen/batch: resumes per request, and how many of them are read and
+# screened at once. The JD is parsed once for the whole batch.
+MAX_BATCH_RESUMES = int(os.getenv("MAX_BATCH_RESUMES", "500"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "16"))
+
 MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(5 * 1024 * 1024)))
+# A whole batch request, zips included, and again its resumes once the zips are
+# unpacked. Each resume inside it is still held to MAX_UPLOAD_BYTES.
+MAX_BATCH_UPLOAD_BYTES = int(os.getenv("MAX_BATCH_UPLOAD_BYTES", str(100 * 1024 * 1024)))
 MAX_JD_CHARS = int(os.getenv("MAX_JD_CHARS", "40000"))
 
 # Only the text the model needs; resumes past this are almost always noise.
 MAX_RESUME_CHARS_FOR_LLM = int(os.getenv("MAX_RESUME_CHARS_FOR_LLM", "12000"))
 MAX_JD_CHARS_FOR_LLM = int(os.getenv("MAX_JD_CHARS_FOR_LLM", "8000"))
+
+# Resume extractions that arrive together on the async path — a batch, or a
+# busy minute — are packed into one Gemini request: up to LLM_PACK_RESUMES
+# resumes and LLM_PACK_CHARS of their text, gathered for up to
+# LLM_PACK_WAIT_MS. Short resumes pack more to a request than long ones. A
+# pack costs one round trip and one unit of request quota instead of one per
+# resume. 1 turns packing off.
+LLM_PACK_RESUMES = int(os.getenv("LLM_PACK_RESUMES", "1"))
+LLM_PACK_CHARS = int(os.getenv("LLM_PACK_CHARS", str(4 * MAX_RESUME_CHARS_FOR_LLM)))
+LLM_PACK_WAIT_MS = float(os.getenv("LLM_PACK_WAIT_MS", "25"))
+
+# A PDF is read page by page only until this much text is in hand; its
+# remaining pages are skipped without being parsed. The model never sees more
+# than MAX_RESUME_CHARS_FOR_LLM, so in LLM mode reading further is wasted work.
+# The rule-based parser uses everything it is given and so gets more. A
+# screening that falls back to rules mid-request keeps the text already read.
+# 0 reads every page.
+PDF_TEXT_BUDGET_LLM = int(os.getenv("PDF_TEXT_BUDGET_LLM", str(MAX_RESUME_CHARS_FOR_LLM)))
+PDF_TEXT_BUDGET = int(os.getenv("PDF_TEXT_BUDGET", "60000"))
+
+# Canonicalised skill names kept in memory. Each entry is two short strings, so
+# the default covers every term a busy container sees for a few pence of RAM.
+CANONICAL_CACHE_SIZE = int(os.getenv("CANONICAL_CACHE_SIZE", "4096"))
@@ -0,0 +1,228 @@
+"""A small in-process graph runtime: the part of LangGraph the panel uses.
+
+`GraphOrchestrator` needs nodes that read and update a shared state, edges
+that route on that state, branches that run side by side and meet again, and
+keys (the trace) that several nodes append to. LangGraph provides all of that,
+but importing it costs more than everything else in a cold start. This module
+provides just that much, behind the same builder calls (`add_node`,
+`add_edge`, `add_conditional_edges`, `compile`, `invoke`/`ainvoke`/`astream`),
+so one graph definition builds on either.
+
+Execution is in steps, as LangGraph's is. Every node triggered by the last step
+runs, side by side, against the same state. Their updates are merged when all
+of them are done: a key annotated `Annotated[T, reducer]` on the state's
+TypedDict is combined with `reducer(old, new)`; any other key is replaced, and
+two nodes writing it in the same step is an error, since neither write could
+be chosen over the other. Edges out of the finished nodes then trigger the next
+step. An edge from a list of nodes fires once all of them have finished.
+"""
+
+import asyncio
+import inspect
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, get_args, get_origin, get_type_hints
+
+START = "__start__"
+END = "__end__"
+
+# Steps a run may take before it is taken to be looping.
+MAX_STEPS = 25
+
+
+class GraphError(Exception):
+    """The graph is malformed, or a run of it went wrong."""
+
+
+class StateGraph:
+    def __init__(self, schema: type) -> None:
+        self.reducers = _reducers(schema)
+        self.nodes: dict[str, Callable] = {}
+        self.edges: list[tuple[str, str]] = []
+        self.joins: list[tuple[tuple[str, ...], str]] = []
+        self.branches: list[tuple[str, Callable, dict | None]] = []
+
+    def add_node(self, name: str, fn) -> None:
+        if name in self.nodes or name in (START, END):
+            raise GraphError(f"Node {name!r} is already defined")
+        self.nodes[name] = fn
+
+    def add_edge(self, source: str | list[str], target: str) -> None:
+        """`target` runs after `source`, or after every node in a list of them."""
+        if isinstance(source, str):
+            self.edges.append((source, target))
+        else:
+            self.joins.append((tuple(source), target))
+
+    def add_conditional_edges(self, source: str, router, path_map: dict | list | None = None) -> None:
+        """After `source`, `router(state)` names the next node, or a list of
+        nodes to run side by side; `path_map` translates its answers."""
+        if isinstance(path_map, list):
+            path_map = {name: name for name in path_map}
+        self.branches.append((source, router, path_map))
+
+    def set_entry_point(self, name: str) -> None:
+        self.add_edge(START, name)
+
+    def compile(self) -> "CompiledGraph":
+        known = set(self.nodes) | {START, END}
+        targets = [target for _, target in self.edges + self.joins]
+        targets += [t for _, _, path_map in self.branches if path_map for t in path_map.values()]
+        sources = [source for source, _ in self.edges]
+        sources += [s for sources_, _ in self.joins for s in sources_]
+        sources += [source for source, _, _ in self.branches]
+        for name in targets + sources:
+            if name not in known:
+                raise GraphError(f"Edge refers to unknown node {name!r}")
+        if not any(source == START for source in sources):
+            raise GraphError("The graph has no entry point")
+        return CompiledGraph(self)
+
+
+class CompiledGraph:
+    def __init__(self, graph: StateGraph) -> None:
+        self._nodes = dict(graph.nodes)
+        # Updates in a step are merged, and the next step listed, in the order
+        # the nodes were added, however the step's nodes finish.
+        self._run_order = {name: i for i, name in enumerate(graph.nodes)}
+        self._reducers = graph.reducers
+        self._edges: dict[str, list[str]] = {}
+        for source, target in graph.edges:
+            self._edges.setdefault(source, []).append(target)
+        self._joins = list(graph.joins)
+        self._branches: dict[str, list[tuple]] = {}
+        for source, router, path_map in graph.branches:
+            self._branches.setdefault(source, []).append((router, path_map))
+        # Side-by-side nodes under `invoke`; a single node runs on the caller's thread.
+        self._pool = ThreadPoolExecutor(thread_name_prefix="dag")
+
+    def invoke(self, state: dict) -> dict:
+        run = _Run(self, state)
+        while run.pending:
+            names = run.pending
+            if len(names) == 1:
+                updates = [self._call(names[0], run.state)]
+            else:
+                futures = [self._pool.submit(self._call, name, run.state) for name in names]
+                updates = [future.result() for future in futures]
+            run.advance(names, updates)
+        return run.state
+
+    async def ainvoke(self, state: dict) -> dict:
+        async for chunk in self.astream(state, stream_mode="values"):
+            state = chunk
+        return state
+
+    async def astream(self, state: dict, stream_mode: str | list[str] = "updates"):
+        """Yield ("updates", {node: update}) as each node finishes, and
+        ("values", state) after each step, for the modes asked for. With a
+        single mode, the chunks alone are yielded, as LangGraph does."""
+        modes = [stream_mode] if isinstance(stream_mode, str) else list(stream_mode)
+
+        def emit(mode: str, chunk):
+            return chunk if isinstance(stream_mode, str) else (mode, chunk)
+
+        run = _Run(self, state)
+        if "values" in modes:
+            yield emit("values", dict(run.state))
+        while run.pending:
+            names = run.pending
+
+            async def indexed(i: int, name: str) -> tuple:
+                return i, await self._acall(name, run.state)
+
+            tasks = [asyncio.ensure_future(indexed(i, name)) for i, name in enumerate(names)]
+            updates: list = [None] * len(names)
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    i, update = await finished
+                    updates[i] = update
+                    if "updates" in modes:
+                        yield emit("updates", {names[i]: update})
+            finally:
+                for task in tasks:
+                    task.cancel()
+            run.advance(names, updates)
+            if "values" in modes:
+                yield emit("values", dict(run.state))
+
+    def _call(self, name: str, state: dict):
+        fn = self._nodes[name]
+        if inspect.iscoroutinefunction(fn):
+            raise GraphError(f"Node {name!r} is async; run the graph with ainvoke")
+        return fn(state)
+
+    async def _acall(self, name: str, state: dict):
+        fn = self._nodes[name]
+        if inspect.iscoroutinefunction(fn):
+            return await fn(state)
+        # Synchronous nodes wait on the loop's executor, never on the loop.
+        return await asyncio.get_running_loop().run_in_executor(None, fn, state)
+
+
+class _Run:
+    """One pass through a compiled graph: the state, and what runs next."""
+
+    def __init__(self, graph: CompiledGraph, state: dict) -> None:
+        self.graph = graph
+        self.state = dict(state)
+        self.steps = 0
+        self._arrived: dict[int, set[str]] = {}
+        self.pending = self._after([START])
+
+    def advance(self, names: list[str], updates: list) -> None:
+        written: dict[str, str] = {}
+        for name, update in zip(names, updates):
+            if update is None:
+                continue
+            if not isinstance(update, dict):
+                raise GraphError(f"Node {name!r} returned {type(update).__name__}, not a dict")
+            for key, value in update.items():
+                reducer = self.graph._reducers.get(key)
+                if reducer is not None:
+                    self.state[key] = reducer(self.state[key], value) if key in self.state else value
+                    continue
+                if key in written:
+                    raise GraphError(
+                        f"Nodes {written[key]!r} and {name!r} both wrote {key!r} in one step"
+                    )
+                written[key] = name
+                self.state[key] = value
+
+        self.steps += 1
+        self.pending = self._after(names)
+        if self.pending and self.steps >= MAX_STEPS:
+            raise GraphError(f"The graph did not finish within {MAX_STEPS} steps")
+
+    def _after(self, finished: list[str]) -> list[str]:
+        """The nodes the finished ones trigger, each once, in definition order."""
+        triggered: set[str] = set()
+        for name in finished:
+            triggered.update(self.graph._edges.get(name, []))
+            for router, path_map in self.graph._branches.get(name, []):
+                answer = router(self.state)
+                for choice in answer if isinstance(answer, (list, tuple)) else [answer]:
+                    triggered.add(path_map.get(choice, choice) if path_map else choice)
+            for i, (sources, target) in enumerate(self.graph._joins):
+                if name in sources:
+                    arrived = self._arrived.setdefault(i, set())
+                    arrived.add(name)
+                    if arrived == set(sources):
+                        triggered.add(target)
+                        arrived.clear()
+        triggered.discard(END)
+        order = self.graph._run_order
+        for name in triggered - order.keys():
+            raise GraphError(f"A router chose {name!r}, which is not a node")
+        return sorted(triggered, key=order.__getitem__)
+
+
+def _reducers(schema: type) -> dict:
+    """Keys of a TypedDict annotated `Annotated[T, reducer]`, with their reducers."""
+    reducers = {}
+    for key, hint in get_type_hints(schema, include_extras=True).items():
+        if get_origin(hint) is Annotated:
+            functions = [m for m in get_args(hint)[1:] if callable(m)]
+            if functions:
+                reducers[key] = functions[-1]
+    return reducers
@@ -1,4 +1,4 @@
-"""LangGraph orchestrator — the same panel, with conditional routing.
+"""Graph orchestrator — the same panel, with conditional routing.
 
 Where `Orchestrator` runs all six agents in a line, this one branches: a job
 description too vague to match against skips SkillMatch and Experience
@@ -12,9 +12,13 @@ The branch is visible in the response — skipped agents appear in the trace wit
 Both orchestrators return the identical shape (see `screening.result`), so the
 front end neither knows nor cares which one ran.
 
-Select with ORCHESTRATOR=graph. The default is linear: langgraph imports a
-sizeable dependency tree, and paying that on every serverless cold start is
-only worth it if the routing is wanted.
+The graph runs on `screening.dag`, a small built-in runtime with LangGraph's
+builder calls; it was LangGraph until its import became most of a cold start.
+The two parsers run side by side and meet before the routing, as they do in
+the linear orchestrator. `_build` takes LangGraph's StateGraph as well, which
+is how `benchmarks.graph_runtime` compares the two.
+
+Select with ORCHESTRATOR=graph.
 """
 
 import logging
@@ -22,8 +26,7 @@ import operator
 import time
 from typing import Annotated, Literal, TypedDict
 
-from langgraph.graph import END, StateGraph
-
+from screening import config
 from screening import result as result_shape
 from screening.agents.decision_agent import DecisionAgent
 from screening.agents.experience_agent import ExperienceAgent
@@ -31,7 +34,9 @@ from screening.agents.explanation_agent import ExplanationAgent
 from screening.agents.jd_parser import JDParserAgent
 from screening.agents.resume_parser import ResumeParserAgent
 from screening.agents.skill_match_agent import SkillMatchAgent
-from screening.services.documents import extract_text_from_path
+from screening.dag import END, START, StateGraph
+from screening.services.deadline import Deadline
+from screening.services.documents import extract_document_from_path, text_budget
 from screening.services.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
@@ -40,6 +45,10 @@ logger = logging.getLogger(__name__)
 class ScreeningState(TypedDict, total=False):
     resume_text: str
     jd_text: str
+    # Pages read and skipped in the source PDF, when there was one.
+    pages: dict | None
+    # The time the request has left, if it has a limit.
+    deadline: Deadline | None
     resume_data: dict
     jd_data: dict
     skill_result: dict
@@ -50,26 +59,51 @@ class ScreeningState(TypedDict, total=False):
     trace: Annotated[list[dict], operator.add]
 
 
-def _step(agent: str, description: str, started: float,
+def _step(agent: str, description: str, started: float, state: ScreeningState,
           output: dict | None = None, status: str = "ok") -> dict:
-    return {
+    return _budgeted({
         "agent": agent,
         "description": description,
         "duration_ms": round((time.perf_counter() - started) * 1000),
         "source": (output or {}).get("source"),
         "note": (output or {}).get("note"),
         "status": status,
-    }
+    }, state)
 
 
-def _skipped(agent: str, description: str, why: str) -> dict:
-    return {
+def _skipped(agent: str, description: str, why: str, state: ScreeningState) -> dict:
+    return _budgeted({
         "agent": agent,
         "description": description,
         "duration_ms": 0,
         "source": None,
         "note": why,
         "status": "skipped",
+    }, state)
+
+
+def _budgeted(entry: dict, state: ScreeningState) -> dict:
+    """The step's share of the request's deadline, when it has one."""
+    deadline = state.get("deadline")
+    if deadline is not None:
+        entry["budget"] = deadline.spent(entry["duration_ms"])
+    return entry
+
+
+def _resume_parsed(data: dict, started: float, state: ScreeningState) -> ScreeningState:
+    step = _step("ResumeParser",
+                 "Read the resume into structured skills and experience",
+                 started, state, data)
+    step["pages"] = state.get("pages")
+    return {"resume_data": data, "trace": [step]}
+
+
+def _jd_parsed(data: dict, started: float, state: ScreeningState) -> ScreeningState:
+    return {
+        "jd_data": data,
+        "trace": [_step("JDParser",
+                        "Read the role's requirements and experience band",
+                        started, state, data)],
     }
 
 
@@ -83,28 +117,65 @@ class GraphOrchestrator:
         self.decision_agent = DecisionAgent()
         self.explanation_agent = ExplanationAgent()
         self.graph = self._build()
+        # The same graph with coroutine parsers, for `ainvoke` and `astream`.
+        self.async_graph = self._build(asynchronous=True)
 
     # ── nodes ─────────────────────────────────────────────────────────
 
     def _parse_resume(self, state: ScreeningState) -> ScreeningState:
         started = time.perf_counter()
-        data = self.resume_agent.parse(state["resume_text"])
-        return {
-            "resume_data": data,
-            "trace": [_step("ResumeParser",
-                            "Read the resume into structured skills and experience",
-                            started, data)],
-        }
+        data = self.resume_agent.parse(state["resume_text"], state.get("deadline"))
+        return _resume_parsed(data, started, state)
+
+    async def _parse_resume_async(self, state: ScreeningState) -> ScreeningState:
+        started = time.perf_counter()
+        data = await self.resume_agent.parse_async(state["resume_text"], state.get("deadline"))
+        return _resume_parsed(data, started, state)
 
     def _parse_jd(self, state: ScreeningState) -> ScreeningState:
         started = time.perf_counter()
-        data = self.jd_agent.parse(state["jd_text"])
-        return {
-            "jd_data": data,
-            "trace": [_step("JDParser",
-                            "Read the role's requirements and experience band",
-                            started, data)],
-        }
+        # A registered JD arrives already parsed.
+        data = state.get("jd_data") or self.jd_agent.parse(
+            state["jd_text"], state.get("deadline")
+        )
+        return _jd_parsed(data, started, state)
+
+    async def _parse_jd_async(self, state: ScreeningState) -> ScreeningState:
+        started = time.perf_counter()
+        data = state.get("jd_data") or await self.jd_agent.parse_async(
+            state["jd_text"], state.get("deadline")
+        )
+        return _jd_parsed(data, started, state)
+
+    def _parse_both(self, state: ScreeningState) -> ScreeningState:
+        """Both parsers from one Gemini call (LLM_COMBINED). The call was
+        shared, so each step carries its full duration."""
+        started = time.perf_counter()
+        answers = self.llm.extract_both(
+            state["resume_text"], state["jd_text"], state.get("deadline")
+        )
+        return self._both_parsed(answers, started, state)
+
+    async def _parse_both_async(self, state: ScreeningState) -> ScreeningState:
+        started = time.perf_counter()
+        answers = await self.llm.extract_both_async(
+            state["resume_text"], state["jd_text"], state.get("deadline")
+        )
+        return self._both_parsed(answers, started, state)
+
+    def _both_parsed(self, answers: tuple, started: float,
+                     state: ScreeningState) -> ScreeningState:
+        resume_answer, jd_answer = answers
+        resume_data = self.resume_agent.parse_answer(state["resume_text"], resume_answer)
+        jd_data = self.jd_agent.parse_answer(state["jd_text"], jd_answer)
+        resume = _resume_parsed(resume_data, started, state)
+        jd = _jd_parsed(jd_data, started, state)
+        return {**resume, **jd, "trace": resume["trace"] + jd["trace"]}
+
+    @staticmethod
+    def _parsed(state: ScreeningState) -> ScreeningState:
+        """Where the parsers meet: the routing needs both of their outputs."""
+        return {}
 
     def _match_skills(self, state: ScreeningState) -> ScreeningState:
         started = time.perf_counter()
@@ -113,7 +184,7 @@ class GraphOrchestrator:
             "skill_result": data,
             "trace": [_step("SkillMatch",
                             "Compared the candidate's skills against the requirements",
-                            started)],
+                            started, state)],
         }
 
     def _evaluate_experience(self, state: ScreeningState) -> ScreeningState:
@@ -123,7 +194,7 @@ class GraphOrchestrator:
             "experience_result": data,
             "trace": [_step("Experience",
                             "Weighed years of experience against the role's band",
-                            started)],
+                            started, state)],
         }
 
     def _skip_matching(self, state: ScreeningState) -> ScreeningState:
@@ -132,9 +203,11 @@ class GraphOrchestrator:
         return {
             "trace": [
                 _skipped("SkillMatch",
-                         "Compared the candidate's skills against the requirements", why),
+                         "Compared the candidate's skills against the requirements",
+                         why, state),
                 _skipped("Experience",
-                         "Weighed years of experience against the role's band", why),
+                         "Weighed years of experience against the role's band",
+                         why, state),
             ],
         }
 
@@ -152,7 +225,8 @@ class GraphOrchestrator:
         return {
             "decision_result": data,
             "trace": [_step("Decision",
-                            "Combined the signals into a recommendation", started)],
+                            "Combined the signals into a recommendation",
+                            started, state)],
         }
 
     def _explain(self, state: ScreeningState) -> ScreeningState:
@@ -167,11 +241,17 @@ class GraphOrchestrator:
         return {
             "explanation": text,
             "trace": [_step("Explanation",
-                            "Wrote the rationale for the decision", started)],
+                            "Wrote the rationale for the decision",
+                            started, state)],
         }
 
     # ── routing ───────────────────────────────────────────────────────
 
+    def _route_parsing(self, state: ScreeningState) -> list[str] | Literal["parse_both"]:
+        if config.LLM_COMBINED and not state.get("jd_data") and self.llm.available:
+            return "parse_both"
+        return ["parse_resume", "parse_jd"]
+
     @staticmethod
     def _route_after_jd(state: ScreeningState) -> Literal["match_skills", "skip_matching"]:
         jd_data = state.get("jd_data", {})
@@ -179,22 +259,39 @@ class GraphOrchestrator:
             return "skip_matching"
         return "match_skills"
 
-    def _build(self):
-        workflow = StateGraph(ScreeningState)
-
-        workflow.add_node("parse_resume", self._parse_resume)
-        workflow.add_node("parse_jd", self._parse_jd)
+    def _build(self, graph_type=StateGraph, asynchronous: bool = False):
+        """The panel as a graph, on `graph_type`: this package's StateGraph, or
+        LangGraph's, which has the same builder calls.
+
+        `asynchronous` builds it for `ainvoke`/`astream`, with parsers that
+        await Gemini on the event loop — through the LLM service's own pool,
+        packing and soft deadline — instead of blocking a thread of the loop's
+        default executor for the length of the call.
+        """
+        workflow = graph_type(ScreeningState)
+
+        if asynchronous:
+            parsers = self._parse_resume_async, self._parse_jd_async, self._parse_both_async
+        else:
+            parsers = self._parse_resume, self._parse_jd, self._parse_both
+        for name, node in zip(("parse_resume", "parse_jd", "parse_both"), parsers):
+            workflow.add_node(name, node)
+        workflow.add_node("parsed", self._parsed)
         workflow.add_node("match_skills", self._match_skills)
         workflow.add_node("evaluate_experience", self._evaluate_experience)
         workflow.add_node("skip_matching", self._skip_matching)
         workflow.add_node("make_decision", self._decide)
         workflow.add_node("explain", self._explain)
 
-        workflow.set_entry_point("parse_resume")
-        workflow.add_edge("parse_resume", "parse_jd")
+        # The parsers side by side, or one combined call, then both meet.
+        workflow.add_conditional_edges(
+            START, self._route_parsing, ["parse_resume", "parse_jd", "parse_both"]
+        )
+        workflow.add_edge(["parse_resume", "parse_jd"], "parsed")
+        workflow.add_edge("parse_both", "parsed")
 
         workflow.add_conditional_edges(
-            "parse_jd",
+            "parsed",
             self._route_after_jd,
             {"match_skills": "match_skills", "skip_matching": "skip_matching"},
         )
@@ -209,9 +306,46 @@ class GraphOrchestrator:
 
     # ── entry points ──────────────────────────────────────────────────
 
-    def run_from_text(self, resume_text: str, jd_text: str) -> dict:
-        final = self.graph.invoke({"resume_text": resume_text, "jd_text": jd_text})
+    def run_from_text(self, resume_text: str, jd_text: str,
+                      parsed_jd: dict | None = None, pages: dict | None = None,
+                      deadline: Deadline | None = None) -> dict:
+        return self._shape(
+            self.graph.invoke(_initial(resume_text, jd_text, parsed_jd, pages, deadline))
+        )
+
+    async def run_from_text_async(self, resume_text: str, jd_text: str,
+                                  parsed_jd: dict | None = None,
+                                  pages: dict | None = None,
+                                  deadline: Deadline | None = None) -> dict:
+        """`run_from_text` for the API's event loop.
+
+        The parsers await their Gemini calls, as the linear route's do; the
+        other nodes are quick and run on the loop's executor.
+        """
+        return self._shape(
+            await self.async_graph.ainvoke(_initial(resume_text, jd_text, parsed_jd, pages, deadline))
+        )
+
+    async def stream_from_text(self, resume_text: str, jd_text: str,
+                               parsed_jd: dict | None = None, pages: dict | None = None,
+                               deadline: Deadline | None = None):
+        """The same events as `Orchestrator.stream_from_text`, one per node's
+        trace entry as the node completes — skipped agents included."""
+        final: ScreeningState = {}
+        async for mode, chunk in self.async_graph.astream(
+            _initial(resume_text, jd_text, parsed_jd, pages, deadline),
+            stream_mode=["updates", "values"],
+        ):
+            if mode == "values":
+                final = chunk
+                continue
+            for update in chunk.values():
+                for entry in (update or {}).get("trace", []):
+                    yield {"type": "step", "step": dict(entry)}
+        yield {"type": "result", "result": self._shape(final)}
 
+    @staticmethod
+    def _shape(final: ScreeningState) -> dict:
         return result_shape.shape(
             final["resume_data"],
             final["jd_data"],
@@ -224,9 +358,19 @@ class GraphOrchestrator:
 
     def run(self, resume_path: str, jd_path: str) -> dict:
         """Path-based entry point, for parity with Orchestrator."""
-        resume_text = extract_text_from_path(resume_path)
+        resume = extract_document_from_path(resume_path, text_budget(self.llm.available))
         with open(jd_path, "r", encoding="utf-8") as f:
-            return self.run_from_text(resume_text, f.read())
+            return self.run_from_text(resume["text"], f.read(), pages=resume["pages"])
+
+
+def _initial(resume_text: str, jd_text: str, parsed_jd: dict | None,
+             pages: dict | None, deadline: Deadline | None = None) -> ScreeningState:
+    state: ScreeningState = {
+        "resume_text": resume_text, "jd_text": jd_text, "pages": pages, "deadline": deadline,
+    }
+    if parsed_jd is not None:
+        state["jd_data"] = dict(parsed_jd)
+    return state
 
 
 _PANEL_ORDER = [
@@ -4,8 +4,11 @@ The default. `GraphOrchestrator` is the same panel with conditional routing —
 see ORCHESTRATOR in screening/config.py.
 """
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 
+from screening import config
 from screening import result as result_shape
 from screening.agents.decision_agent import DecisionAgent
 from screening.agents.experience_agent import ExperienceAgent
@@ -13,7 +16,8 @@ from screening.agents.explanation_agent import ExplanationAgent
 from screening.agents.jd_parser import JDParserAgent
 from screening.agents.resume_parser import ResumeParserAgent
 from screening.agents.skill_match_agent import SkillMatchAgent
-from screening.services.documents import extract_text_from_path
+from screening.services.deadline import Deadline
+from screening.services.documents import extract_document_from_path, text_budget
 from screening.services.llm_service import LLMService
 
 
@@ -28,31 +32,138 @@ class Orchestrator:
         self.experience_agent = ExperienceAgent()
         self.decision_agent = DecisionAgent()
         self.explanation_agent = ExplanationAgent()
+        # The two parsers are independent, and in LLM mode each is a full
+        # Gemini round trip, so the JD is read here while the calling thread
+        # reads the resume. Shared across requests, and sized like the Gemini
+        # pool (PARSE_WORKERS), so no JD waits on another request's call.
+        self._parse_pool = ThreadPoolExecutor(
+            max_workers=config.PARSE_WORKERS, thread_name_prefix="jd-parse"
+        )
 
-    def run_from_text(self, resume_text: str, jd_text: str) -> dict:
-        trace: list[dict] = []
+    def run_from_text(self, resume_text: str, jd_text: str,
+                      parsed_jd: dict | None = None, pages: dict | None = None,
+                      deadline: Deadline | None = None) -> dict:
+        """Screen a resume against a JD.
 
-        def step(name: str, description: str, fn):
-            started = time.perf_counter()
-            output = fn()
-            trace.append({
-                "agent": name,
-                "description": description,
-                "duration_ms": round((time.perf_counter() - started) * 1000),
-                "source": output.get("source") if isinstance(output, dict) else None,
-                "note": output.get("note") if isinstance(output, dict) else None,
-                "status": "ok",
-            })
-            return output
+        `parsed_jd` is a JD parsed earlier (see `screening.services.jd_registry`);
+        when given, the JD is not read again. `pages` is what extraction read
+        of the resume's PDF, reported on its trace step. `deadline` is the time
+        the request has left: the parsers' Gemini calls are held to it, and
+        each trace step reports its share under "budget".
+        """
+        stage_started = time.perf_counter()
+        if self._combined(parsed_jd):
+            answers = self.llm.extract_both(resume_text, jd_text, deadline)
+            (resume_data, resume_step), (jd_data, jd_step) = self._adopt(
+                stage_started, resume_text, jd_text, pages, answers, deadline
+            )
+        else:
+            jd_future = self._parse_pool.submit(
+                _timed, "JDParser", _READ_JD,
+                (lambda: dict(parsed_jd)) if parsed_jd is not None
+                else (lambda: self.jd_agent.parse(jd_text, deadline)),
+                deadline,
+            )
+            resume_data, resume_step = _timed(
+                "ResumeParser", _READ_RESUME,
+                lambda: self.resume_agent.parse(resume_text, deadline), deadline,
+                pages=pages,
+            )
+            jd_data, jd_step = jd_future.result()
+
+        return self._assess(
+            resume_data, jd_data, _parse_stage(stage_started, resume_step, jd_step), deadline
+        )
+
+    async def run_from_text_async(self, resume_text: str, jd_text: str,
+                                  parsed_jd: dict | None = None,
+                                  pages: dict | None = None,
+                                  deadline: Deadline | None = None) -> dict:
+        """`run_from_text` for the API's event loop.
+
+        The parsers await their Gemini calls rather than block on them, so a
+        single worker can hold many screenings in flight at once.
+        """
+        async for event in self.stream_from_text(resume_text, jd_text, parsed_jd, pages,
+                                                 deadline):
+            if event["type"] == "result":
+                return event["result"]
+
+    async def stream_from_text(self, resume_text: str, jd_text: str,
+                               parsed_jd: dict | None = None, pages: dict | None = None,
+                               deadline: Deadline | None = None):
+        """The async screening as events, for a client that wants progress.
 
-        resume_data = step(
-            "ResumeParser", "Read the resume into structured skills and experience",
-            lambda: self.resume_agent.parse(resume_text),
+        Yields `{"type": "step", "step": ...}` as each parser finishes —
+        whichever is first, since they run side by side — then the rest of the
+        panel's steps, which take milliseconds between them, and finally
+        `{"type": "result", "result": ...}`. Streamed steps carry no stage_ms;
+        it is only known once both parsers are done, and is in the result.
+        """
+        stage_started = time.perf_counter()
+        if self._combined(parsed_jd):
+            answers = await self.llm.extract_both_async(resume_text, jd_text, deadline)
+            resume, jd = self._adopt(stage_started, resume_text, jd_text, pages, answers,
+                                     deadline)
+            for _, entry in (resume, jd):
+                yield _step_event(entry)
+        else:
+            resume_parse = asyncio.ensure_future(_timed_async(
+                "ResumeParser", _READ_RESUME,
+                self.resume_agent.parse_async(resume_text, deadline), deadline,
+                pages=pages,
+            ))
+            jd_parse = asyncio.ensure_future(_timed_async(
+                "JDParser", _READ_JD,
+                _already(dict(parsed_jd)) if parsed_jd is not None
+                else self.jd_agent.parse_async(jd_text, deadline),
+                deadline,
+            ))
+            try:
+                for finished in asyncio.as_completed((resume_parse, jd_parse)):
+                    _, entry = await finished
+                    yield _step_event(entry)
+            finally:
+                # A client that hangs up mid-stream leaves nothing running.
+                resume_parse.cancel()
+                jd_parse.cancel()
+            resume, jd = resume_parse.result(), jd_parse.result()
+
+        (resume_data, resume_step), (jd_data, jd_step) = resume, jd
+        result = self._assess(
+            resume_data, jd_data, _parse_stage(stage_started, resume_step, jd_step), deadline
         )
-        jd_data = step(
-            "JDParser", "Read the role's requirements and experience band",
-            lambda: self.jd_agent.parse(jd_text),
+        for entry in result["trace"][2:]:
+            yield _step_event(entry)
+        yield {"type": "result", "result": result}
+
+    def _combined(self, parsed_jd: dict | None) -> bool:
+        """Whether both documents go to Gemini in one call (see LLM_COMBINED)."""
+        return config.LLM_COMBINED and parsed_jd is None and self.llm.available
+
+    def _adopt(self, started: float, resume_text: str, jd_text: str,
+               pages: dict | None, answers: tuple, deadline: Deadline | None) -> tuple:
+        """Both parsers' outputs and trace steps from one combined answer.
+        The call was shared, so each step carries its full duration."""
+        resume_answer, jd_answer = answers
+        resume_data = self.resume_agent.parse_answer(resume_text, resume_answer)
+        jd_data = self.jd_agent.parse_answer(jd_text, jd_answer)
+        return (
+            (resume_data, {**_entry("ResumeParser", _READ_RESUME, started, resume_data,
+                                    deadline),
+                           "pages": pages}),
+            (jd_data, _entry("JDParser", _READ_JD, started, jd_data, deadline)),
         )
+
+    def _assess(self, resume_data: dict, jd_data: dict, trace: list[dict],
+                deadline: Deadline | None = None) -> dict:
+        """Everything after parsing: in-memory and quick, so it runs inline."""
+
+        def step(name: str, description: str, fn):
+            output, entry = _timed(name, description, fn, deadline)
+            trace.append(entry)
+            return output
+
         skill_result = step(
             "SkillMatch", "Compared the candidate's skills against the requirements",
             lambda: self.skill_agent.evaluate(resume_data, jd_data),
@@ -81,6 +192,59 @@ class Orchestrator:
 
     def run(self, resume_path: str, jd_path: str) -> dict:
         """Path-based entry point, kept for the local test suite."""
-        resume_text = extract_text_from_path(resume_path)
+        resume = extract_document_from_path(resume_path, text_budget(self.llm.available))
         with open(jd_path, "r", encoding="utf-8") as f:
-            return self.run_from_text(resume_text, f.read())
+            return self.run_from_text(resume["text"], f.read(), pages=resume["pages"])
+
+
+_READ_RESUME = "Read the resume into structured skills and experience"
+_READ_JD = "Read the role's requirements and experience band"
+
+
+def _entry(name: str, description: str, started: float, output,
+           deadline: Deadline | None = None) -> dict:
+    entry = {
+        "agent": name,
+        "description": description,
+        "duration_ms": round((time.perf_counter() - started) * 1000),
+        "source": output.get("source") if isinstance(output, dict) else None,
+        "note": output.get("note") if isinstance(output, dict) else None,
+        "status": "ok",
+    }
+    if deadline is not None:
+        entry["budget"] = deadline.spent(entry["duration_ms"])
+    return entry
+
+
+def _timed(name: str, description: str, fn, deadline: Deadline | None = None,
+           **extra) -> tuple:
+    started = time.perf_counter()
+    output = fn()
+    return output, {**_entry(name, description, started, output, deadline), **extra}
+
+
+async def _timed_async(name: str, description: str, awaitable,
+                       deadline: Deadline | None = None, **extra) -> tuple:
+    started = time.perf_counter()
+    output = await awaitable
+    return output, {**_entry(name, description, started, output, deadline), **extra}
+
+
+def _step_event(entry: dict) -> dict:
+    return {"type": "step", "step": dict(entry)}
+
+
+async def _already(value):
+    return value
+
+
+def _parse_stage(started: float, resume_step: dict, jd_step: dict) -> list[dict]:
+    """The trace so far: both parsers, in panel order.
+
+    Each keeps its own duration; stage_ms is the wall-clock the pair actually
+    cost, which is what running them side by side saves against.
+    """
+    stage_ms = round((time.perf_counter() - started) * 1000)
+    for entry in (resume_step, jd_step):
+        entry["stage_ms"] = stage_ms
+    return [resume_step, jd_step]
@@ -50,13 +50,18 @@ def shape(resume_data: dict, jd_data: dict, skill_result: dict,
             "projects": resume_data.get("projects", []),
             "source": resume_data["source"],
         },
-        "role": {
-            "required_skills": jd_data["required_skills"],
-            "experience_required": jd_data["experience_required"],
-            "clarity": jd_data["jd_clarity"],
-            "source": jd_data["source"],
-        },
+        "role": role(jd_data),
         "skill_match": skill_result,
         "experience": experience_result,
         "trace": trace,
     }
+
+
+def role(jd_data: dict) -> dict:
+    """The parsed JD as the interface shows it; also what /api/py/jd returns."""
+    return {
+        "required_skills": jd_data["required_skills"],
+        "experience_required": jd_data["experience_required"],
+        "clarity": jd_data["jd_clarity"],
+        "source": jd_data["source"],
+    }
@@ -0,0 +1,124 @@
+"""A circuit breaker for a dependency that fails in spells.
+
+When Gemini is down or out of quota, every call still costs a round trip, a
+retry sleep and a second round trip before its agent falls back — the fallback
+everyone ends up with, delivered at timeout latency. The breaker watches the
+most recent calls; once enough of them have failed, or been too slow to be
+worth waiting for, it opens and callers skip the model outright. After a
+cooldown it lets a single probe through: success closes it again, failure
+restarts the cooldown. Only the probe's own outcome counts then — `allow` hands
+each call a ticket to report back with — and a probe that never reports is
+given up on after `probe_seconds`, so one hung request cannot hold the breaker
+half-open.
+"""
+
+import threading
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    """The breaker is open: the call was not made."""
+
+
+class Ticket:
+    """What `allow` admitted a call with; hand it back to `record`."""
+
+    __slots__ = ("probe", "started")
+
+    def __init__(self, probe: bool, started: float) -> None:
+        self.probe = probe
+        self.started = started
+
+
+class CircuitBreaker:
+    def __init__(self, window: int, min_calls: int, failure_ratio: float,
+                 slow_seconds: float, cooldown_seconds: float,
+                 probe_seconds: float | None = None, clock=time.monotonic) -> None:
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.slow_seconds = slow_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_seconds = probe_seconds
+        self._clock = clock
+        # True for each recent call that failed or overran slow_seconds.
+        self._recent: deque[bool] = deque(maxlen=window)
+        self._opened_at: float | None = None
+        self._probe: Ticket | None = None
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def allow(self) -> Ticket | None:
+        """A ticket for a call that may go ahead now, or None. In half-open,
+        only the one probe may, unless the last has been out past
+        `probe_seconds`."""
+        with self._lock:
+            state = self._state()
+            now = self._clock()
+            if state == CLOSED:
+                return Ticket(False, now)
+            if state == HALF_OPEN and (
+                self._probe is None
+                or self.probe_seconds is not None
+                and now - self._probe.started >= self.probe_seconds
+            ):
+                self._probe = Ticket(True, now)
+                return self._probe
+            return None
+
+    def record(self, ticket: Ticket, ok: bool, seconds: float) -> None:
+        """The outcome of a call `allow` let through with `ticket`."""
+        bad = not ok or seconds > self.slow_seconds
+        with self._lock:
+            if ticket.probe:
+                if ticket is not self._probe:
+                    return  # given up on; a later probe decides
+                self._probe = None
+                if bad:
+                    self._opened_at = self._clock()
+                else:
+                    self._opened_at = None
+                    self._recent.clear()
+                return
+            if self._opened_at is not None:
+                return  # admitted before it opened; only the probe counts now
+
+            self._recent.append(bad)
+            if (len(self._recent) >= self.min_calls
+                    and sum(self._recent) / len(self._recent) >= self.failure_ratio):
+                self._opened_at = self._clock()
+                self.opened += 1
+
+    def describe(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "Gemini is responding"
+            wait = self._opened_at + self.cooldown_seconds - self._clock()
+            if wait > 0:
+                return f"Gemini is failing; skipped for another {wait:.0f}s"
+            return "Gemini is failing; a probe request is checking for recovery"
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self._state(),
+                "recent_calls": len(self._recent),
+                "failure_rate": round(sum(self._recent) / len(self._recent), 2) if self._recent else 0.0,
+                "opened": self.opened,
+            }
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return CLOSED
+        if self._clock() - self._opened_at >= self.cooldown_seconds:
+            return HALF_OPEN
+        return OPEN
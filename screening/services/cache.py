@@ -0,0 +1,161 @@
+"""A small persistent key-value cache: SQLite on disk, an LRU in front.
+
+Used wherever the same expensive answer is asked for again: Gemini's
+extractions, and parsed job descriptions. Values are strings (callers store
+JSON). Entries expire after a TTL, and past `max_entries` the least recently
+used go first. A hit does not write: the time it was used is noted and saved
+with the next write, which is the only time eviction needs it.
+
+SQLite because it is in the standard library, survives a restart when the file
+sits on a persistent disk, and is safe to share between uvicorn workers. Like
+`LLMService`, it cannot take the process down: if the file cannot be opened the
+disk layer disables itself and the cache carries on in memory, or not at all.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key     TEXT PRIMARY KEY,
+    value   TEXT NOT NULL,
+    created REAL NOT NULL,
+    used    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+"""
+
+
+class DiskCache:
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int,
+                 memory_entries: int = 0) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        # Shared by worker threads: the connection and the LRU both go
+        # through the lock.
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._touched: dict[str, float] = {}  # disk hits not yet saved as `used`
+        self._db: sqlite3.Connection | None = None
+        self._error: str | None = None
+
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            self._db = db
+        except (OSError, sqlite3.Error) as exc:
+            self._error = f"{path}: {exc}"
+            logger.warning("Disk cache unavailable, memory only — %s", self._error)
+
+    @property
+    def enabled(self) -> bool:
+        return self._db is not None
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            value = self._from_memory(key, now)
+            if value is None:
+                entry = self._from_disk(key, now)
+                if entry is not None:
+                    self._remember(key, *entry)  # expiring when it would on disk
+                    value = entry[1]
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: str, value: str, persist: bool = True,
+            ttl_seconds: float | None = None) -> None:
+        """Store `value`. With persist=False it is kept in memory only, and
+        `ttl_seconds` may hold it for less than the cache's TTL."""
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        with self._lock:
+            self._remember(key, now + ttl, value)
+            if persist:
+                self._to_disk(key, now, value)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "error": self._error,
+        }
+
+    # ── layers, called under the lock ─────────────────────────────────
+
+    def _from_memory(self, key: str, now: float) -> str | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if now > entry[0]:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return entry[1]
+
+    def _remember(self, key: str, expires: float, value: str) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = (expires, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _from_disk(self, key: str, now: float) -> tuple[float, str] | None:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT value, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_seconds:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._touched[key] = now
+            return row[1] + self.ttl_seconds, row[0]
+        except sqlite3.Error as exc:
+            logger.warning("Disk cache read failed: %s", exc)
+            return None
+
+    def _to_disk(self, key: str, now: float, value: str) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.executemany(
+                "UPDATE entries SET used = ? WHERE key = ?",
+                [(used, touched) for touched, used in self._touched.items()],
+            )
+            self._touched.clear()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created, used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            # Least recently used beyond the bound go first.
+            self._db.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Disk cache write failed: %s", exc)
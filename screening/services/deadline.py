@@ -0,0 +1,37 @@
+"""The time a request has left.
+
+A serverless invocation is killed at its platform's limit (Vercel's maxDuration)
+whatever it is doing, so a screening that spends too long on Gemini does not
+degrade, it fails. A `Deadline` is made when the request arrives and handed
+down to every agent and Gemini call, so each waits only for what is left, a
+retry that could not finish in time is not started, and a parser with too
+little time to ask the model reads the document by rules straight away.
+
+Every component takes the deadline as optional; without one they keep their
+own ceilings (LLM_TIMEOUT_SECONDS and the like), as the tests and CLI do.
+"""
+
+import time
+
+
+class Deadline:
+    def __init__(self, seconds: float, clock=time.monotonic) -> None:
+        self.seconds = seconds
+        self._clock = clock
+        self._ends = clock() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self._ends - self._clock())
+
+    def allows(self, seconds: float) -> bool:
+        """Whether `seconds` of work can still finish in time."""
+        return self.remaining() >= seconds
+
+    def spent(self, duration_ms: int) -> dict:
+        """A trace step's share of the budget: what it used and what it left."""
+        return {"used_ms": duration_ms, "left_ms": round(self.remaining() * 1000)}
+
+
+def within(deadline: Deadline | None, seconds: float) -> float:
+    """`seconds`, or less if that is all the deadline has left."""
+    return seconds if deadline is None else min(seconds, deadline.remaining())
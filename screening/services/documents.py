@@ -4,35 +4,143 @@ PDF goes through pypdf rather than pdfplumber: it is pure Python and far
 smaller once installed, which keeps the serverless bundle under Vercel's limit
 and the cold start short. Resumes are text-based PDFs, so the layout analysis
 pdfplumber adds buys nothing here.
+
+A PDF is read only as far as the screening needs: pages are parsed until a
+text budget is met (see PDF_TEXT_BUDGET), and the ones after it are skipped.
+
+DOCX is read the same way, for the same reason: straight from the package's
+XML with the standard library's incremental parser, rather than through
+python-docx and lxml. The text comes out exactly as python-docx would give it,
+which remains the fallback for a package laid out unusually.
+
+The parsing itself runs in a worker process (see `screening.services.workers`
+and EXTRACT_*), under a deadline and a memory ceiling, so a pathological file
+costs one killed worker rather than a stalled server.
+
+What a PDF or DOCX yields — its text, or the reason it has none — is cached by
+a hash of the file's bytes (see TEXT_CACHE), so a resume screened against a
+second role is not read a second time.
 """
 
+import asyncio
+import hashlib
 import io
+import json
+import logging
 import os
+import posixpath
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
 
+import pypdf
 from pypdf import PdfReader
 
+from screening import config
+from screening.services.cache import DiskCache
+from screening.services.workers import (
+    WorkerCrashed,
+    WorkerPool,
+    WorkerTimeout,
+    WorkerUnavailable,
+)
+
+logger = logging.getLogger(__name__)
+
 SUPPORTED_FORMATS = (".pdf", ".docx")
 
+# The API waits for extraction on these threads, each lending its file to a
+# worker process, so the event loop never waits on a parse.
+_EXTRACT_POOL = ThreadPoolExecutor(
+    max_workers=config.EXTRACT_WORKERS, thread_name_prefix="extract"
+)
+
+_text_cache: DiskCache | None = None
+_worker_pool: WorkerPool | None = None
+
 
 class DocumentError(Exception):
-    """The file could not be read, or carries no extractable text."""
+    """The file could not be read, or carries no extractable text.
+
+    `transient` marks a failure that says more about this deploy or this
+    moment than about the file — a missing parser, an overrun deadline — and
+    so is not cached against it.
+    """
+
+    def __init__(self, message: str, transient: bool = False) -> None:
+        super().__init__(message)
+        self.transient = transient
+
+
+class ArchiveTooLarge(DocumentError):
+    """A zip of resumes holds more than a batch may: too many, or too much."""
 
 
-def extract_text(data: bytes, filename: str = "") -> str:
+def worker_pool() -> WorkerPool | None:
+    """The extraction processes, created on first use; None when EXTRACT_ISOLATION is off."""
+    global _worker_pool
+    if _worker_pool is None and config.EXTRACT_ISOLATION:
+        _worker_pool = WorkerPool(
+            size=config.EXTRACT_WORKERS,
+            timeout_seconds=config.EXTRACT_TIMEOUT_SECONDS,
+            max_jobs=config.EXTRACT_MAX_JOBS,
+            max_rss_mb=config.EXTRACT_MAX_RSS_MB,
+            memory_limit_mb=config.EXTRACT_MEMORY_LIMIT_MB,
+            preload=(__name__,),
+        )
+    return _worker_pool
+
+
+def text_cache() -> DiskCache | None:
+    """The extracted-text cache, opened on first use; None when TEXT_CACHE is off."""
+    global _text_cache
+    if _text_cache is None and config.TEXT_CACHE:
+        _text_cache = DiskCache(
+            config.TEXT_CACHE_PATH,
+            ttl_seconds=config.TEXT_CACHE_TTL_SECONDS,
+            max_entries=config.TEXT_CACHE_MAX_ENTRIES,
+            memory_entries=config.TEXT_CACHE_MEMORY_ENTRIES,
+        )
+    return _text_cache
+
+
+def text_budget(llm_available: bool) -> int | None:
+    """How much PDF text a screening needs: see PDF_TEXT_BUDGET. None is no limit."""
+    budget = config.PDF_TEXT_BUDGET_LLM if llm_available else config.PDF_TEXT_BUDGET
+    return budget or None
+
+
+def extract_text(data: bytes, filename: str = "", max_chars: int | None = None) -> str:
     """Extract text from a resume, dispatching on the file's actual bytes.
 
     The extension is only a hint — a mislabelled .pdf that is really a DOCX
     still reads correctly, because the magic number decides.
     """
+    return extract_document(data, filename, max_chars)["text"]
+
+
+def extract_document(data: bytes, filename: str = "", max_chars: int | None = None) -> dict:
+    """`extract_text`, with how much of the file was read.
+
+    Answers `{"text": ..., "pages": {"read": n, "skipped": m}}`. A PDF stops
+    being read at the first page that brings its text to `max_chars`; the
+    pages after it are counted as skipped. "pages" is None for a DOCX, which
+    has no pages to skip.
+    """
     if not data:
         raise DocumentError("The uploaded file is empty.")
 
-    if data.lstrip()[:5].startswith(b"%PDF-"):
-        return _from_pdf(data)
+    if _is_pdf(data):
+        # The reader's version is part of the key: an upgrade that reads
+        # PDFs differently retires what the old one extracted. So is the
+        # budget, since it decides how much of the file the text covers.
+        return _cached(
+            f"pdf:{pypdf.__version__}:{max_chars or 'all'}", data, _from_pdf, max_chars
+        )
 
     # DOCX is a zip; "PK" is the local file header.
-    if data[:2] == b"PK":
-        return _from_docx(data)
+    if data.startswith(b"PK"):
+        return _cached("docx", data, _docx_document)
 
     ext = os.path.splitext(filename)[1].lower()
     if ext == ".pdf":
@@ -43,26 +151,148 @@ def extract_text(data: bytes, filename: str = "") -> str:
     )
 
 
-def _from_pdf(data: bytes) -> str:
+def _is_pdf(data: bytes) -> bool:
+    """The PDF header, after any leading whitespace — looked at in place, since
+    slicing or stripping the upload would copy all of it."""
+    view = memoryview(data)
+    start = 0
+    while start < len(view) and view[start] in _WHITESPACE:
+        start += 1
+    return view[start:start + 5] == b"%PDF-"
+
+
+_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c")
+
+
+async def extract_document_async(data: bytes, filename: str = "",
+                                 max_chars: int | None = None) -> dict:
+    """`extract_document`, run on the extraction pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXTRACT_POOL, extract_document, data, filename, max_chars
+    )
+
+
+def _cached(reader: str, data: bytes, read, *args) -> dict:
+    """`read(data, *args)`, or what it answered last time for these exact bytes.
+
+    Failures are cached too — a scanned PDF stays textless however often it
+    is uploaded — unless they are transient.
+    """
+    cache = text_cache()
+    if cache is None:
+        return _isolated(read, data, *args)
+
+    key = f"{reader}:{hashlib.sha256(data).hexdigest()}"
+    cached = cache.get(key)
+    if cached is not None:
+        outcome = json.loads(cached)
+        if "error" in outcome:
+            raise DocumentError(outcome["error"])
+        return {"text": outcome["text"], "pages": outcome.get("pages")}
+
+    try:
+        document = _isolated(read, data, *args)
+    except DocumentError as exc:
+        if not exc.transient:
+            cache.put(key, json.dumps({"error": str(exc)}))
+        raise
+
+    cache.put(key, json.dumps(document))
+    return document
+
+
+def _isolated(read, data: bytes, *args) -> dict:
+    """`read(data, *args)` in an extraction worker, or in-process without one."""
+    pool = worker_pool()
+    try:
+        if pool is None:
+            return read(data, *args)
+        try:
+            return pool.run(read, data, *args)
+        except WorkerUnavailable:
+            return read(data, *args)  # logged once, by the pool
+    except WorkerTimeout as exc:
+        raise DocumentError(
+            f"This file took too long to read ({exc}). It may be damaged.", transient=True
+        ) from exc
+    except WorkerCrashed as exc:
+        raise DocumentError(
+            "Reading this file crashed the parser. It may be damaged.", transient=True
+        ) from exc
+    except MemoryError as exc:
+        # Whether a file fits is this deploy's setting, not the file's nature:
+        # a higher EXTRACT_MEMORY_LIMIT_MB should get it read.
+        raise DocumentError(
+            f"This file needs more than {config.EXTRACT_MEMORY_LIMIT_MB:g} MB to read.",
+            transient=True,
+        ) from exc
+
+
+def _from_pdf(data: bytes, max_chars: int | None = None) -> dict:
+    """The PDF's text, read a page at a time until `max_chars` is reached.
+
+    Pages past that point are never parsed — which, for the long CV or the
+    publication list bound in behind one, is most of the work.
+    """
+    pages: list[str] = []
+    collected = 0
     try:
         reader = PdfReader(io.BytesIO(data))
-        pages = [page.extract_text() or "" for page in reader.pages]
+        total = len(reader.pages)
+        for page in reader.pages:
+            text = page.extract_text() or ""
+            pages.append(text)
+            collected += len(text)
+            if max_chars and collected >= max_chars:
+                break
+    except MemoryError:
+        raise
     except Exception as exc:  # pypdf raises a wide range of parse errors
         raise DocumentError(f"This PDF could not be read: {exc}") from exc
 
-    return _require_text("\n".join(p for p in pages if p.strip()))
+    return {
+        "text": _require_text("\n".join(p for p in pages if p.strip())),
+        "pages": {"read": len(pages), "skipped": total - len(pages)},
+    }
+
+
+def _docx_document(data: bytes) -> dict:
+    return {"text": _from_docx(data), "pages": None}
 
 
 def _from_docx(data: bytes) -> str:
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as package:
+            with package.open(_main_part(package)) as xml:
+                paragraphs, cells = _docx_blocks(xml)
+    except KeyError:
+        # No main document where the package says it is: let python-docx,
+        # which reads the content types as well, have a go.
+        return _from_docx_object_model(data)
+    except MemoryError:
+        raise
+    except Exception as exc:
+        raise DocumentError(f"This DOCX could not be read: {exc}") from exc
+
+    # Body paragraphs first, then table cells, as python-docx lists them.
+    return _require_text("\n".join(p for p in paragraphs + cells if p.strip()))
+
+
+def _from_docx_object_model(data: bytes) -> str:
     try:
         from docx import Document
     except ImportError as exc:
+        # A deploy matter, not the uploader's: they are told only that the
+        # file could not be read.
+        logger.warning("python-docx is not installed; an unusually laid out DOCX was refused")
         raise DocumentError(
-            "DOCX support needs python-docx. Install it, or upload a PDF."
+            "This DOCX could not be read: no main document was found in it."
         ) from exc
 
     try:
         document = Document(io.BytesIO(data))
+    except MemoryError:
+        raise
     except Exception as exc:
         raise DocumentError(f"This DOCX could not be read: {exc}") from exc
 
@@ -76,6 +306,115 @@ def _from_docx(data: bytes) -> str:
     return _require_text("\n".join(p for p in parts if p.strip()))
 
 
+# ── DOCX, streamed ────────────────────────────────────────────────────
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_OFFICE_DOCUMENT = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+# What a run's non-text children stand for; anything not listed is invisible.
+_RUN_MARKS = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+
+def _main_part(package: zipfile.ZipFile) -> str:
+    """The main document's path, from the package relationships. KeyError if absent."""
+    try:
+        rels = ElementTree.fromstring(package.read("_rels/.rels"))
+    except KeyError:
+        return package.getinfo("word/document.xml").filename
+    for rel in rels:
+        if rel.get("Type") == _OFFICE_DOCUMENT:
+            return package.getinfo(posixpath.normpath(rel.get("Target", "").lstrip("/"))).filename
+    raise KeyError("officeDocument")
+
+
+def _docx_blocks(xml) -> tuple[list[str], list[str]]:
+    """The body's paragraph texts and its tables' cell texts, in document order.
+
+    Each block is dropped once read, so memory holds the text and the one
+    paragraph or table being read — not the whole tree.
+    """
+    paragraphs: list[str] = []
+    cells: list[str] = []
+    body = None
+    depth = 0
+    for event, element in ElementTree.iterparse(xml, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2 and element.tag == _W + "body":
+                body = element
+            continue
+
+        depth -= 1
+        if depth == 1:
+            body = None
+        elif depth == 2 and body is not None:
+            if element.tag == _W + "p":
+                paragraphs.append(_paragraph_text(element))
+            elif element.tag == _W + "tbl":
+                cells.extend(_table_cells(element))
+            body.remove(element)
+    return paragraphs, cells
+
+
+def _paragraph_text(p) -> str:
+    """As python-docx reads it: runs and hyperlinked runs, nothing nested deeper."""
+    text = []
+    for child in p:
+        if child.tag == _W + "r":
+            text.append(_run_text(child))
+        elif child.tag == _W + "hyperlink":
+            text.extend(_run_text(r) for r in child.iterfind(_W + "r"))
+    return "".join(text)
+
+
+def _run_text(r) -> str:
+    text = []
+    for child in r:
+        if child.tag == _W + "t":
+            text.append(child.text or "")
+        elif child.tag == _W + "br":
+            # Only a line break reads as one; page and column breaks are "".
+            if child.get(_W + "type", "textWrapping") == "textWrapping":
+                text.append("\n")
+        else:
+            text.append(_RUN_MARKS.get(child.tag, ""))
+    return "".join(text)
+
+
+def _table_cells(tbl):
+    """Cell texts row by row, as python-docx's `row.cells` gives them.
+
+    That is per grid column: a cell spanning three columns is listed three
+    times, and a vertically merged cell repeats the text of the cell above.
+    Tables nested inside a cell are not read.
+    """
+    above: dict[int, tuple[str, int]] = {}
+    for tr in tbl.iterfind(_W + "tr"):
+        row: dict[int, tuple[str, int]] = {}
+        offset = _val(tr.find(f"{_W}trPr/{_W}gridBefore"), 0)
+        for tc in tr.iterfind(_W + "tc"):
+            span = _val(tc.find(f"{_W}tcPr/{_W}gridSpan"), 1)
+            merge = tc.find(f"{_W}tcPr/{_W}vMerge")
+            if merge is not None and merge.get(_W + "val", "continue") == "continue" \
+                    and offset in above:
+                row[offset] = above[offset]
+            else:
+                text = "\n".join(_paragraph_text(p) for p in tc.iterfind(_W + "p"))
+                row[offset] = (text, span)
+            text, repeat = row[offset]
+            yield from [text] * repeat
+            offset += span
+        above = row
+
+
+def _val(element, default: int) -> int:
+    try:
+        return int(element.get(_W + "val")) if element is not None else default
+    except (TypeError, ValueError):
+        return default
+
+
 def _require_text(text: str) -> str:
     if not text.strip():
         raise DocumentError(
@@ -85,6 +424,94 @@ def _require_text(text: str) -> str:
     return text
 
 
-def extract_text_from_path(path: str) -> str:
+def is_archive(data: bytes) -> bool:
+    """A zip of resumes, as opposed to a DOCX (which is also a zip)."""
+    if not data.startswith(b"PK"):
+        return False
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            return "word/document.xml" not in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def unpack_archive(data: bytes, max_members: int | None = None,
+                   max_bytes: int | None = None) -> list[tuple[str, bytes]]:
+    """The resumes in a zip, as (name, bytes) in archive order.
+
+    A zip is small on the wire and can be vast once inflated, so it is held to
+    the batch's limits while it is read, never after: at most `max_members`
+    resumes (MAX_BATCH_RESUMES) and `max_bytes` inflated (MAX_BATCH_UPLOAD_BYTES).
+    A member whose header declares more than MAX_UPLOAD_BYTES is refused without
+    being inflated. Headers can lie, so each read also stops one byte past what
+    is allowed; a member that turns out oversized is caught by the same size
+    check as an upload.
+    """
+    max_members = config.MAX_BATCH_RESUMES if max_members is None else max_members
+    max_bytes = config.MAX_BATCH_UPLOAD_BYTES if max_bytes is None else max_bytes
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(data))
+    except zipfile.BadZipFile as exc:
+        raise DocumentError(f"This zip could not be read: {exc}") from exc
+
+    members = []
+    with archive:
+        for info in archive.infolist():
+            name = info.filename
+            if info.is_dir() or name.startswith("__MACOSX/"):
+                continue
+            if not name.lower().endswith(SUPPORTED_FORMATS):
+                continue
+            if len(members) >= max_members:
+                raise ArchiveTooLarge(
+                    f"A batch holds at most {config.MAX_BATCH_RESUMES} resumes."
+                )
+            if info.file_size > config.MAX_UPLOAD_BYTES:
+                raise ArchiveTooLarge(
+                    f"{name} in the zip exceeds the "
+                    f"{config.MAX_UPLOAD_BYTES // (1024 * 1024)} MB limit."
+                )
+            if info.file_size > max_bytes:
+                raise _unpacked_too_large()
+            try:
+                with archive.open(info) as member:
+                    content = member.read(min(config.MAX_UPLOAD_BYTES, max_bytes) + 1)
+            except (zipfile.BadZipFile, RuntimeError, NotImplementedError) as exc:
+                raise DocumentError(f"This zip could not be read: {exc}") from exc
+            if len(content) > max_bytes:
+                raise _unpacked_too_large()
+            max_bytes -= len(content)
+            members.append((name, content))
+    return members
+
+
+def _unpacked_too_large() -> "ArchiveTooLarge":
+    return ArchiveTooLarge(
+        f"The batch exceeds the {config.MAX_BATCH_UPLOAD_BYTES // (1024 * 1024)} MB "
+        "limit once its zips are unpacked."
+    )
+
+
+def resumes_in(filename: str, data: bytes, max_members: int | None = None,
+               max_bytes: int | None = None) -> list[tuple[str, bytes]]:
+    """An uploaded batch file's resumes: a zip's members, or the file itself."""
+    if is_archive(data):
+        return unpack_archive(data, max_members, max_bytes)
+    return [(filename, data)]
+
+
+async def resumes_in_async(filename: str, data: bytes, max_members: int | None = None,
+                           max_bytes: int | None = None) -> list[tuple[str, bytes]]:
+    """`resumes_in`, run on the extraction pool: inflating a zip is CPU work."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXTRACT_POOL, resumes_in, filename, data, max_members, max_bytes
+    )
+
+
+def extract_text_from_path(path: str, max_chars: int | None = None) -> str:
+    return extract_document_from_path(path, max_chars)["text"]
+
+
+def extract_document_from_path(path: str, max_chars: int | None = None) -> dict:
     with open(path, "rb") as f:
-        return extract_text(f.read(), path)
+        return extract_document(f.read(), path, max_chars)
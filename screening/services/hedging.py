@@ -0,0 +1,77 @@
+"""Hedged requests: a second copy of a call that is running late.
+
+Most Gemini calls come back in a few hundred milliseconds, but a few stall for
+many seconds, and a screening waits for its slowest call. A `Hedger` tracks how
+long recent successful calls took. Once a call has run past a high percentile
+of that (the p95 by default), it is worth sending the same request again and
+taking whichever answer arrives first, since a fresh request is unlikely to hit
+the same stall.
+
+Each hedge is a whole extra request against the quota, so hedges are rationed:
+every call earns `ratio` of a hedge, and no more than a window's worth of
+earned hedges can be saved up. A long slow spell therefore cannot double the
+traffic, though a few stalls arriving together can all be covered.
+"""
+
+import threading
+from collections import deque
+
+
+class Hedger:
+    def __init__(self, percentile: float, ratio: float, window: int = 200,
+                 min_samples: int = 20, min_delay: float = 0.05) -> None:
+        self.percentile = percentile
+        self.ratio = ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._burst = max(1.0, ratio * window)
+        self._credit = 0.0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.wins = 0
+
+    def observe(self, seconds: float) -> None:
+        """The duration of a call that succeeded."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def delay(self) -> float | None:
+        """How long a call may run before it is hedged; None until enough calls
+        have been seen to say what late is. Counts the call towards the budget."""
+        with self._lock:
+            self.calls += 1
+            self._credit = min(self._burst, self._credit + self.ratio)
+            if len(self._latencies) < self.min_samples:
+                return None
+            return max(self.min_delay, self._percentile())
+
+    def admit(self) -> bool:
+        """Whether the budget has a hedge to spend on a late call."""
+        with self._lock:
+            if self._credit < 1:
+                return False
+            self._credit -= 1
+            self.hedged += 1
+            return True
+
+    def won(self) -> None:
+        """The hedge answered before the call it was sent to cover."""
+        with self._lock:
+            self.wins += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            ready = len(self._latencies) >= self.min_samples
+            return {
+                "percentile": self.percentile,
+                "delay_ms": round(max(self.min_delay, self._percentile()) * 1000, 1) if ready else None,
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "wins": self.wins,
+            }
+
+    def _percentile(self) -> float:
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(self.percentile / 100 * len(ordered)))]
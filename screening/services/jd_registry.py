@@ -0,0 +1,47 @@
+"""Job descriptions parsed once and screened against by id.
+
+One posting is typically screened against hundreds of resumes, and re-parsing
+it for each is the single largest repeated cost in a screening: a Gemini round
+trip in LLM mode. A registered JD is stored under a hash of its normalised text,
+so registering the same posting twice (or pasting it again with different
+spacing) lands on the same id without a second parse.
+"""
+
+import hashlib
+import json
+import re
+
+from screening import config
+from screening.services.cache import DiskCache
+
+
+def jd_id(jd_text: str) -> str:
+    """Stable id for a posting: whitespace and case do not change it."""
+    normalised = re.sub(r"\s+", " ", jd_text).strip().lower()
+    return hashlib.sha256(normalised.encode("utf-8")).hexdigest()[:16]
+
+
+class JDRegistry:
+    def __init__(self) -> None:
+        self._store = DiskCache(
+            config.JD_REGISTRY_PATH,
+            ttl_seconds=config.JD_REGISTRY_TTL_SECONDS,
+            max_entries=config.JD_REGISTRY_MAX_ENTRIES,
+            memory_entries=256,
+        )
+
+    def get(self, key: str) -> dict | None:
+        stored = self._store.get(key)
+        return json.loads(stored) if stored is not None else None
+
+    def put(self, key: str, jd_data: dict, persist: bool = True) -> None:
+        """Store a parsed JD. persist=False keeps it for this process only,
+        and for JD_REGISTRY_FALLBACK_TTL_SECONDS — for a parse that fell back
+        to rules, which shouldn't outlive the outage that caused it."""
+        self._store.put(
+            key, json.dumps(jd_data), persist=persist,
+            ttl_seconds=None if persist else config.JD_REGISTRY_FALLBACK_TTL_SECONDS,
+        )
+
+    def stats(self) -> dict:
+        return self._store.stats()
@@ -0,0 +1,96 @@
+"""Client-side admission control for a rate-limited API.
+
+Gemini enforces a requests-per-minute quota and answers a burst past it with
+errors — each of which costs the caller a retry sleep before it falls back
+anyway. A `Limiter` keeps calls under the quota and under a ceiling on calls in
+flight, queueing the excess for up to a deadline. A call that cannot be
+admitted in time is refused at once, so it degrades immediately rather than
+after a failed round trip.
+
+The rate is a token bucket holding a second's worth of requests, so a quiet
+spell allows a short burst but a sustained one is smoothed to the quota.
+"""
+
+import threading
+import time
+
+
+class QueueTimeout(Exception):
+    """No slot came free before the caller's deadline."""
+
+
+class Limiter:
+    def __init__(self, per_minute: float, max_in_flight: int, clock=time.monotonic) -> None:
+        """`per_minute` of 0 is no rate limit; `max_in_flight` of 0 is no ceiling."""
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate)
+        self.max_in_flight = max_in_flight
+        self._clock = clock
+        self._tokens = self.capacity
+        self._refilled = clock()
+        self._in_flight = 0
+        self._ready = threading.Condition()
+        self.admitted = 0
+        self.refused = 0
+        self._waited = 0.0
+        self._longest_wait = 0.0
+
+    def acquire(self, timeout: float) -> float:
+        """Wait for a token and a free slot; answers the seconds spent queued."""
+        started = self._clock()
+        deadline = started + timeout
+        with self._ready:
+            while True:
+                self._refill()
+                short_of_tokens = self.rate and self._tokens < 1
+                full = self.max_in_flight and self._in_flight >= self.max_in_flight
+                if not short_of_tokens and not full:
+                    break
+
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    self.refused += 1
+                    raise QueueTimeout(
+                        f"no request slot within {timeout:g}s "
+                        f"({self._in_flight} in flight)"
+                    )
+                # A full house is woken by `release`; a dry bucket by the clock.
+                wait = remaining
+                if short_of_tokens and not full:
+                    wait = min(remaining, (1 - self._tokens) / self.rate)
+                self._ready.wait(wait)
+
+            if self.rate:
+                self._tokens -= 1
+            self._in_flight += 1
+            waited = self._clock() - started
+            self.admitted += 1
+            self._waited += waited
+            self._longest_wait = max(self._longest_wait, waited)
+            return waited
+
+    def release(self) -> None:
+        """Give back a slot `acquire` took."""
+        with self._ready:
+            self._in_flight -= 1
+            # Every waiter: the first may be short of a token rather than a
+            # slot, and would otherwise sleep on while another could go.
+            self._ready.notify_all()
+
+    def stats(self) -> dict:
+        with self._ready:
+            return {
+                "per_minute": round(self.rate * 60, 2) or None,
+                "max_in_flight": self.max_in_flight or None,
+                "in_flight": self._in_flight,
+                "admitted": self.admitted,
+                "refused": self.refused,
+                "mean_wait_ms": round(self._waited / self.admitted * 1000, 1) if self.admitted else 0.0,
+                "max_wait_ms": round(self._longest_wait * 1000, 1),
+            }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.rate:
+            self._tokens = min(self.capacity, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
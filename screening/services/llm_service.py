@@ -5,12 +5,45 @@ SDK is absent, the quota is spent or the model returns prose instead of JSON,
 this raises `LLMUnavailable` and the calling agent falls back to deterministic
 parsing. The previous version raised at construction time when no key was set,
 which made an unconfigured deploy fail at import rather than degrade.
+
+Each extraction has an `_async` twin for the API's event loop. The pinned SDK's
+own async client is a bare thread hand-off, so the twins hand the blocking call
+to this service's pool instead: the loop stays free, and the number of Gemini
+calls in flight has a ceiling.
+
+Identical requests in flight at the same moment — one posting submitted by
+several recruiters at once — share a single Gemini call: the first caller makes
+it, and the rest wait for its answer or its error. Distinct requests queue
+for the quota (see `screening.services.limiter`). While Gemini is failing, a
+circuit breaker (`screening.services.breaker`) reports the service unavailable,
+so agents go straight to rules instead of waiting out doomed calls.
+
+A call waits no longer than LLM_TIMEOUT_SECONDS, or what is left of the
+request's `Deadline` if it was given one (see `screening.services.deadline`).
+With LLM_HEDGE on, a call that runs late is sent again and the first answer
+wins (see `screening.services.hedging`).
+
+The parsers can race a call against their own rules (LLM_SOFT_DEADLINE_SECONDS):
+`start` and `answer_within` let them stop waiting for a call without stopping
+it, so a late answer still reaches the cache.
+
+With LLM_PACK_RESUMES set, resume extractions awaited at about the same time
+are sent several to a request (see `extract_resumes`).
 """
 
+import asyncio
+import hashlib
 import json
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from screening import config
+from screening.services.breaker import OPEN, CircuitBreaker, CircuitOpen, Ticket
+from screening.services.cache import DiskCache
+from screening.services.deadline import Deadline, within
+from screening.services.hedging import Hedger
+from screening.services.limiter import Limiter, QueueTimeout
 
 
 class LLMUnavailable(Exception):
@@ -21,6 +54,38 @@ class LLMService:
     def __init__(self) -> None:
         self._client = None
         self._init_error: str | None = None
+        self._cache: DiskCache | None = None
+        self._pool = ThreadPoolExecutor(
+            max_workers=config.LLM_WORKERS, thread_name_prefix="gemini"
+        )
+        self.limiter = Limiter(config.LLM_REQUESTS_PER_MINUTE, config.LLM_MAX_IN_FLIGHT)
+        # Async resume extractions waiting to be sent as a pack.
+        self._packing: list[tuple[str, Deadline | None, asyncio.Future]] = []
+        self._pack_timer: asyncio.TimerHandle | None = None
+        self._pack_tasks: set[asyncio.Task] = set()
+        # Calls a parser stopped waiting for, left to finish into the cache.
+        self._overdue_tasks: set[asyncio.Future] = set()
+        self.breaker = CircuitBreaker(
+            window=config.LLM_BREAKER_WINDOW,
+            min_calls=config.LLM_BREAKER_MIN_CALLS,
+            failure_ratio=config.LLM_BREAKER_FAILURE_RATIO,
+            slow_seconds=config.LLM_BREAKER_SLOW_SECONDS,
+            cooldown_seconds=config.LLM_BREAKER_COOLDOWN_SECONDS,
+            probe_seconds=config.LLM_TIMEOUT_SECONDS,
+        )
+        self.hedger = Hedger(config.LLM_HEDGE_PERCENTILE, config.LLM_HEDGE_RATIO)
+        # Each request is made here, and waited for with a timeout: the SDK
+        # has none of its own. Separate from `_pool`, whose threads are the
+        # ones waiting.
+        self._call_pool = ThreadPoolExecutor(
+            max_workers=2 * config.LLM_WORKERS, thread_name_prefix="gemini-call"
+        )
+        # Prompt key -> the answer (as JSON) its first caller is fetching.
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.coalesced = 0
+        self.retries = 0
+        self.overdue = 0
 
         if not config.USE_LLM:
             self._init_error = (
@@ -33,21 +98,48 @@ class LLMService:
         try:
             from google import genai
 
-            self._client = genai.Client(api_key=config.GEMINI_API_KEY)
+            self._client = genai.Client(
+                api_key=config.GEMINI_API_KEY,
+                http_options={"base_url": config.GEMINI_BASE_URL} if config.GEMINI_BASE_URL else None,
+            )
         except ImportError:
             self._init_error = "google-genai is not installed"
+            return
         except Exception as exc:
             self._init_error = f"Gemini client failed to initialise: {exc}"
+            return
+
+        if config.LLM_CACHE:
+            # Validated answers only, keyed on model and a hash of the full
+            # prompt. The prompt carries the template as well as the truncated
+            # input, so editing a template retires its old answers without a
+            # version number to remember to bump.
+            self._cache = DiskCache(
+                config.LLM_CACHE_PATH,
+                ttl_seconds=config.LLM_CACHE_TTL_SECONDS,
+                max_entries=config.LLM_CACHE_MAX_ENTRIES,
+            )
 
     @property
-    def available(self) -> bool:
+    def configured(self) -> bool:
+        """Whether Gemini is set up at all, whatever the breaker says of it now."""
         return self._client is not None
 
+    @property
+    def available(self) -> bool:
+        return self.configured and self.breaker.state != OPEN
+
     @property
     def status(self) -> str:
-        return "ready" if self.available else (self._init_error or "unavailable")
+        if self._client is not None:
+            return "ready" if self.available else self.breaker.describe()
+        return self._init_error or "unavailable"
+
+    @property
+    def cache_stats(self) -> dict | None:
+        return self._cache.stats() if self._cache else None
 
-    def _generate(self, prompt: str) -> str:
+    def _generate(self, prompt: str, deadline: Deadline | None = None) -> str:
         if not self._client:
             raise LLMUnavailable(self._init_error or "LLM is not configured")
 
@@ -57,26 +149,178 @@ class LLMService:
         # capped, so a long backoff would burn the request's whole budget and
         # still time out.
         for attempt in range(2):
+            if attempt:
+                self.retries += 1
             try:
-                response = self._client.models.generate_content(
-                    model=config.GEMINI_MODEL,
-                    contents=prompt,
-                    config={
-                        "response_mime_type": "application/json",
-                        "temperature": 0.1,
-                    },
-                )
-                text = (response.text or "").strip()
+                text = (self._send(prompt, deadline).text or "").strip()
                 if not text:
                     raise LLMUnavailable("The model returned an empty response")
                 return text
+            except QueueTimeout as exc:
+                raise LLMUnavailable(f"Gemini is at its request limit: {exc}") from exc
+            except CircuitOpen as exc:
+                if last_error is not None:
+                    break
+                raise LLMUnavailable(str(exc)) from exc
             except Exception as exc:
                 last_error = exc
-                if attempt == 0:
+                if attempt == 0 and deadline is not None and not deadline.allows(
+                    config.LLM_RETRY_DELAY_SECONDS + config.LLM_MIN_BUDGET_SECONDS
+                ):
+                    raise LLMUnavailable(
+                        f"Gemini request failed, with no time left to retry: {exc}"
+                    ) from exc
+                # If that failure opened the breaker, the retry would only be refused.
+                if attempt == 0 and self.breaker.state != OPEN:
                     time.sleep(config.LLM_RETRY_DELAY_SECONDS)
 
         raise LLMUnavailable(f"Gemini request failed: {last_error}")
 
+    def _send(self, prompt: str, deadline: Deadline | None = None):
+        """`_call`, waited for until LLM_TIMEOUT_SECONDS or the deadline, and
+        hedged if LLM_HEDGE is on and the call runs late.
+
+        The first successful answer wins; if both fail, the call's own error
+        is raised. A request given up on, or beaten by its hedge, is not
+        cancelled (the SDK cannot abandon one, nor time one out): its answer is
+        dropped. One given up on frees its limiter slot and counts as a failure
+        with the breaker straight away, so calls Gemini never answers neither
+        fill the limiter nor go unnoticed; one not yet sent is not sent.
+        """
+        timeout = within(deadline, config.LLM_TIMEOUT_SECONDS)
+        ends = time.monotonic() + timeout
+        queue_seconds = min(config.LLM_QUEUE_SECONDS, timeout)
+        attempts = {}
+        call = self._submit(attempts, prompt, queue_seconds)
+        pending = {call}
+
+        hedge = None
+        delay = self.hedger.delay() if config.LLM_HEDGE else None
+        if delay is not None and delay < timeout \
+                and not wait(pending, timeout=delay).done and self.hedger.admit():
+            hedge = self._submit(attempts, prompt, queue_seconds)
+            pending.add(hedge)
+
+        while pending:
+            done, pending = wait(
+                pending, timeout=max(0.0, ends - time.monotonic()), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                # A stalled Gemini may never answer these; the breaker hears
+                # of them now, as the failures they are to this caller.
+                for future in pending:
+                    self._settle(attempts[future], ok=False)
+                raise LLMUnavailable(f"Gemini did not answer within {timeout:.1f}s")
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self.hedger.won()
+                    return future.result()
+        return call.result()
+
+    def _submit(self, attempts: dict, prompt: str, queue_seconds: float) -> Future:
+        attempt = _Attempt()
+        future = self._call_pool.submit(self._call, prompt, queue_seconds, attempt)
+        attempts[future] = attempt
+        return future
+
+    def _call(self, prompt: str, queue_seconds: float, attempt: "_Attempt"):
+        """One Gemini request, admitted by the limiter and the breaker, which
+        is told how it went. A retry queues and counts like any other request."""
+        self.limiter.acquire(queue_seconds)
+        if not attempt.hold(self.limiter.release):
+            raise LLMUnavailable("The request was given up on before it was sent")
+        ok = False
+        try:
+            ticket = self.breaker.allow()
+            if ticket is None:
+                raise CircuitOpen(self.breaker.describe())
+            attempt.start(ticket)
+            response = self._client.models.generate_content(
+                model=config.GEMINI_MODEL,
+                contents=prompt,
+                config={
+                    "response_mime_type": "application/json",
+                    "temperature": 0.1,
+                },
+            )
+            ok = True
+            self.hedger.observe(time.monotonic() - attempt.started)
+            return response
+        finally:
+            self._settle(attempt, ok)
+
+    def _settle(self, attempt: "_Attempt", ok: bool) -> None:
+        """Free an attempt's limiter slot and tell the breaker how it went, if
+        nobody has yet."""
+        ticket = attempt.finish()
+        if ticket is not None:
+            self.breaker.record(ticket, ok, time.monotonic() - attempt.started)
+
+    def _extract(self, prompt: str, check=None, deadline: Deadline | None = None,
+                 cache: bool = True) -> dict:
+        """Generate, parse and validate, answering from the cache if it can.
+
+        Only answers that passed validation are stored, so a reply the caller
+        would have rejected is asked for again rather than replayed. A caller
+        whose prompt is already being asked waits for that answer instead.
+        A cached answer is returned however little time is left; otherwise a
+        caller short of time is refused before anything is sent. `cache=False`
+        neither reads nor stores: for a prompt whose answer the caller caches
+        in parts.
+        """
+        key = _key(prompt)
+
+        cached = self._cached(key) if cache else None
+        if cached is not None:
+            return cached
+
+        _check_time(deadline)
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leading = flight is None
+            if leading:
+                flight = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leading:
+            if not wait([flight], timeout=None if deadline is None else deadline.remaining()).done:
+                raise LLMUnavailable("Ran out of time waiting for a shared Gemini request")
+            # Each caller gets its own copy; the agents annotate what they get.
+            data = json.loads(flight.result())
+            data["_note"] = "Shared an identical Gemini request already in flight"
+            return data
+
+        try:
+            data = self._parse_json(self._generate(prompt, deadline))
+            if check:
+                check(data)
+            if self._cache and cache:
+                self._cache.put(key, json.dumps(data))
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(json.dumps(data))
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return data
+
+    def _cached(self, key: str) -> dict | None:
+        cached = self._cache.get(key) if self._cache else None
+        if cached is None:
+            return None
+        data = json.loads(cached)
+        stats = self._cache.stats()
+        # "_note" is read by the parser agents into the trace.
+        data["_note"] = (
+            f"Cached Gemini response reused — {stats['hits']} hits, "
+            f"{stats['misses']} misses since start"
+        )
+        return data
+
     @staticmethod
     def _parse_json(raw: str) -> dict:
         """Parse the model's reply, tolerating fences and stray commentary."""
@@ -103,38 +347,146 @@ class LLMService:
 
         return data
 
-    def extract_resume_info(self, resume_text: str) -> dict:
-        prompt = f"""You are screening a resume for a hiring team.
+    def start(self, fn, *args) -> Future:
+        """`fn(*args)` under way on this service's pool."""
+        return self._pool.submit(fn, *args)
+
+    def answer_within(self, pending: Future, deadline: Deadline | None = None,
+                      soft: Deadline | None = None):
+        """A started call's answer, or the exception standing in for it:
+        `LLMUnavailable` if it has not come by `soft` — LLM_SOFT_DEADLINE_SECONDS
+        from when the call was sent — or by `deadline`. The call is not stopped."""
+        soft = soft or Deadline(config.LLM_SOFT_DEADLINE_SECONDS)
+        if not wait([pending], timeout=within(deadline, soft.remaining())).done:
+            self.overdue += 1
+            return _overdue(soft)
+        return pending.exception() or pending.result()
+
+    async def answer_within_async(self, pending: asyncio.Future,
+                                  deadline: Deadline | None = None,
+                                  soft: Deadline | None = None):
+        """`answer_within` for a call awaited on the event loop."""
+        soft = soft or Deadline(config.LLM_SOFT_DEADLINE_SECONDS)
+        done, _ = await asyncio.wait({pending}, timeout=within(deadline, soft.remaining()))
+        if not done:
+            self.overdue += 1
+            self._overdue_tasks.add(pending)
+            pending.add_done_callback(self._forget_overdue)
+            return _overdue(soft)
+        return pending.exception() or pending.result()
+
+    def _forget_overdue(self, task: asyncio.Future) -> None:
+        self._overdue_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()  # retrieved, so a late failure is not logged as lost
+
+    async def _off_loop(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    async def extract_resume_info_async(self, resume_text: str,
+                                        deadline: Deadline | None = None) -> dict:
+        if config.LLM_PACK_RESUMES <= 1:
+            return await self._off_loop(self.extract_resume_info, resume_text, deadline)
+
+        _check_time(deadline)
+        loop = asyncio.get_running_loop()
+        answer = loop.create_future()
+        self._packing.append((resume_text, deadline, answer))
+        if len(self._packing) >= config.LLM_PACK_RESUMES \
+                or sum(len(_clipped(t)) for t, _, _ in self._packing) >= config.LLM_PACK_CHARS:
+            self._send_packs()
+        elif self._pack_timer is None:
+            self._pack_timer = loop.call_later(
+                config.LLM_PACK_WAIT_MS / 1000, self._send_packs
+            )
+        if deadline is None:
+            return await answer
+        try:
+            return await asyncio.wait_for(answer, deadline.remaining())
+        except asyncio.TimeoutError:
+            raise LLMUnavailable("Ran out of time waiting for a packed Gemini request") from None
+
+    def _send_packs(self) -> None:
+        if self._pack_timer is not None:
+            self._pack_timer.cancel()
+            self._pack_timer = None
+        waiting, self._packing = self._packing, []
+        for pack in _packs(waiting, key=lambda item: item[0]):
+            task = asyncio.ensure_future(self._settle_pack(pack))
+            # The loop holds tasks weakly; this keeps each until it is done.
+            self._pack_tasks.add(task)
+            task.add_done_callback(self._pack_tasks.discard)
+
+    async def _settle_pack(self, pack: list[tuple[str, Deadline | None, asyncio.Future]]) -> None:
+        texts = [text for text, _, _ in pack]
+        # The pack is one request, so it keeps to the soonest of its deadlines.
+        deadlines = [deadline for _, deadline, _ in pack if deadline is not None]
+        soonest = min(deadlines, key=Deadline.remaining, default=None)
+        try:
+            answers = await self._off_loop(self.extract_resumes, texts, soonest)
+        except Exception as exc:
+            answers = [exc] * len(texts)
+        for (_, _, answer), outcome in zip(pack, answers):
+            if answer.done():  # its screening was cancelled
+                continue
+            if isinstance(outcome, Exception):
+                answer.set_exception(outcome)
+            else:
+                answer.set_result(outcome)
+
+    async def extract_jd_info_async(self, jd_text: str,
+                                    deadline: Deadline | None = None) -> dict:
+        return await self._off_loop(self.extract_jd_info, jd_text, deadline)
+
+    async def extract_both_async(self, resume_text: str, jd_text: str,
+                                 deadline: Deadline | None = None) -> tuple:
+        return await self._off_loop(self.extract_both, resume_text, jd_text, deadline)
+
+    def extract_resume_info(self, resume_text: str, deadline: Deadline | None = None) -> dict:
+        return self._extract(_resume_prompt(resume_text), check=_has_skills, deadline=deadline)
+
+    def extract_jd_info(self, jd_text: str, deadline: Deadline | None = None) -> dict:
+        prompt = f"""You are analysing a job description for a hiring team.
 
-Extract the candidate's technical skills, total years of professional
-experience, and notable projects.
+Extract the required technical skills and the experience requirement.
 
 Rules:
-- List skills as they are conventionally written (Python, PostgreSQL, Node.js).
-- Include only skills the resume actually evidences. Do not infer.
-- experience_years is a number: total professional experience, internships
-  excluded. Use 0 if the resume shows no professional work history.
+- required_skills: only concrete, checkable technical skills. Exclude soft
+  skills ("team player", "quick learner", "good communication").
+- experience_required: {{"min": n, "max": n}}. Use null for max when the JD is
+  open-ended ("5+ years"). Use null for the whole field if it is unstated.
+- jd_clarity: "clear" if the JD names specific technologies and an experience
+  level; "vague" if it is generic enough that two recruiters would disagree on
+  who qualifies.
 - Return JSON only, matching this shape exactly:
 
-{{"skills": ["Python", "FastAPI"], "experience_years": 3, "projects": ["..."]}}
+{{"required_skills": ["Python"], "experience_required": {{"min": 2, "max": 4}}, "jd_clarity": "clear"}}
 
-Resume:
-{resume_text[: config.MAX_RESUME_CHARS_FOR_LLM]}
+Job description:
+{jd_text[: config.MAX_JD_CHARS_FOR_LLM]}
 """
-        data = self._parse_json(self._generate(prompt))
+        return self._extract(prompt, deadline=deadline)
 
-        skills = data.get("skills")
-        if not isinstance(skills, list) or not skills:
-            raise LLMUnavailable("No skills were found in the resume")
+    def extract_both(self, resume_text: str, jd_text: str,
+                     deadline: Deadline | None = None) -> tuple:
+        """The resume's and the JD's extractions from a single Gemini call.
 
-        return data
+        Answers (resume, jd). Each half is checked as its own call would be,
+        and a half that fails comes back as the exception that call would have
+        raised — so a bad half costs only its own agent, which falls back to
+        rules. If the call itself fails, both halves carry its error.
+        """
+        prompt = f"""You are screening a resume against a job description for a hiring team.
 
-    def extract_jd_info(self, jd_text: str) -> dict:
-        prompt = f"""You are analysing a job description for a hiring team.
-
-Extract the required technical skills and the experience requirement.
+From the resume, extract the candidate's technical skills, total years of
+professional experience, and notable projects. From the job description,
+extract the required technical skills and the experience requirement.
 
 Rules:
+- List skills as they are conventionally written (Python, PostgreSQL, Node.js).
+- Resume skills: only those the resume actually evidences. Do not infer.
+- experience_years is a number: total professional experience, internships
+  excluded. Use 0 if the resume shows no professional work history.
 - required_skills: only concrete, checkable technical skills. Exclude soft
   skills ("team player", "quick learner", "good communication").
 - experience_required: {{"min": n, "max": n}}. Use null for max when the JD is
@@ -142,11 +494,244 @@ Rules:
 - jd_clarity: "clear" if the JD names specific technologies and an experience
   level; "vague" if it is generic enough that two recruiters would disagree on
   who qualifies.
+- Read each document on its own: the resume does not change what the job
+  requires, nor the job what the resume shows.
 - Return JSON only, matching this shape exactly:
 
-{{"required_skills": ["Python"], "experience_required": {{"min": 2, "max": 4}}, "jd_clarity": "clear"}}
+{{"resume": {{"skills": ["Python", "FastAPI"], "experience_years": 3, "projects": ["..."]}},
+ "job": {{"required_skills": ["Python"], "experience_required": {{"min": 2, "max": 4}}, "jd_clarity": "clear"}}}}
+
+Resume:
+{resume_text[: config.MAX_RESUME_CHARS_FOR_LLM]}
 
 Job description:
 {jd_text[: config.MAX_JD_CHARS_FOR_LLM]}
 """
-        return self._parse_json(self._generate(prompt))
+        try:
+            data = self._extract(prompt, check=_has_both, deadline=deadline)
+        except Exception as exc:
+            return exc, exc
+
+        halves = []
+        for name, other, check in (("resume", "job description", _has_skills),
+                                   ("job", "resume", None)):
+            half = dict(data[name])
+            try:
+                if check:
+                    check(half)
+            except LLMUnavailable as exc:
+                halves.append(exc)
+                continue
+            half["_note"] = data.get("_note") or f"Read in one Gemini call with the {other}"
+            halves.append(half)
+        return tuple(halves)
+
+    def extract_resumes(self, resume_texts: list[str],
+                        deadline: Deadline | None = None) -> list:
+        """`extract_resume_info` for many resumes, several to a request.
+
+        Resumes are packed in order, as many to a request as LLM_PACK_RESUMES
+        and LLM_PACK_CHARS allow. Answers line up with `resume_texts`. Each is
+        checked on its own, and one the model got wrong (or left out) is the
+        LLMUnavailable its own call would have raised, so it alone falls back
+        to rules. A request that fails fails every resume it carried. The
+        async path sends the packs it gathers through here, already cut to fit.
+        """
+        answers: list = []
+        for pack in _packs(resume_texts):
+            try:
+                answers.extend(
+                    self._extract_pack(pack, deadline) if len(pack) > 1
+                    else [self.extract_resume_info(pack[0], deadline)]
+                )
+            except Exception as exc:
+                answers.extend([exc] * len(pack))
+        return answers
+
+    def _extract_pack(self, resume_texts: list[str],
+                      deadline: Deadline | None = None) -> list:
+        """Answers for a pack of resumes, lined up with `resume_texts`.
+
+        Each resume is looked up under the key its own `extract_resume_info`
+        call would use, and only those not found are sent. Each validated
+        answer is stored under that key in turn — never the pack's prompt,
+        which the same resumes in other company would not repeat.
+        """
+        keys = [_key(_resume_prompt(text)) for text in resume_texts]
+        answers: list = [self._cached(key) for key in keys]
+        missing = [i for i, answer in enumerate(answers) if answer is None]
+        if len(missing) == 1:
+            try:
+                answers[missing[0]] = self.extract_resume_info(resume_texts[missing[0]], deadline)
+            except Exception as exc:
+                answers[missing[0]] = exc
+        elif missing:
+            try:
+                fresh = self._ask_pack([resume_texts[i] for i in missing], deadline)
+            except Exception as exc:
+                fresh = [exc] * len(missing)
+            for i, answer in zip(missing, fresh):
+                answers[i] = answer
+                if self._cache and not isinstance(answer, Exception):
+                    self._cache.put(keys[i], json.dumps(
+                        {k: v for k, v in answer.items() if k not in ("id", "_note")}
+                    ))
+        return answers
+
+    def _ask_pack(self, resume_texts: list[str], deadline: Deadline | None = None) -> list:
+        listed = "\n\n".join(
+            f"### Resume {i}\n{_clipped(text)}" for i, text in enumerate(resume_texts)
+        )
+        prompt = f"""You are screening resumes for a hiring team.
+
+For each resume below, extract the candidate's technical skills, total years
+of professional experience, and notable projects.
+
+Rules:
+- List skills as they are conventionally written (Python, PostgreSQL, Node.js).
+- Include only skills the resume actually evidences. Do not infer.
+- experience_years is a number: total professional experience, internships
+  excluded. Use 0 if the resume shows no professional work history.
+- Read each resume on its own; never carry anything from one into another.
+- Answer every resume, once, under its number as "id".
+- Return JSON only, matching this shape exactly:
+
+{{"resumes": [{{"id": 0, "skills": ["Python", "FastAPI"], "experience_years": 3, "projects": ["..."]}}]}}
+
+{listed}
+"""
+        data = self._extract(prompt, check=_has_resume_list, deadline=deadline, cache=False)
+        by_id = {}
+        for entry in data["resumes"]:
+            if isinstance(entry, dict) and str(entry.get("id")) not in by_id:
+                by_id[str(entry.get("id"))] = entry
+
+        answers: list = []
+        for i in range(len(resume_texts)):
+            entry = by_id.get(str(i))
+            if entry is None:
+                answers.append(LLMUnavailable(f"The model's answer left out resume {i}"))
+                continue
+            entry = dict(entry)
+            try:
+                _has_skills(entry)
+            except LLMUnavailable as exc:
+                answers.append(exc)
+                continue
+            entry["_note"] = data.get("_note") or (
+                f"Read in one Gemini call with {len(resume_texts) - 1} other resumes"
+            )
+            answers.append(entry)
+        return answers
+
+
+class _Attempt:
+    """One request `_send` made. Its limiter slot is freed, and its outcome
+    reported to the breaker, exactly once: by `_call` when Gemini answers, or
+    by `_send` when it stops waiting first."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ticket: Ticket | None = None
+        self._release = None
+        self.started = 0.0
+        self.abandoned = False
+
+    def hold(self, release) -> bool:
+        """Take on a limiter slot, freed by `release`; False, with the slot
+        already freed, if the attempt was given up on while it queued."""
+        with self._lock:
+            if not self.abandoned:
+                self._release = release
+                return True
+        release()
+        return False
+
+    def start(self, ticket: Ticket) -> None:
+        with self._lock:
+            self._ticket = ticket
+            self.started = time.monotonic()
+
+    def finish(self) -> Ticket | None:
+        """The ticket to report, the first time only; after this the attempt
+        is given up on, and is not sent if it has not been yet."""
+        with self._lock:
+            ticket, self._ticket = self._ticket, None
+            release, self._release = self._release, None
+            self.abandoned = True
+        if release is not None:
+            release()
+        return ticket
+
+
+def _resume_prompt(resume_text: str) -> str:
+    return f"""You are screening a resume for a hiring team.
+
+Extract the candidate's technical skills, total years of professional
+experience, and notable projects.
+
+Rules:
+- List skills as they are conventionally written (Python, PostgreSQL, Node.js).
+- Include only skills the resume actually evidences. Do not infer.
+- experience_years is a number: total professional experience, internships
+  excluded. Use 0 if the resume shows no professional work history.
+- Return JSON only, matching this shape exactly:
+
+{{"skills": ["Python", "FastAPI"], "experience_years": 3, "projects": ["..."]}}
+
+Resume:
+{_clipped(resume_text)}
+"""
+
+
+def _overdue(soft: Deadline) -> LLMUnavailable:
+    waited = soft.seconds - soft.remaining()
+    return LLMUnavailable(f"Gemini had not answered within {waited:.1f}s")
+
+
+def _key(prompt: str) -> str:
+    return hashlib.sha256(f"{config.GEMINI_MODEL}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def _check_time(deadline: Deadline | None) -> None:
+    if deadline is not None and not deadline.allows(config.LLM_MIN_BUDGET_SECONDS):
+        raise LLMUnavailable(
+            f"Only {deadline.remaining():.1f}s of the request's time left, too little for Gemini"
+        )
+
+
+def _clipped(resume_text: str) -> str:
+    return resume_text[: config.MAX_RESUME_CHARS_FOR_LLM]
+
+
+def _packs(items: list, key=lambda item: item) -> list[list]:
+    """`items` in order, cut into packs of at most LLM_PACK_RESUMES whose
+    clipped texts (`key` of each item) come to at most LLM_PACK_CHARS."""
+    packs: list[list] = []
+    size = 0
+    for item in items:
+        length = len(_clipped(key(item)))
+        if not packs or len(packs[-1]) >= config.LLM_PACK_RESUMES \
+                or size + length > config.LLM_PACK_CHARS:
+            packs.append([])
+            size = 0
+        packs[-1].append(item)
+        size += length
+    return packs
+
+
+def _has_resume_list(data: dict) -> None:
+    if not isinstance(data.get("resumes"), list):
+        raise LLMUnavailable("The model's answer has no list of resumes")
+
+
+def _has_both(data: dict) -> None:
+    for name in ("resume", "job"):
+        if not isinstance(data.get(name), dict):
+            raise LLMUnavailable(f"The model's answer has no {name} object")
+
+
+def _has_skills(data: dict) -> None:
+    skills = data.get("skills")
+    if not isinstance(skills, list) or not skills:
+        raise LLMUnavailable("No skills were found in the resume")
@@ -12,6 +12,10 @@ Two jobs:
 """
 
 import re
+from bisect import bisect_left
+from functools import cached_property, lru_cache
+
+from screening import config
 
 # canonical name -> surface forms found in the wild.
 # The canonical name is what the UI displays, so it carries real casing.
@@ -120,15 +124,85 @@ _LOOKUP: dict[str, str] = {
 }
 _ALIASES_BY_LENGTH: list[str] = sorted(_LOOKUP, key=len, reverse=True)
 
-_ALIAS_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
-    # \b behaves badly against aliases ending in punctuation (c++, c#, node.js),
-    # so the boundaries are asserted by hand.
-    (alias, re.compile(
-        r"(?<![a-z0-9+#.])" + re.escape(alias) + r"(?![a-z0-9+#]|\.[a-z])",
-        re.IGNORECASE,
-    ))
-    for alias in _ALIASES_BY_LENGTH
-]
+# An alias is a hit only where it is not glued to a neighbouring word. \b
+# behaves badly against aliases ending in punctuation (c++, c#, node.js), so
+# the boundaries are character sets the scanner tests directly: no letter,
+# digit, "+", "#" or "." before the alias, and no letter, digit, "+" or "#"
+# after it, nor a "." that starts another word.
+_LEFT_BOUNDARY = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#.")
+_RIGHT_BOUNDARY = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#")
+_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+
+# Key under which a trie node records the alias ending there. No alias
+# character is the empty string, so it cannot collide with a child edge.
+_END = ""
+
+
+def _build_trie(aliases) -> dict:
+    root: dict = {}
+    for alias in aliases:
+        node = root
+        for char in alias:
+            node = node.setdefault(char, {})
+        node[_END] = alias
+    return root
+
+
+_ALIAS_TRIE = _build_trie(_ALIASES_BY_LENGTH)
+
+# Extraction reports skills in the order the per-alias loop used to find them:
+# longest alias first, then by position. Ranking hits reproduces that order.
+_ALIAS_RANK: dict[str, int] = {alias: i for i, alias in enumerate(_ALIASES_BY_LENGTH)}
+
+
+def _fold(text: str) -> str:
+    """Lower-case without shifting offsets, so positions map back to `text`.
+
+    A handful of characters lower-case to two ("İ" -> "i̇"); those keep only the
+    first, which is what the regex engine's IGNORECASE compares against.
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(char.lower()[:1] for char in text)
+
+
+def _scan(folded: str, trie: dict) -> list[tuple[int, str]]:
+    """Every (position, alias) hit in already-folded text, in one pass.
+
+    Each position walks the trie only as deep as the text keeps matching, so
+    the cost is bounded by the longest alias rather than by how many aliases
+    the vocabulary holds. Overlapping hits are all reported, exactly as
+    running each alias pattern separately would.
+    """
+    hits: list[tuple[int, str]] = []
+    length = len(folded)
+
+    for start in range(length):
+        node = trie.get(folded[start])
+        if node is None:
+            continue
+        if start and folded[start - 1] in _LEFT_BOUNDARY:
+            continue
+
+        end = start + 1
+        while True:
+            alias = node.get(_END)
+            if alias is not None and (
+                end == length
+                or folded[end] not in _RIGHT_BOUNDARY
+                and not (folded[end] == "." and end + 1 < length
+                         and folded[end + 1] in _LETTERS)
+            ):
+                hits.append((start, alias))
+            if end == length:
+                break
+            node = node.get(folded[end])
+            if node is None:
+                break
+            end += 1
+
+    return hits
 
 
 def canonical(term: str) -> str:
@@ -140,8 +214,16 @@ def canonical(term: str) -> str:
     """
     if not term:
         return ""
+    # The model's JSON can hand back numbers or nested lists as "skills"; the
+    # cache needs a hashable key, and str() is what the cleaning did anyway.
+    return _canonical(str(term))
+
 
-    cleaned = re.sub(r"\s+", " ", str(term).strip().strip(".,;:()[]"))
+@lru_cache(maxsize=config.CANONICAL_CACHE_SIZE)
+def _canonical(term: str) -> str:
+    # Every skill passes through here on both sides of every match, and the
+    # same few hundred names recur across screenings, so results are kept.
+    cleaned = re.sub(r"\s+", " ", term.strip().strip(".,;:()[]"))
     if not cleaned:
         return ""
 
@@ -149,14 +231,21 @@ def canonical(term: str) -> str:
     if hit:
         return hit
 
-    # "experience with docker" -> Docker
-    for alias, pattern in _ALIAS_PATTERNS:
-        if pattern.search(cleaned):
-            return _LOOKUP[alias]
+    # "experience with docker" -> Docker. The longest alias anywhere in the
+    # term wins, found with the same trie walk extraction uses, so a long
+    # unknown term costs its own length rather than a pass per alias.
+    hits = _scan(_fold(cleaned), _ALIAS_TRIE)
+    if hits:
+        return _LOOKUP[min((alias for _, alias in hits), key=_ALIAS_RANK.__getitem__)]
 
     return cleaned if cleaned.isupper() else cleaned.title()
 
 
+def canonical_cache_info():
+    """Hit and miss counters for the canonicalisation cache."""
+    return _canonical.cache_info()
+
+
 def canonical_set(terms) -> list[str]:
     """Canonicalise a list, dropping blanks and duplicates, order preserved."""
     seen: dict[str, None] = {}
@@ -175,35 +264,6 @@ _EDUCATION_HEADER_RE = re.compile(
     re.IGNORECASE,
 )
 
-
-def _sections(text: str) -> list[tuple[str, str]]:
-    """Split a resume into (header, body) pairs. Preamble is headed "".
-
-    Section awareness matters because a degree's date range is not work
-    experience, and a "Learning:" list is not a skill set.
-    """
-    matches = list(_SECTION_HEADER_RE.finditer(text))
-    if not matches:
-        return [("", text)]
-
-    out: list[tuple[str, str]] = []
-    if matches[0].start() > 0:
-        out.append(("", text[: matches[0].start()]))
-
-    for i, match in enumerate(matches):
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        out.append((match.group(1).strip(), text[match.end() : end]))
-
-    return out
-
-
-def _without_education(text: str) -> str:
-    return "\n".join(
-        body for header, body in _sections(text)
-        if not _EDUCATION_HEADER_RE.search(header)
-    )
-
-
 # A skill named only in one of these frames is an aspiration, not a
 # qualification: "Currently learning Django", "Learning: Docker, AWS basics".
 _ASPIRATIONAL_LINE_RE = re.compile(
@@ -217,50 +277,7 @@ _ASPIRATIONAL_PHRASE_RE = re.compile(
     r"interested\s+in|beginning\s+to\s+learn|started\s+learning)\b",
     re.IGNORECASE,
 )
-
-
-def _is_aspirational(line: str, position: int) -> bool:
-    """True if the mention at `position` sits in a learning frame."""
-    if _ASPIRATIONAL_LINE_RE.match(line):
-        return True
-
-    # "Currently learning Django through online courses" — the cue precedes
-    # the skill, so only look behind it, and only within the same clause.
-    clause_start = max(
-        line.rfind(".", 0, position),
-        line.rfind(",", 0, position),
-        line.rfind(";", 0, position),
-    )
-    lookbehind = line[clause_start + 1 : position]
-    return bool(_ASPIRATIONAL_PHRASE_RE.search(lookbehind))
-
-
-def extract_skills(text: str) -> list[str]:
-    """Pull every known skill out of free text.
-
-    A skill counts only where it is claimed as held. Mentions that appear
-    exclusively in a learning frame are dropped, so "currently learning Django"
-    no longer reads as Django experience.
-    """
-    if not text:
-        return []
-
-    held: dict[str, None] = {}
-    aspirational: set[str] = set()
-
-    for line in text.splitlines():
-        if not line.strip():
-            continue
-        for alias, pattern in _ALIAS_PATTERNS:
-            for match in pattern.finditer(line):
-                skill = _LOOKUP[alias]
-                if _is_aspirational(line, match.start()):
-                    aspirational.add(skill)
-                else:
-                    held.setdefault(skill, None)
-
-    return list(held)
-
+_CLAUSE_BREAK_RE = re.compile(r"[.,;]")
 
 # "2-4 years", "2 to 4 years"
 _RANGE_RE = re.compile(
@@ -282,54 +299,170 @@ _PLAIN_RE = re.compile(
     re.IGNORECASE,
 )
 
+_DATE_RANGE_RE = re.compile(
+    r"(20\d{2}|19\d{2})\s*(?:-|–|—|to)\s*(present|current|now|20\d{2}|19\d{2})",
+    re.IGNORECASE,
+)
+_CURRENT_YEAR = 2026
+
+
+class AnalysedText:
+    """A document read once, for every rule-based extractor to share.
+
+    Deterministic mode asks several questions of the same resume: which
+    skills it holds, what totals it states, which date ranges it lists and
+    which section each sits in. Each extractor used to rescan the raw text for
+    its own answer. This folds and splits the text once, and works out the
+    rest the first time something asks for it.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text or ""
+        self.lines = self.text.splitlines()
+        # Folding keeps offsets, and no line break folds into anything else,
+        # so the folded lines line up with `lines` one for one.
+        self.folded_lines = _fold(self.text).splitlines()
+
+    @cached_property
+    def mentions(self) -> list[tuple[str, bool]]:
+        """(skill, aspirational) for every alias hit, in extraction order."""
+        out: list[tuple[str, bool]] = []
+        for line, folded in zip(self.lines, self.folded_lines):
+            if not line.strip():
+                continue
+            hits = _scan(folded, _ALIAS_TRIE)
+            if not hits:
+                continue
+            hits.sort(key=lambda hit: (_ALIAS_RANK[hit[1]], hit[0]))
+            frames = _LearningFrames(line)
+            out.extend(
+                (_LOOKUP[alias], frames.covers(position)) for position, alias in hits
+            )
+        return out
+
+    @cached_property
+    def sections(self) -> list[tuple[str, int, int]]:
+        """(header, start, end) for each section body. Preamble is headed "".
+
+        Section awareness matters because a degree's date range is not work
+        experience, and a "Learning:" list is not a skill set.
+        """
+        matches = list(_SECTION_HEADER_RE.finditer(self.text))
+        if not matches:
+            return [("", 0, len(self.text))]
+
+        out: list[tuple[str, int, int]] = []
+        if matches[0].start() > 0:
+            out.append(("", 0, matches[0].start()))
+
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(self.text)
+            out.append((match.group(1).strip(), match.end(), end))
+
+        return out
+
+    @cached_property
+    def stated_years(self) -> list[float]:
+        """Every total the text asserts outright, credible or not."""
+        claims = [float(m.group(1)) for m in _PLAIN_RE.finditer(self.text)]
+        claims.extend(float(m.group(2)) for m in _RANGE_RE.finditer(self.text))
+        return claims
+
+    @cached_property
+    def date_ranges(self) -> list[tuple[int, int, int]]:
+        """(offset, start_year, end_year) for every credible date range."""
+        out: list[tuple[int, int, int]] = []
+        for match in _DATE_RANGE_RE.finditer(self.text):
+            start = int(match.group(1))
+            end_raw = match.group(2).lower()
+            end = _CURRENT_YEAR if end_raw in {"present", "current", "now"} else int(end_raw)
+            if end >= start and end - start <= 45:
+                out.append((match.start(), start, end))
+        return out
+
+    @cached_property
+    def employment_ranges(self) -> list[tuple[int, int]]:
+        """Date ranges outside education sections, as (start_year, end_year)."""
+        excluded = [
+            (start, end) for header, start, end in self.sections
+            if _EDUCATION_HEADER_RE.search(header)
+        ]
+        return [
+            (start, end) for offset, start, end in self.date_ranges
+            if not any(low <= offset < high for low, high in excluded)
+        ]
+
+
+class _LearningFrames:
+    """Where on one line a mention would sit in a learning frame."""
+
+    def __init__(self, line: str) -> None:
+        self.whole_line = bool(_ASPIRATIONAL_LINE_RE.match(line))
+        if self.whole_line:
+            return
+        self.breaks = [m.start() for m in _CLAUSE_BREAK_RE.finditer(line)]
+        self.cues = [(m.start(), m.end()) for m in _ASPIRATIONAL_PHRASE_RE.finditer(line)]
+
+    def covers(self, position: int) -> bool:
+        """True if the mention at `position` sits in a learning frame."""
+        if self.whole_line:
+            return True
+
+        # "Currently learning Django through online courses" — the cue precedes
+        # the skill, so only look behind it, and only within the same clause.
+        index = bisect_left(self.breaks, position)
+        clause_start = self.breaks[index - 1] if index else -1
+        return any(
+            clause_start < start and end <= position for start, end in self.cues
+        )
+
+
+def _analysed(text) -> AnalysedText:
+    return text if isinstance(text, AnalysedText) else AnalysedText(text)
+
+
+def extract_skills(text: str | AnalysedText) -> list[str]:
+    """Pull every known skill out of free text.
+
+    A skill counts only where it is claimed as held. Mentions that appear
+    exclusively in a learning frame are dropped, so "currently learning Django"
+    no longer reads as Django experience.
+    """
+    doc = _analysed(text)
+
+    held: dict[str, None] = {}
+    for skill, aspirational in doc.mentions:
+        if not aspirational:
+            held.setdefault(skill, None)
+
+    return list(held)
 
-def extract_experience_years(text: str) -> float:
+
+def extract_experience_years(text: str | AnalysedText) -> float:
     """Best-effort years of experience from a resume.
 
     Takes the largest credible claim: resumes tend to state a headline total
     ("4 years of experience") alongside smaller per-role spans, and the
     headline is the one being asserted.
     """
-    if not text:
-        return 0.0
-
-    candidates = [float(m.group(1)) for m in _PLAIN_RE.finditer(text)]
+    doc = _analysed(text)
 
-    for match in _RANGE_RE.finditer(text):
-        candidates.append(float(match.group(2)))
-
-    plausible = [c for c in candidates if 0 < c <= 45]
+    plausible = [c for c in doc.stated_years if 0 < c <= 45]
     if plausible:
         return max(plausible)
 
     # Nothing stated outright, so fall back to summing employment dates —
     # excluding education, whose date range is a degree, not a job.
-    return float(_years_from_date_ranges(_without_education(text)))
+    return float(_union_years(doc.employment_ranges))
 
 
-_DATE_RANGE_RE = re.compile(
-    r"(20\d{2}|19\d{2})\s*(?:-|–|—|to)\s*(present|current|now|20\d{2}|19\d{2})",
-    re.IGNORECASE,
-)
-_CURRENT_YEAR = 2026
-
-
-def _years_from_date_ranges(text: str) -> int:
+def _union_years(spans: list[tuple[int, int]]) -> int:
     """Union of employment date ranges, as a fallback when no total is stated."""
-    spans: list[tuple[int, int]] = []
-
-    for match in _DATE_RANGE_RE.finditer(text):
-        start = int(match.group(1))
-        end_raw = match.group(2).lower()
-        end = _CURRENT_YEAR if end_raw in {"present", "current", "now"} else int(end_raw)
-        if end >= start and end - start <= 45:
-            spans.append((start, end))
-
     if not spans:
         return 0
 
     # Merge overlaps so two concurrent roles don't double-count.
-    spans.sort()
+    spans = sorted(spans)
     merged: list[list[int]] = [list(spans[0])]
     for start, end in spans[1:]:
         if start <= merged[-1][1]:
@@ -363,13 +496,47 @@ def extract_experience_requirement(text: str) -> dict | None:
     return None
 
 
-_REQUIRED_SECTION_RE = re.compile(
+# A requirements section opens at any of these words and runs until a line
+# that starts one of the sections after it, or the end of the posting.
+_REQUIRED_OPENER_RE = re.compile(
     r"(?:required|requirements|must[\s-]have|qualifications|"
-    r"technical\s+requirements|skills)\b(.*?)"
-    r"(?=\n\s*(?:nice[\s-]to[\s-]have|preferred|benefits|what\s+we\s+offer|"
-    r"how\s+to\s+apply|about\s+(?:us|the\s+company))|\Z)",
-    re.IGNORECASE | re.DOTALL,
+    r"technical\s+requirements|skills)\b",
+    re.IGNORECASE,
 )
+_REQUIRED_CLOSER_RE = re.compile(
+    r"nice[\s-]to[\s-]have|preferred|benefits|what\s+we\s+offer|"
+    r"how\s+to\s+apply|about\s+(?:us|the\s+company)",
+    re.IGNORECASE,
+)
+# A line break plus any blank space after it: the run before a line's first
+# word, however many empty lines it spans.
+_LINE_START_RE = re.compile(r"\n\s*")
+
+
+def _required_sections(jd_text: str) -> list[str]:
+    """The body of every requirements section, in order.
+
+    This used to be one lazy DOTALL regex whose terminating lookahead
+    re-scanned the blank space after every line break. A posting padded with
+    empty lines took over a minute at MAX_JD_CHARS. Here each line's opening
+    is classified once, so the cost is linear in the length of the posting.
+    """
+    # Where each closing section begins: the first line break of the blank
+    # run before its header, which is where the old lookahead stopped.
+    closers = [
+        match.start() for match in _LINE_START_RE.finditer(jd_text)
+        if _REQUIRED_CLOSER_RE.match(jd_text, match.end())
+    ]
+
+    sections: list[str] = []
+    position = 0
+    while True:
+        opener = _REQUIRED_OPENER_RE.search(jd_text, position)
+        if opener is None:
+            return sections
+        index = bisect_left(closers, opener.end())
+        position = closers[index] if index < len(closers) else len(jd_text)
+        sections.append(jd_text[opener.end() : position])
 
 
 def extract_required_skills(jd_text: str) -> list[str]:
@@ -382,8 +549,7 @@ def extract_required_skills(jd_text: str) -> list[str]:
     if not jd_text:
         return []
 
-    sections = [m.group(1) for m in _REQUIRED_SECTION_RE.finditer(jd_text)]
-    scoped = "\n".join(sections)
+    scoped = "\n".join(_required_sections(jd_text))
 
     skills = extract_skills(scoped)
     return skills if skills else extract_skills(jd_text)
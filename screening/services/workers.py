@@ -0,0 +1,236 @@
+"""Worker processes for work that must not be trusted with the server.
+
+Parsing an uploaded PDF runs a third-party parser over attacker-chosen bytes:
+a pathological file inside the upload limit can spin for seconds or balloon in
+memory. In a worker process both are containable — the job gets a wall-clock
+deadline after which its process is killed, an address-space ceiling it cannot
+allocate past, and a worker whose peak RSS has grown too far is retired rather
+than reused. Workers are also retired after a fixed number of jobs, so
+whatever a parser leaks is returned to the OS.
+
+`concurrent.futures.ProcessPoolExecutor` can do none of the killing: a job that
+has started runs to completion. Hence this small pool, where each worker has
+its own pipe and is lent to one caller at a time.
+
+Workers are spawned rather than forked, since the server is multi-threaded by
+the time a worker is replaced. As with any spawn-based pool, a script that
+extracts documents needs an `if __name__ == "__main__":` guard.
+"""
+
+import importlib
+import logging
+import multiprocessing
+import queue
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, and no peak RSS to read
+    resource = None
+
+# Spawning imports the preloaded modules afresh; generous, since a cold
+# container's first import can be slow.
+_START_SECONDS = 30
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerTimeout(Exception):
+    """The job overran its deadline; its worker was killed."""
+
+
+class WorkerCrashed(Exception):
+    """The worker died mid-job — killed by the OS, or a crash in C code."""
+
+
+class WorkerUnavailable(Exception):
+    """No worker process could be started."""
+
+
+class WorkerPool:
+    def __init__(self, size: int, timeout_seconds: float, max_jobs: int,
+                 max_rss_mb: float, memory_limit_mb: float,
+                 preload: tuple[str, ...] = ()) -> None:
+        self.size = size
+        self.timeout_seconds = timeout_seconds
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.memory_limit_mb = memory_limit_mb
+        self.preload = preload
+        self.started = 0
+        self.retired = 0
+        self.killed = 0
+        # Set once a worker fails to start. That is the environment, not the
+        # job — no point spawning again for every file.
+        self.error: str | None = None
+        self._context = multiprocessing.get_context("spawn")
+        # None is a vacant slot: its worker is started by the next job that
+        # draws it, so replacing a retired worker never delays the job that
+        # retired it.
+        self._idle: queue.SimpleQueue[_Worker | None] = queue.SimpleQueue()
+        for _ in range(size):
+            self._idle.put(None)
+
+    def warm(self) -> None:
+        """Start every vacant worker now, ahead of the first job."""
+        slots = [self._idle.get() for _ in range(self.size)]
+        launched: list[_Worker] = []
+        try:
+            # Launched together, then waited for, so their imports overlap.
+            for worker in slots:
+                launched.append(worker or _Worker(self._context, self.memory_limit_mb, self.preload))
+            for worker in launched:
+                self._await_ready(worker)
+        except (OSError, WorkerUnavailable) as exc:
+            for worker in launched:
+                worker.stop()
+            launched = []
+            raise self._broken(exc) from exc
+        finally:
+            for worker in launched:
+                self._idle.put(worker)
+            for _ in range(self.size - len(launched)):
+                self._idle.put(None)
+
+    def run(self, fn, *args, timeout: float | None = None):
+        """`fn(*args)` in a worker process; its exception, if any, is re-raised here.
+
+        `fn` and its arguments must pickle — a module-level function does.
+        """
+        if self.error:
+            raise WorkerUnavailable(self.error)
+        timeout = self.timeout_seconds if timeout is None else timeout
+        worker = self._idle.get()
+        retire = True
+        try:
+            if worker is not None and not worker.process.is_alive():
+                # Died while idle (the OS's OOM killer, say): not this job's
+                # doing, so it is not reported as a crash.
+                worker.stop()
+                self.retired += 1
+                worker = None
+            if worker is None:
+                worker = self._start()
+            try:
+                worker.conn.send((fn, args))
+                if not worker.conn.poll(timeout):
+                    self.killed += 1
+                    raise WorkerTimeout(f"Gave up after {timeout:g}s")
+                raised, value, peak_rss_mb = worker.conn.recv()
+            except (EOFError, OSError) as exc:
+                raise WorkerCrashed(f"The worker process died ({type(exc).__name__})") from exc
+
+            worker.jobs += 1
+            retire = (
+                worker.jobs >= self.max_jobs
+                or (peak_rss_mb is not None and peak_rss_mb > self.max_rss_mb)
+                # Past a failed allocation, nothing about the heap is trusted.
+                or (raised and isinstance(value, MemoryError))
+            )
+        finally:
+            if retire and worker is not None:
+                worker.stop()
+                self.retired += 1
+                worker = None
+            self._idle.put(worker)
+
+        if raised:
+            raise value
+        return value
+
+    def close(self) -> None:
+        for _ in range(self.size):
+            worker = self._idle.get()
+            if worker is not None:
+                worker.stop()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.size,
+            "started": self.started,
+            "retired": self.retired,
+            "killed": self.killed,
+            "error": self.error,
+        }
+
+    def _start(self) -> "_Worker":
+        try:
+            worker = _Worker(self._context, self.memory_limit_mb, self.preload)
+        except OSError as exc:
+            raise self._broken(exc) from exc
+        return self._await_ready(worker)
+
+    def _broken(self, exc: Exception) -> WorkerUnavailable:
+        self.error = f"A worker process failed to start ({exc or type(exc).__name__})"
+        logger.warning("%s; running jobs in-process from now on", self.error)
+        return WorkerUnavailable(self.error)
+
+    def _await_ready(self, worker: "_Worker") -> "_Worker":
+        """Wait for a new worker's hello, so one that cannot even start up is
+        not later mistaken for a file that crashed it."""
+        if worker.ready:
+            return worker
+        try:
+            if not worker.conn.poll(_START_SECONDS):
+                raise EOFError(f"no hello within {_START_SECONDS}s")
+            worker.conn.recv()
+        except (EOFError, OSError) as exc:
+            worker.stop()
+            raise self._broken(exc) from exc
+        worker.ready = True
+        self.started += 1
+        return worker
+
+
+class _Worker:
+    def __init__(self, context, memory_limit_mb: float, preload: tuple[str, ...]) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_serve, args=(child, memory_limit_mb, preload),
+            name="worker", daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self.ready = False
+        self.jobs = 0
+
+    def stop(self) -> None:
+        self.conn.close()
+        self.process.kill()
+        self.process.join(timeout=5)
+
+
+# ── the worker process ────────────────────────────────────────────────
+
+
+def _serve(conn, memory_limit_mb: float, preload: tuple[str, ...]) -> None:
+    if resource is not None and memory_limit_mb:
+        limit = int(memory_limit_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    for module in preload:
+        importlib.import_module(module)
+    conn.send("ready")
+
+    while True:
+        try:
+            fn, args = conn.recv()
+        except EOFError:
+            return  # the pool closed its end
+
+        try:
+            reply = (False, fn(*args))
+        except BaseException as exc:
+            reply = (True, exc)
+
+        try:
+            conn.send(reply + (_peak_rss_mb(),))
+        except Exception as exc:  # an unpicklable result or exception
+            conn.send((True, RuntimeError(f"{type(exc).__name__}: {exc}"), _peak_rss_mb()))
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
@@ -0,0 +1,19 @@
+"""Shared by every test module, and imported before any of them.
+
+The caches default to files under the system temp directory, which outlive a
+test run: a second run would be answered from the first one's extractions.
+Each run gets a directory of its own instead, set before `screening.config`
+reads it at import.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+_CACHE_DIR = tempfile.mkdtemp(prefix="quorum-tests-")
+atexit.register(shutil.rmtree, _CACHE_DIR, ignore_errors=True)
+
+os.environ["CACHE_DIR"] = _CACHE_DIR
+for _name in ("LLM_CACHE_PATH", "JD_REGISTRY_PATH", "TEXT_CACHE_PATH"):
+    os.environ.pop(_name, None)
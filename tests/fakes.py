@@ -0,0 +1,49 @@
+"""A stand-in for Gemini, shared by the tests and the benchmarks.
+
+`LLMService` only ever calls `client.models.generate_content(...)` and reads
+the reply's `.text`, so setting a `FakeClient` as a service's `_client` runs
+the whole LLM path with no key and no network.
+"""
+
+import json
+import time
+
+JD = "Python developer with Django and PostgreSQL, 2-4 years of experience."
+JD_REPLY = {
+    "required_skills": ["Python", "Django", "PostgreSQL"],
+    "experience_required": {"min": 2, "max": 4},
+    "jd_clarity": "clear",
+}
+RESUME = "Backend engineer. Skills: Python, Django, PostgreSQL. 3 years of experience."
+
+
+class Response:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class FakeModels:
+    """Answers every prompt with `reply` after `latency` seconds, counting the
+    calls it receives. Subclasses answer by prompt through `answer` and
+    `delay`."""
+
+    def __init__(self, reply: dict | None = None, latency: float = 0.0) -> None:
+        self.reply = reply
+        self.latency = latency
+        self.calls = 0
+
+    def answer(self, contents: str) -> dict:
+        return self.reply
+
+    def delay(self, contents: str) -> float:
+        return self.latency
+
+    def generate_content(self, model: str, contents: str, config: dict) -> Response:
+        self.calls += 1
+        time.sleep(self.delay(contents))
+        return Response(json.dumps(self.answer(contents)))
+
+
+class FakeClient:
+    def __init__(self, models: FakeModels) -> None:
+        self.models = models
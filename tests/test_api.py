@@ -0,0 +1,168 @@
+"""The HTTP routes, through FastAPI's test client, in deterministic mode."""
+
+import io
+import json
+import os
+import zipfile
+
+os.environ["USE_LLM"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import index
+
+DATA = os.path.join(os.path.dirname(__file__), "..", "public", "samples")
+
+
+def _sample(name: str, mode: str = "rb"):
+    with open(os.path.join(DATA, name), mode) as f:
+        return f.read()
+
+
+JD = _sample("jd_01_backend_python_standard.txt", "r")
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """A client whose JD registry starts empty."""
+    monkeypatch.setattr("screening.config.JD_REGISTRY_PATH", str(tmp_path / "jd.sqlite3"))
+    monkeypatch.setattr(index, "_registry", None)
+    return TestClient(index.app)
+
+
+# ── registered job descriptions ───────────────────────────────────────
+
+
+def test_a_registered_jd_is_screened_against_by_id(client):
+    registered = client.post("/api/py/jd", data={"job_description": JD}).json()
+    key = registered["jd_id"]
+
+    assert client.get(f"/api/py/jd/{key}").json() == registered
+    response = client.post(
+        "/api/py/screen",
+        files={"resume": ("priya.pdf", _sample("resume_01_priya_sharma.pdf"))},
+        data={"jd_id": key},
+    )
+    assert response.status_code == 200
+    jd_step = response.json()["trace"][1]
+    assert jd_step["note"] == f"Parsed at registration and reused — JD {key}"
+
+
+def test_an_unknown_jd_id_is_not_found(client):
+    assert client.get("/api/py/jd/0123456789abcdef").status_code == 404
+    response = client.post(
+        "/api/py/screen",
+        files={"resume": ("priya.pdf", _sample("resume_01_priya_sharma.pdf"))},
+        data={"jd_id": "0123456789abcdef"},
+    )
+    assert response.status_code == 404
+    assert "No job description" in response.json()["detail"]
+
+
+# ── streamed screenings ───────────────────────────────────────────────
+
+_PANEL = ["ResumeParser", "JDParser", "SkillMatch", "Experience", "Decision", "Explanation"]
+
+
+def _screen(client, accept: str | None):
+    return client.post(
+        "/api/py/screen",
+        files={"resume": ("priya.pdf", _sample("resume_01_priya_sharma.pdf"))},
+        data={"job_description": JD},
+        headers={"Accept": accept} if accept else {},
+    )
+
+
+def test_ndjson_is_sent_one_event_per_line(client):
+    response = _screen(client, "application/x-ndjson")
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.split("\n")
+    assert lines[-1] == ""  # every event ends its line
+    events = [json.loads(line) for line in lines[:-1]]
+    assert [e["type"] for e in events] == ["step"] * 6 + ["result"]
+    assert [e["step"]["agent"] for e in events[:-1]] == _PANEL
+    assert [s["agent"] for s in events[-1]["result"]["trace"]] == _PANEL
+
+
+def test_sse_names_each_event_and_ends_it_with_a_blank_line(client):
+    response = _screen(client, "text/event-stream")
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = response.text.split("\n\n")
+    assert frames[-1] == ""
+    events = []
+    for frame in frames[:-1]:
+        name, data = frame.split("\n")
+        assert name.startswith("event: ") and data.startswith("data: ")
+        events.append(json.loads(data[len("data: "):]))
+        assert name == f"event: {events[-1]['type']}"
+    assert [e["type"] for e in events] == ["step"] * 6 + ["result"]
+    assert [e["step"]["agent"] for e in events[:-1]] == _PANEL
+
+
+def test_without_a_streaming_accept_the_result_is_one_document(client):
+    response = _screen(client, "application/json")
+
+    assert response.headers["content-type"] == "application/json"
+    assert [s["agent"] for s in response.json()["trace"]] == _PANEL
+
+
+# ── batches ───────────────────────────────────────────────────────────
+
+
+def _zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _batch(client, files: list[tuple[str, bytes]]):
+    return client.post(
+        "/api/py/screen/batch",
+        files=[("resumes", file) for file in files],
+        data={"job_description": JD},
+    )
+
+
+def test_a_batch_parses_its_jd_once(client):
+    response = _batch(client, [
+        ("priya.pdf", _sample("resume_01_priya_sharma.pdf")),
+        ("pool.zip", _zip({"ananya.pdf": _sample("resume_03_ananya_patel.pdf")})),
+    ])
+
+    assert response.status_code == 200
+    batch = response.json()
+    notes = {result["trace"][1]["note"] for result in batch["results"]}
+    assert notes == {f"Parsed once for this batch of 2 — JD {batch['jd_id']}"}
+
+
+def test_a_batch_of_too_many_resumes_is_refused(client, monkeypatch):
+    monkeypatch.setattr("screening.config.MAX_BATCH_RESUMES", 2)
+    pdf = _sample("resume_01_priya_sharma.pdf")
+
+    direct = _batch(client, [("a.pdf", pdf), ("b.pdf", pdf), ("c.pdf", pdf)])
+    zipped = _batch(client, [("a.pdf", pdf), ("pool.zip", _zip({"b.pdf": pdf, "c.pdf": pdf}))])
+
+    assert direct.status_code == zipped.status_code == 413
+    assert "at most 2 resumes" in direct.json()["detail"]
+
+
+def test_a_zip_too_large_unpacked_is_refused(client, monkeypatch):
+    monkeypatch.setattr("screening.config.MAX_BATCH_UPLOAD_BYTES", 50_000)
+    bomb = _zip({f"{i}.pdf": b"%PDF" + b"0" * 20_000 for i in range(3)})
+
+    response = _batch(client, [("pool.zip", bomb)])
+
+    assert response.status_code == 413
+    assert "once its zips are unpacked" in response.json()["detail"]
+
+
+def test_a_batch_without_resumes_is_unprocessable(client):
+    response = _batch(client, [("pool.zip", _zip({"notes.txt": b"not a resume"}))])
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "No resumes were found in the upload."
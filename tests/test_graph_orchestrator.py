@@ -1,17 +1,23 @@
-"""The LangGraph route.
+"""The graph route, and the runtime it is built on.
 
 The contract that matters: it must agree with the linear orchestrator on the
 verdict, and differ only in the work it skips getting there.
 """
 
+import asyncio
+import operator
 import os
+import time
+from typing import Annotated, TypedDict
 
 os.environ["USE_LLM"] = "false"
 
 import pytest
 
+from screening.dag import END, START, GraphError, StateGraph
 from screening.graph_orchestrator import GraphOrchestrator
 from screening.orchestrator import Orchestrator
+from tests.fakes import JD, JD_REPLY, RESUME, FakeClient, FakeModels
 
 DATA = os.path.join(os.path.dirname(__file__), "..", "public", "samples")
 
@@ -86,3 +92,124 @@ def test_shape_matches_the_linear_route(graph, linear):
     a = linear.run(_path("resume_01_priya_sharma.pdf"), _path("jd_01_backend_python_standard.txt"))
     b = graph.run(_path("resume_01_priya_sharma.pdf"), _path("jd_01_backend_python_standard.txt"))
     assert a.keys() == b.keys()
+
+
+def test_async_route_matches_the_sync_route(graph):
+    with open(_path("jd_04_vague_ambiguous.txt"), encoding="utf-8") as f:
+        jd = f.read()
+    a = graph.run_from_text("Python developer, 3 years of experience", jd)
+    b = asyncio.run(graph.run_from_text_async("Python developer, 3 years of experience", jd))
+
+    assert [s["status"] for s in a["trace"]] == [s["status"] for s in b["trace"]]
+    for field in ("match_score", "recommendation", "requires_human", "reasoning_summary"):
+        assert a[field] == b[field]
+
+
+def _collect(stream) -> list[dict]:
+    async def drain():
+        return [event async for event in stream]
+    return asyncio.run(drain())
+
+
+def test_stream_reports_each_node_then_the_result(graph):
+    with open(_path("jd_04_vague_ambiguous.txt"), encoding="utf-8") as f:
+        jd = f.read()
+    events = _collect(graph.stream_from_text("Python developer, 3 years of experience", jd))
+
+    *steps, last = events
+    assert {e["type"] for e in steps} == {"step"}
+    assert last["type"] == "result"
+    # Skipped agents are streamed too, so the client sees the route taken.
+    assert [e["step"]["agent"] for e in steps] == [s["agent"] for s in last["result"]["trace"]]
+    assert [e["step"]["status"] for e in steps].count("skipped") == 2
+
+
+def test_combined_mode_reads_both_documents_in_one_call(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_COMBINED", True)
+    models = FakeModels({"resume": {"skills": ["Python"], "experience_years": 3},
+                         "job": JD_REPLY})
+    graph = GraphOrchestrator()
+    graph.llm._client = FakeClient(models)
+
+    result = graph.run_from_text(RESUME, JD)
+
+    assert models.calls == 1
+    assert [s["source"] for s in result["trace"][:2]] == ["llm", "llm"]
+    assert result["role"]["required_skills"] == JD_REPLY["required_skills"]
+
+
+def test_async_route_awaits_the_parsers_on_the_loop(monkeypatch):
+    graph = GraphOrchestrator()
+    graph.llm._client = FakeClient(FakeModels(JD_REPLY))
+
+    async def parse_async(text, deadline=None):
+        return {"skills": ["Python"], "experience_years": 3, "projects": [],
+                "source": "llm", "note": None}
+
+    def parse(text, deadline=None):
+        raise AssertionError("the resume was parsed on an executor thread")
+
+    monkeypatch.setattr(graph.resume_agent, "parse_async", parse_async)
+    monkeypatch.setattr(graph.resume_agent, "parse", parse)
+
+    result = asyncio.run(graph.run_from_text_async(RESUME, JD))
+    assert result["candidate"]["skills"] == ["Python"]
+
+
+# ── the runtime ───────────────────────────────────────────────────────
+
+
+class _State(TypedDict, total=False):
+    seen: Annotated[list[str], operator.add]
+    last: str
+
+
+def _sleeper(name: str, seconds: float = 0.0):
+    def node(state: _State) -> _State:
+        time.sleep(seconds)
+        return {"seen": [name]}
+    return node
+
+
+def test_branches_run_side_by_side_and_meet():
+    graph = StateGraph(_State)
+    for name in ("a", "b"):
+        graph.add_node(name, _sleeper(name, 0.2))
+    graph.add_node("joined", lambda state: {"last": ",".join(state["seen"])})
+    graph.add_conditional_edges(START, lambda state: ["b", "a"], ["a", "b"])
+    graph.add_edge(["a", "b"], "joined")
+    graph.add_edge("joined", END)
+    compiled = graph.compile()
+
+    started = time.perf_counter()
+    final = compiled.invoke({"seen": ["start"]})
+    assert time.perf_counter() - started < 0.35
+    # Merged in the order the nodes were added, whichever finished first.
+    assert final["seen"] == ["start", "a", "b"] and final["last"] == "start,a,b"
+    assert asyncio.run(compiled.ainvoke({"seen": ["start"]})) == final
+
+
+def test_two_writes_to_one_key_in_a_step_are_refused():
+    graph = StateGraph(_State)
+    graph.add_node("a", lambda state: {"last": "a"})
+    graph.add_node("b", lambda state: {"last": "b"})
+    graph.add_conditional_edges(START, lambda state: ["a", "b"])
+
+    with pytest.raises(GraphError, match="both wrote 'last'"):
+        graph.compile().invoke({})
+
+
+def _without_timings(result: dict) -> dict:
+    trace = [{k: v for k, v in step.items() if k not in ("duration_ms", "budget")}
+             for step in result["trace"]]
+    return {**result, "trace": trace}
+
+
+@pytest.mark.parametrize("resume,jd", CASES)
+def test_the_same_graph_on_langgraph_gives_the_same_result(graph, resume, jd):
+    langgraph = pytest.importorskip("langgraph.graph")
+    on_langgraph = GraphOrchestrator()
+    on_langgraph.graph = on_langgraph._build(langgraph.StateGraph)
+
+    assert _without_timings(graph.run(_path(resume), _path(jd))) == \
+        _without_timings(on_langgraph.run(_path(resume), _path(jd)))
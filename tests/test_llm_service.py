@@ -0,0 +1,739 @@
+"""The LLM path, against a stand-in for Gemini.
+
+No key and no network: the service is built in deterministic mode and handed a
+fake client, so what is exercised is everything this code does around the
+model call.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+
+os.environ["USE_LLM"] = "false"
+
+import pytest
+
+from screening.agents.jd_parser import JDParserAgent
+from screening.agents.resume_parser import ResumeParserAgent
+from screening.orchestrator import Orchestrator
+from screening.services.breaker import CircuitBreaker
+from screening.services.cache import DiskCache
+from screening.services.deadline import Deadline
+from screening.services.hedging import Hedger
+from screening.services.jd_registry import JDRegistry, jd_id
+from screening.services.limiter import Limiter
+from screening.services.llm_service import LLMService, LLMUnavailable
+from tests.fakes import JD, JD_REPLY, RESUME, FakeClient, FakeModels, Response
+
+
+def _service(models: FakeModels, cache: DiskCache | None = None) -> LLMService:
+    llm = LLMService()
+    llm._client = FakeClient(models)
+    llm._cache = cache
+    return llm
+
+
+# ── response cache ────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskCache(str(tmp_path / "llm.sqlite3"), ttl_seconds=60, max_entries=100)
+
+
+def test_a_repeated_prompt_is_answered_from_the_cache(cache):
+    models = FakeModels(JD_REPLY)
+    agent = JDParserAgent(_service(models, cache))
+
+    first = agent.parse(JD)
+    second = agent.parse(JD)
+
+    assert models.calls == 1
+    assert first["required_skills"] == second["required_skills"]
+    assert first["note"] is None
+    assert "Cached Gemini response" in second["note"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_the_cache_survives_a_restart(tmp_path):
+    path = str(tmp_path / "llm.sqlite3")
+    _service(FakeModels(JD_REPLY), DiskCache(path, 60, 100)).extract_jd_info(JD)
+
+    models = FakeModels(JD_REPLY)
+    _service(models, DiskCache(path, 60, 100)).extract_jd_info(JD)
+    assert models.calls == 0
+
+
+def test_a_rejected_reply_is_not_cached(cache):
+    models = FakeModels({"skills": []})
+    llm = _service(models, cache)
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="No skills"):
+            llm.extract_resume_info("A resume with nothing in it.")
+    assert models.calls == 2  # asked again, not replayed
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = DiskCache(str(tmp_path / "llm.sqlite3"), ttl_seconds=0, max_entries=100)
+    cache.put("k", "v")
+    time.sleep(0.01)
+    assert cache.get("k") is None
+
+
+def test_the_least_recently_used_entry_is_evicted(tmp_path):
+    cache = DiskCache(str(tmp_path / "llm.sqlite3"), ttl_seconds=60, max_entries=2)
+    cache.put("a", "1")
+    time.sleep(0.01)
+    cache.put("b", "2")
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.put("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_an_entry_read_from_disk_keeps_its_expiry(tmp_path, monkeypatch):
+    path = str(tmp_path / "llm.sqlite3")
+    now = time.time()
+    DiskCache(path, ttl_seconds=60, max_entries=100).put("k", "v")
+    cache = DiskCache(path, ttl_seconds=60, max_entries=100, memory_entries=10)
+
+    monkeypatch.setattr("screening.services.cache.time.time", lambda: now + 50)
+    assert cache.get("k") == "v"  # now held in memory too
+    monkeypatch.setattr("screening.services.cache.time.time", lambda: now + 61)
+    assert cache.get("k") is None
+
+
+def test_a_hit_is_not_written_until_the_next_put(tmp_path):
+    path = str(tmp_path / "llm.sqlite3")
+    cache = DiskCache(path, ttl_seconds=60, max_entries=100)
+    cache.put("k", "v")
+    with sqlite3.connect(path) as db:
+        created = db.execute("SELECT used FROM entries").fetchone()[0]
+
+    time.sleep(0.01)
+    cache.get("k")
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT used FROM entries").fetchone()[0] == created
+    cache.put("other", "v")
+    with sqlite3.connect(path) as db:
+        used = db.execute("SELECT used FROM entries WHERE key = 'k'").fetchone()[0]
+    assert used > created
+
+
+def test_an_unwritable_cache_degrades_to_misses(tmp_path):
+    # A directory where the file should be: sqlite cannot open it.
+    cache = DiskCache(str(tmp_path), 60, 100)
+    assert cache.enabled is False
+    cache.put("k", "v")
+    assert cache.get("k") is None
+
+
+# ── in-flight coalescing ──────────────────────────────────────────────
+
+
+class _FailingModels(FakeModels):
+    def generate_content(self, model: str, contents: str, config: dict) -> Response:
+        self.calls += 1
+        time.sleep(self.latency)
+        raise RuntimeError("quota exhausted")
+
+
+async def _together(llm: LLMService, n: int) -> list:
+    return await asyncio.gather(
+        *(llm.extract_jd_info_async(JD) for _ in range(n)), return_exceptions=True
+    )
+
+
+def test_identical_requests_in_flight_share_one_call():
+    models = FakeModels(JD_REPLY, latency=0.2)
+    llm = _service(models)
+
+    replies = asyncio.run(_together(llm, 5))
+
+    assert models.calls == 1
+    assert llm.coalesced == 4
+    assert all(r["required_skills"] == JD_REPLY["required_skills"] for r in replies)
+    assert len({id(r) for r in replies}) == 5  # each caller has its own copy
+    assert llm.extract_jd_info(JD) and models.calls == 2  # nothing kept afterwards
+
+
+def test_a_shared_failure_reaches_every_waiter(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_RETRY_DELAY_SECONDS", 0)
+    models = _FailingModels(JD_REPLY, latency=0.2)
+
+    errors = asyncio.run(_together(_service(models), 4))
+
+    assert models.calls == 2  # one request, and its one retry
+    assert all(isinstance(e, LLMUnavailable) for e in errors)
+
+
+# ── rate and concurrency limits ───────────────────────────────────────
+
+
+class _CountingModels(FakeModels):
+    """Also records the most calls it ever had in progress at once."""
+
+    def __init__(self, reply: dict, latency: float = 0.0) -> None:
+        super().__init__(reply, latency)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, model: str, contents: str, config: dict) -> Response:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            return super().generate_content(model, contents, config)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+async def _distinct(llm: LLMService, n: int) -> list:
+    return await asyncio.gather(
+        *(llm.extract_jd_info_async(f"{JD} Posting {i}.") for i in range(n)),
+        return_exceptions=True,
+    )
+
+
+def test_calls_in_flight_are_capped():
+    models = _CountingModels(JD_REPLY, latency=0.05)
+    llm = _service(models)
+    llm.limiter = Limiter(per_minute=0, max_in_flight=2)
+
+    replies = asyncio.run(_distinct(llm, 6))
+
+    assert models.calls == 6 and models.peak == 2
+    assert all(isinstance(r, dict) for r in replies)
+    stats = llm.limiter.stats()
+    assert stats["admitted"] == 6 and stats["in_flight"] == 0
+    assert stats["max_wait_ms"] > 0
+
+
+def test_a_call_past_the_quota_is_refused_without_being_sent(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_QUEUE_SECONDS", 0.1)
+    models = FakeModels(JD_REPLY)
+    llm = _service(models)
+    llm.limiter = Limiter(per_minute=6, max_in_flight=0)  # one every ten seconds
+
+    llm.extract_jd_info(JD)
+    started = time.perf_counter()
+    with pytest.raises(LLMUnavailable, match="request limit"):
+        llm.extract_jd_info(f"{JD} Another posting.")
+
+    assert time.perf_counter() - started < 1  # no retry sleep
+    assert models.calls == 1
+    assert llm.limiter.stats()["refused"] == 1
+
+
+# ── circuit breaker ───────────────────────────────────────────────────
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock) -> CircuitBreaker:
+    return CircuitBreaker(window=10, min_calls=4, failure_ratio=0.5,
+                          slow_seconds=5, cooldown_seconds=30, clock=clock)
+
+
+def test_the_breaker_opens_on_failures_and_recovers_through_one_probe():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    late = breaker.allow()
+    for ok in (True, False, True, False):
+        breaker.record(breaker.allow(), ok, 0.1)
+    assert breaker.state == "open" and not breaker.allow()
+
+    clock.now = 30
+    assert breaker.state == "half_open"
+    probe = breaker.allow()
+    assert probe and not breaker.allow()  # the probe, and only it
+    breaker.record(late, True, 0.1)  # admitted before it opened: no say now
+    assert not breaker.allow()
+    breaker.record(probe, False, 0.1)
+    assert breaker.state == "open"
+
+    clock.now = 60
+    breaker.record(breaker.allow(), True, 0.1)
+    assert breaker.state == "closed" and breaker.stats()["recent_calls"] == 0
+
+
+def test_a_probe_that_never_reports_is_given_up_on():
+    clock = _Clock()
+    breaker = CircuitBreaker(window=10, min_calls=1, failure_ratio=0.5, slow_seconds=5,
+                             cooldown_seconds=30, probe_seconds=10, clock=clock)
+    breaker.record(breaker.allow(), False, 0.1)
+
+    clock.now = 30
+    hung = breaker.allow()
+    clock.now = 39
+    assert not breaker.allow()
+    clock.now = 40
+    probe = breaker.allow()
+    assert probe
+    breaker.record(hung, True, 0.1)  # too late to count
+    assert breaker.state == "half_open"
+    breaker.record(probe, True, 0.1)
+    assert breaker.state == "closed"
+
+
+def test_slow_successes_count_against_the_breaker():
+    breaker = _breaker(_Clock())
+    for _ in range(4):
+        breaker.record(breaker.allow(), True, 6.0)
+    assert breaker.state == "open"
+
+
+def test_an_open_breaker_sends_screenings_straight_to_rules(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_RETRY_DELAY_SECONDS", 0)
+    models = _FailingModels(JD_REPLY)
+    llm = _service(models)
+    clock = _Clock()
+    llm.breaker = _breaker(clock)
+    agent = JDParserAgent(llm)
+
+    first = agent.parse(JD)
+    second = agent.parse(JD)
+    assert models.calls == 4 and first["source"] == second["source"] == "rule_based"
+    assert not llm.available and llm.configured  # an outage, not a missing key
+
+    third = agent.parse(JD)
+    assert models.calls == 4  # not asked at all
+    assert "skipped for another 30s" in third["note"]
+
+    clock.now = 30
+    llm._client = FakeClient(FakeModels(JD_REPLY))  # Gemini is back
+    assert agent.parse(JD)["source"] == "llm"
+    assert llm.breaker.state == "closed"
+
+
+class _HangingModels(FakeModels):
+    """Never answers until released, as a stalled Gemini need not."""
+
+    def __init__(self, reply: dict) -> None:
+        super().__init__(reply)
+        self.released = threading.Event()
+
+    def generate_content(self, model: str, contents: str, config: dict) -> Response:
+        self.calls += 1
+        self.released.wait()
+        return Response(json.dumps(self.reply))
+
+
+def test_calls_given_up_on_count_against_the_breaker(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr("screening.config.LLM_RETRY_DELAY_SECONDS", 0)
+    models = _HangingModels(JD_REPLY)
+    llm = _service(models)
+    llm.breaker = _breaker(_Clock())
+    try:
+        for _ in range(2):
+            assert JDParserAgent(llm).parse(JD)["source"] == "rule_based"
+        assert llm.breaker.state == "open"
+        assert llm.breaker.stats()["recent_calls"] == 4
+    finally:
+        models.released.set()
+    time.sleep(0.1)
+    assert llm.breaker.stats()["recent_calls"] == 4  # the late answers are not counted again
+
+
+def test_calls_given_up_on_free_their_limiter_slots(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_TIMEOUT_SECONDS", 0.2)
+    monkeypatch.setattr("screening.config.LLM_RETRY_DELAY_SECONDS", 0)
+    models = _HangingModels(JD_REPLY)
+    llm = _service(models)
+    llm.limiter = Limiter(per_minute=0, max_in_flight=2)
+    try:
+        for _ in range(3):
+            JDParserAgent(llm).parse(JD)
+        assert llm.limiter.stats()["in_flight"] == 0
+        assert llm.limiter.stats()["refused"] == 0  # never queued behind the stalled calls
+    finally:
+        models.released.set()
+
+
+
+# ── hedged requests ───────────────────────────────────────────────────
+
+
+class _StallingModels(FakeModels):
+    """The first call stalls for `stall` seconds; the rest are quick."""
+
+    def __init__(self, reply: dict, stall: float) -> None:
+        super().__init__(reply)
+        self.stall = stall
+
+    def delay(self, contents: str) -> float:
+        return self.stall if self.calls == 1 else 0.0
+
+
+def test_a_late_call_is_hedged_and_the_hedge_wins(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_HEDGE", True)
+    models = _StallingModels(JD_REPLY, stall=2.0)
+    llm = _service(models)
+    llm.hedger = Hedger(percentile=95, ratio=1.0)
+    for _ in range(20):
+        llm.hedger.observe(0.01)
+
+    started = time.perf_counter()
+    assert llm.extract_jd_info(JD)["required_skills"] == JD_REPLY["required_skills"]
+
+    assert time.perf_counter() - started < 1
+    assert models.calls == 2
+    stats = llm.hedger.stats()
+    assert stats["hedged"] == stats["wins"] == 1 and stats["delay_ms"] == 50.0
+
+
+def test_hedges_are_held_to_their_share_of_calls():
+    hedger = Hedger(percentile=95, ratio=0.25, window=20, min_samples=5)
+    assert hedger.delay() is None  # nothing seen yet to say what late is
+    for _ in range(5):
+        hedger.observe(0.2)
+
+    admitted = 0
+    for _ in range(40):
+        assert hedger.delay() == 0.2
+        admitted += hedger.admit()
+    assert admitted == 10 == hedger.stats()["hedged"]
+
+
+# ── request deadlines ─────────────────────────────────────────────────
+
+
+def test_a_nearly_spent_deadline_goes_straight_to_rules():
+    models = FakeModels(JD_REPLY)
+    clock = _Clock()
+    deadline = Deadline(10, clock=clock)
+    clock.now = 9
+
+    parsed = JDParserAgent(_service(models)).parse(JD, deadline)
+
+    assert models.calls == 0
+    assert parsed["source"] == "rule_based" and "too little for Gemini" in parsed["note"]
+
+
+def test_a_slow_call_is_cut_off_at_the_deadline_and_not_retried(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_MIN_BUDGET_SECONDS", 0.1)
+    models = FakeModels(JD_REPLY, latency=1.0)
+    llm = _service(models)
+
+    started = time.perf_counter()
+    parsed = JDParserAgent(llm).parse(JD, Deadline(0.3))
+
+    assert time.perf_counter() - started < 0.8
+    assert models.calls == 1 and llm.retries == 0
+    assert parsed["source"] == "rule_based" and "no time left to retry" in parsed["note"]
+
+
+def test_every_step_reports_its_share_of_the_deadline():
+    result = Orchestrator().run_from_text(RESUME, JD, deadline=Deadline(50))
+
+    assert all(0 < step["budget"]["left_ms"] <= 50_000 for step in result["trace"])
+    assert all(step["budget"]["used_ms"] == step["duration_ms"] for step in result["trace"])
+    assert "budget" not in Orchestrator().run_from_text(RESUME, JD)["trace"][0]
+
+
+# ── rules raced against Gemini ────────────────────────────────────────
+
+
+def test_rules_answer_when_gemini_misses_the_soft_deadline(monkeypatch, cache):
+    monkeypatch.setattr("screening.config.LLM_SOFT_DEADLINE_SECONDS", 0.1)
+    models = FakeModels(JD_REPLY, latency=0.5)
+    llm = _service(models, cache)
+    agent = JDParserAgent(llm)
+
+    started = time.perf_counter()
+    parsed = agent.parse(JD)
+    assert time.perf_counter() - started < 0.4
+    assert parsed["source"] == "rule_based" and "had not answered within 0.1s" in parsed["note"]
+    assert llm.overdue == 1
+
+    time.sleep(0.6)  # the call was left to finish, into the cache
+    assert agent.parse(JD)["source"] == "llm" and models.calls == 1
+
+
+def test_the_soft_deadline_runs_from_the_send_not_the_rules(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_SOFT_DEADLINE_SECONDS", 0.3)
+    agent = JDParserAgent(_service(FakeModels(JD_REPLY, latency=0.6)))
+    rules = agent._rule_based
+    monkeypatch.setattr(agent, "_rule_based", lambda text: (time.sleep(0.25), rules(text))[1])
+
+    started = time.perf_counter()
+    parsed = agent.parse(JD)
+
+    assert time.perf_counter() - started < 0.45  # not 0.25 of rules plus 0.3
+    assert parsed["source"] == "rule_based"
+
+
+def test_an_answer_inside_the_soft_deadline_is_used(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_SOFT_DEADLINE_SECONDS", 1.0)
+    llm = _service(FakeModels(JD_REPLY, latency=0.05))
+
+    parsed = asyncio.run(JDParserAgent(llm).parse_async(JD))
+
+    assert parsed["source"] == "llm" and llm.overdue == 0
+
+
+# ── combined extraction ───────────────────────────────────────────────
+
+def _combined_orchestrator(monkeypatch, resume_reply: dict) -> tuple:
+    monkeypatch.setattr("screening.config.LLM_COMBINED", True)
+    models = FakeModels({"resume": resume_reply, "job": JD_REPLY})
+    orchestrator = Orchestrator()
+    orchestrator.llm._client = FakeClient(models)
+    return orchestrator, models
+
+
+def test_combined_mode_reads_both_documents_in_one_call(monkeypatch):
+    orchestrator, models = _combined_orchestrator(
+        monkeypatch, {"skills": ["Python", "Django"], "experience_years": 3}
+    )
+
+    result = orchestrator.run_from_text(RESUME, JD)
+    streamed = asyncio.run(orchestrator.run_from_text_async(RESUME, JD))
+
+    assert models.calls == 2  # one per screening
+    for r in (result, streamed):
+        resume_step, jd_step = r["trace"][:2]
+        assert resume_step["source"] == jd_step["source"] == "llm"
+        assert "one Gemini call" in jd_step["note"]
+        assert r["role"]["required_skills"] == JD_REPLY["required_skills"]
+
+
+def test_a_bad_half_falls_back_on_its_own(monkeypatch):
+    orchestrator, models = _combined_orchestrator(monkeypatch, {"skills": []})
+
+    result = orchestrator.run_from_text(RESUME, JD)
+
+    resume_step, jd_step = result["trace"][:2]
+    assert models.calls == 1
+    assert resume_step["source"] == "rule_based"
+    assert "No skills" in resume_step["note"]
+    assert jd_step["source"] == "llm"
+
+
+# ── packed resume extraction ──────────────────────────────────────────
+
+
+class PackModels(FakeModels):
+    """Answers a packed prompt entry by entry; `bad` ids get no skills."""
+
+    def __init__(self, bad: tuple[int, ...] = (), latency: float = 0.0) -> None:
+        super().__init__({}, latency)
+        self.bad = bad
+        self.packs: list[int] = []
+
+    def answer(self, contents: str) -> dict:
+        count = contents.count("### Resume ")
+        self.packs.append(count)
+        if not count:
+            return {"skills": ["Python"], "experience_years": 2}
+        return {"resumes": [
+            {"id": i, "skills": [] if i in self.bad else ["Python", "Go"], "experience_years": i}
+            for i in range(count)
+        ]}
+
+
+def _resumes(n: int, length: int = 200) -> list[str]:
+    return [f"Resume {i}. Python and Go. ".ljust(length, ".") for i in range(n)]
+
+
+def test_resumes_are_packed_several_to_a_request(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_PACK_RESUMES", 3)
+    models = PackModels(bad=(1,))
+
+    answers = _service(models).extract_resumes(_resumes(5))
+
+    assert models.packs == [3, 2]
+    assert isinstance(answers[1], LLMUnavailable) and isinstance(answers[4], LLMUnavailable)
+    assert [a["experience_years"] for a in answers if isinstance(a, dict)] == [0, 2, 0]
+    assert "2 other resumes" in answers[0]["_note"]
+
+
+def test_longer_resumes_pack_fewer_to_a_request(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_PACK_RESUMES", 8)
+    monkeypatch.setattr("screening.config.LLM_PACK_CHARS", 1000)
+    models = PackModels()
+
+    _service(models).extract_resumes(_resumes(4, 200) + _resumes(4, 450))
+
+    assert models.packs == [4, 2, 2]
+
+
+def test_packed_answers_are_cached_resume_by_resume(monkeypatch, cache):
+    monkeypatch.setattr("screening.config.LLM_PACK_RESUMES", 3)
+    models = PackModels()
+    llm = _service(models, cache)
+    texts = _resumes(4)
+
+    llm.extract_resumes(texts[:3])
+    # Each resume is found under its own key, packed with others or alone.
+    assert "Cached" in llm.extract_resume_info(texts[1])["_note"]
+    answers = llm.extract_resumes(texts[1:])
+
+    assert models.packs == [3, 0]  # only the new resume was sent, on its own
+    assert all("Cached" in a["_note"] for a in answers[:2])
+    assert "id" not in answers[0]
+
+
+def test_concurrent_screenings_share_a_packed_request(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_PACK_RESUMES", 8)
+    models = PackModels(bad=(2,))
+    agent = ResumeParserAgent(_service(models))
+
+    async def screen_all():
+        return await asyncio.gather(*(agent.parse_async(text) for text in _resumes(4)))
+
+    parsed = asyncio.run(screen_all())
+
+    assert models.calls == 1
+    assert [p["source"] for p in parsed] == ["llm", "llm", "rule_based", "llm"]
+    assert "No skills" in parsed[2]["note"]
+
+
+def test_a_pack_keeps_to_the_soonest_deadline_it_carries(monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_PACK_RESUMES", 8)
+    monkeypatch.setattr("screening.config.LLM_MIN_BUDGET_SECONDS", 0)
+    monkeypatch.setattr("screening.config.LLM_RETRY_DELAY_SECONDS", 0)
+    models = PackModels(latency=1.0)
+    llm = _service(models)
+    texts = _resumes(2)
+
+    async def screen_both():
+        return await asyncio.gather(
+            llm.extract_resume_info_async(texts[0], Deadline(0.3)),
+            llm.extract_resume_info_async(texts[1]),
+            return_exceptions=True,
+        )
+
+    started = time.perf_counter()
+    answers = asyncio.run(screen_both())
+
+    assert time.perf_counter() - started < 0.8
+    assert models.calls  # sent, and given up on with the first deadline
+    assert all(isinstance(a, LLMUnavailable) for a in answers)
+
+
+# ── against the fake Gemini server ────────────────────────────────────
+
+
+@pytest.fixture
+def fake_gemini():
+    from benchmarks.fake_gemini import FakeGemini, serve
+
+    fake = FakeGemini(latency_ms=1, jitter=0, spike_rate=0, spike_ms=0, error_rate=0,
+                      empty_rate=0, prose_rate=0, fenced_rate=0, seed=0)
+    server = serve(fake, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield fake, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _sdk_service(base_url: str) -> LLMService:
+    genai = pytest.importorskip("google.genai")
+    llm = LLMService()
+    llm._client = genai.Client(api_key="fake", http_options={"base_url": base_url})
+    return llm
+
+
+def test_every_prompt_round_trips_through_the_sdk(fake_gemini):
+    fake, url = fake_gemini
+    llm = _sdk_service(url)
+
+    assert "Django" in llm.extract_jd_info(JD)["required_skills"]
+    assert "Python" in llm.extract_resume_info(RESUME)["skills"]
+    resume, jd = llm.extract_both(RESUME, JD)
+    assert "Python" in resume["skills"] and jd["jd_clarity"] == "clear"
+    assert all("Python" in a["skills"] for a in llm._extract_pack([RESUME, RESUME + " Go."]))
+    assert fake.stats() == {"ok": 4}
+
+
+def test_malformed_replies_fall_back(fake_gemini, monkeypatch):
+    monkeypatch.setattr("screening.config.LLM_RETRY_DELAY_SECONDS", 0)
+    fake, url = fake_gemini
+    agent = JDParserAgent(_sdk_service(url))
+
+    for outcome in ("prose", "empty", "error"):
+        fake.__dict__.update(prose_rate=0, empty_rate=0, error_rate=0)
+        setattr(fake, f"{outcome}_rate", 1.0)
+        assert agent.parse(JD)["source"] == "rule_based", outcome
+
+    fake.error_rate, fake.fenced_rate = 0, 1.0
+    assert agent.parse(JD)["source"] == "llm"  # a fence is tolerated
+
+
+# ── JD registry ───────────────────────────────────────────────────────
+
+
+def test_jd_id_ignores_spacing_and_case():
+    assert jd_id(JD) == jd_id("  " + JD.upper().replace(" ", "\n  "))
+    assert jd_id(JD) != jd_id(JD + " Kubernetes.")
+
+
+def test_a_registered_jd_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setattr("screening.config.JD_REGISTRY_PATH", str(tmp_path / "jd.sqlite3"))
+    parsed = JDParserAgent(LLMService()).parse(JD)
+    JDRegistry().put(jd_id(JD), parsed)
+
+    # A fresh registry, as after a restart: read back from disk.
+    assert JDRegistry().get(jd_id(JD)) == parsed
+    assert JDRegistry().get("unknown") is None
+
+
+def test_a_fallback_parse_is_not_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr("screening.config.JD_REGISTRY_PATH", str(tmp_path / "jd.sqlite3"))
+    registry = JDRegistry()
+    registry.put("k", {"source": "rule_based"}, persist=False)
+
+    assert registry.get("k") == {"source": "rule_based"}
+    assert JDRegistry().get("k") is None
+
+
+def test_a_fallback_parse_expires_soon(tmp_path, monkeypatch):
+    monkeypatch.setattr("screening.config.JD_REGISTRY_PATH", str(tmp_path / "jd.sqlite3"))
+    monkeypatch.setattr("screening.config.JD_REGISTRY_FALLBACK_TTL_SECONDS", 60)
+    registry = JDRegistry()
+    registry.put("rules", {"source": "rule_based"}, persist=False)
+    registry.put("llm", {"source": "llm"})
+
+    later = time.time() + 61
+    monkeypatch.setattr("screening.services.cache.time.time", lambda: later)
+    assert registry.get("rules") is None  # read again, by Gemini if it is back
+    assert registry.get("llm") == {"source": "llm"}
+
+
+class _RefusingJDParser:
+    def parse(self, jd_text, deadline=None):
+        raise AssertionError("the registered JD was parsed again")
+
+    async def parse_async(self, jd_text, deadline=None):
+        self.parse(jd_text)
+
+
+def test_a_parsed_jd_is_not_read_again():
+    orchestrator = Orchestrator()
+    parsed = orchestrator.jd_agent.parse(JD)
+    orchestrator.jd_agent = _RefusingJDParser()
+    resume = "Backend engineer. Skills: Python, Django, PostgreSQL. 3 years of experience."
+
+    result = orchestrator.run_from_text(resume, "", parsed_jd=parsed)
+    assert result["role"]["required_skills"] == parsed["required_skills"]
+
+    result = asyncio.run(orchestrator.run_from_text_async(resume, "", parsed_jd=parsed))
+    assert result["role"]["required_skills"] == parsed["required_skills"]
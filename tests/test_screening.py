@@ -5,19 +5,36 @@ The LLM path is exercised by asserting the agents degrade correctly when it is
 unavailable, which is the behaviour that actually has to hold in production.
 """
 
+import asyncio
+import io
 import os
+import re
+import sys
+import time
+import zipfile
 
 os.environ["USE_LLM"] = "false"
 
+import pypdf
 import pytest
 
 from screening.agents.decision_agent import DecisionAgent
 from screening.agents.explanation_agent import ExplanationAgent
 from screening.agents.experience_agent import ExperienceAgent
 from screening.agents.skill_match_agent import SkillMatchAgent
+from screening.batch import screen_batch_async, stream_batch_async
 from screening.orchestrator import Orchestrator
-from screening.services import taxonomy
-from screening.services.documents import DocumentError, extract_text
+from screening.services import documents, taxonomy
+from screening.services.cache import DiskCache
+from screening.services.workers import WorkerCrashed, WorkerPool, WorkerTimeout
+from screening.services.documents import (
+    ArchiveTooLarge,
+    DocumentError,
+    extract_document,
+    extract_text,
+    is_archive,
+    unpack_archive,
+)
 
 # The same fixtures the interface offers as samples — served from public/ so the
 # browser can fetch them, and read from disk here. One copy, not two.
@@ -56,11 +73,48 @@ def test_canonical_narrows_a_variant_to_its_base_skill():
     assert taxonomy.canonical("Kubernetes Operators") == "Kubernetes"
 
 
+def test_canonical_answers_repeats_from_its_cache():
+    before = taxonomy.canonical_cache_info()
+    taxonomy.canonical("a framework nobody has heard of")
+    taxonomy.canonical("a framework nobody has heard of")
+    after = taxonomy.canonical_cache_info()
+    assert after.misses == before.misses + 1
+    assert after.hits == before.hits + 1
+
+
 def test_longest_alias_wins():
     skills = taxonomy.extract_skills("Built APIs with Django REST Framework.")
     assert "Django REST Framework" in skills
 
 
+@pytest.mark.parametrize(
+    "line",
+    [
+        "C++, C#, Node.js and nodejs.",
+        "Next.js apps; node.jsx is not node",
+        "DJANGO REST FRAMEWORK / Postgres / k8s",
+        "go lang, golang2, .net, java script",
+        "Ruby on Rails, ci/cd, CI CD pipelines",
+    ],
+)
+def test_scanner_agrees_with_the_alias_patterns(line):
+    # The one-pass scanner replaced a regex per alias; it has to find exactly
+    # the hits those patterns did, boundaries included.
+    patterns = [
+        (alias, re.compile(
+            r"(?<![a-z0-9+#.])" + re.escape(alias) + r"(?![a-z0-9+#]|\.[a-z])",
+            re.IGNORECASE,
+        ))
+        for alias in taxonomy._ALIASES_BY_LENGTH
+    ]
+    expected = sorted(
+        (match.start(), alias)
+        for alias, pattern in patterns
+        for match in pattern.finditer(line)
+    )
+    assert sorted(taxonomy._scan(taxonomy._fold(line), taxonomy._ALIAS_TRIE)) == expected
+
+
 def test_learning_context_is_not_a_skill():
     text = "Currently learning Django through online courses\nLearning: Docker, Redis"
     skills = taxonomy.extract_skills(text)
@@ -85,6 +139,17 @@ def test_education_dates_are_not_experience():
     assert taxonomy.extract_experience_years(text) < 4
 
 
+def test_one_analysis_answers_every_extractor():
+    text = (
+        "Learning: Docker\nWORK EXPERIENCE\nEngineer, Python and Redis | 2021 - 2024\n"
+        "EDUCATION\nB.Sc. | 2016 - 2020\n"
+    )
+    doc = taxonomy.AnalysedText(text)
+    assert taxonomy.extract_skills(doc) == taxonomy.extract_skills(text) == ["Python", "Redis"]
+    assert taxonomy.extract_experience_years(doc) == 3.0
+    assert [header for header, _, _ in doc.sections] == ["", "WORK EXPERIENCE", "EDUCATION"]
+
+
 def test_stated_total_beats_date_ranges():
     text = "Backend engineer with 3+ years of experience.\nRole | 2019 - Present"
     assert taxonomy.extract_experience_years(text) == 3.0
@@ -103,6 +168,24 @@ def test_experience_requirement(text, expected):
     assert taxonomy.extract_experience_requirement(text) == expected
 
 
+def test_required_skills_stop_at_the_next_section():
+    jd = (
+        "About the role\nWe use Slack and Jira.\n"
+        "Requirements:\n- Python, PostgreSQL\n- Docker\n"
+        "\n  Nice to have:\n- Kafka\n"
+    )
+    assert set(taxonomy.extract_required_skills(jd)) == {"Python", "PostgreSQL", "Docker"}
+
+
+def test_blank_padded_jd_is_scanned_in_linear_time():
+    # The old lookahead rescanned every blank line after every line break;
+    # at MAX_JD_CHARS this shape took over a minute.
+    jd = "Skills: Python, SQL" + "\n" * 40_000
+    started = time.perf_counter()
+    assert taxonomy.extract_required_skills(jd) == ["Python", "SQL"]
+    assert time.perf_counter() - started < 1.0
+
+
 # ── agents ────────────────────────────────────────────────────────────
 
 
@@ -251,6 +334,260 @@ def test_pdf_is_detected_by_content_not_extension():
         assert "priya" in extract_text(f.read(), "resume.docx").lower()
 
 
+def test_pdf_header_is_found_past_leading_whitespace():
+    assert documents._is_pdf(b" \r\n\t%PDF-1.7 ...")
+    assert not documents._is_pdf(b"  PK%PDF-")
+    assert not documents._is_pdf(b"   ")
+
+
+def test_a_zip_of_resumes_is_unpacked():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("pool/a.pdf", b"%PDF-1.4 a")
+        archive.writestr("pool/notes.txt", "not a resume")
+        archive.writestr("__MACOSX/pool/._a.pdf", b"resource fork")
+        archive.writestr("b.DOCX", b"PK docx")
+    data = buffer.getvalue()
+
+    assert is_archive(data)
+    assert unpack_archive(data) == [("pool/a.pdf", b"%PDF-1.4 a"), ("b.DOCX", b"PK docx")]
+
+
+def test_a_zip_is_held_to_the_batch_limits_while_it_is_unpacked(monkeypatch):
+    monkeypatch.setattr("screening.config.MAX_UPLOAD_BYTES", 1000)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for i in range(3):
+            archive.writestr(f"{i}.pdf", b"%PDF" + b"0" * 500)
+    pool = buffer.getvalue()
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("bomb.pdf", b"0" * 100_000)
+    bomb = buffer.getvalue()
+
+    with pytest.raises(ArchiveTooLarge, match="at most"):
+        unpack_archive(pool, max_members=2)
+    with pytest.raises(ArchiveTooLarge, match="once its zips are unpacked"):
+        unpack_archive(pool, max_bytes=1200)
+    assert len(unpack_archive(pool, max_members=3, max_bytes=1600)) == 3
+    # Refused on its header's word, before a byte of it is inflated.
+    monkeypatch.setattr(zipfile.ZipExtFile, "read", lambda *_: pytest.fail("inflated"))
+    with pytest.raises(ArchiveTooLarge, match="bomb.pdf"):
+        unpack_archive(bomb)
+
+
+def test_a_docx_is_not_mistaken_for_an_archive():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", "<w:document/>")
+    assert not is_archive(buffer.getvalue())
+
+
+@pytest.fixture
+def text_cache(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path / "text.sqlite3"), ttl_seconds=60,
+                      max_entries=100, memory_entries=10)
+    monkeypatch.setattr(documents, "_text_cache", cache)
+    return cache
+
+
+def test_a_repeated_upload_is_not_read_again(text_cache, monkeypatch):
+    with open(os.path.join(DATA, "resume_01_priya_sharma.pdf"), "rb") as f:
+        data = f.read()
+    first = extract_text(data, "resume.pdf")
+
+    def refuse(*args):
+        raise AssertionError("the PDF was parsed again")
+
+    monkeypatch.setattr(documents, "_from_pdf", refuse)
+    assert extract_text(data, "another-name.pdf") == first
+    assert text_cache.stats()["hits"] == 1
+
+
+def test_an_unreadable_file_is_remembered_as_unreadable(text_cache):
+    for _ in range(2):
+        with pytest.raises(DocumentError, match="could not be read"):
+            extract_text(b"%PDF-1.4 and then nothing", "resume.pdf")
+    assert text_cache.stats()["hits"] == 1
+
+
+def _long_pdf(copies: int) -> bytes:
+    writer = pypdf.PdfWriter()
+    for _ in range(copies):
+        writer.append(os.path.join(DATA, "resume_01_priya_sharma.pdf"))
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_a_budgeted_read_stops_at_the_page_that_fills_it():
+    data = _long_pdf(3)  # a two-page resume, three times over
+    whole = extract_document(data, "cv.pdf")
+    first_page = extract_document(data, "cv.pdf", max_chars=1)
+
+    assert whole["pages"] == {"read": 6, "skipped": 0}
+    assert first_page["pages"] == {"read": 1, "skipped": 5}
+    assert whole["text"].startswith(first_page["text"])
+    assert len(whole["text"]) > 3 * len(first_page["text"])
+
+
+def test_the_trace_reports_pages_read_and_skipped():
+    orchestrator = Orchestrator()
+    with open(os.path.join(DATA, "jd_01_backend_python_standard.txt"), encoding="utf-8") as f:
+        jd = f.read()
+    result = orchestrator.run_from_text(
+        "Python developer, 5 years.", jd, pages={"read": 2, "skipped": 7}
+    )
+    assert result["trace"][0]["pages"] == {"read": 2, "skipped": 7}
+    assert "pages" not in result["trace"][1]
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(size=1, timeout_seconds=5, max_jobs=3,
+                      max_rss_mb=10_000, memory_limit_mb=512)
+    yield pool
+    pool.close()
+
+
+def test_a_worker_is_recycled_after_its_quota(pool):
+    pids = [pool.run(os.getpid) for _ in range(4)]
+    assert pids[0] == pids[1] == pids[2] != pids[3]
+    assert os.getpid() not in pids
+
+
+def test_an_overrunning_job_is_killed(pool):
+    started = time.perf_counter()
+    with pytest.raises(WorkerTimeout):
+        pool.run(time.sleep, 30, timeout=0.5)
+    assert time.perf_counter() - started < 5
+    assert pool.run(sum, [1, 2]) == 3  # a fresh worker took its place
+    assert pool.stats()["killed"] == 1
+
+
+def test_a_crashed_worker_is_replaced(pool):
+    with pytest.raises(WorkerCrashed):
+        pool.run(os._exit, 1)
+    assert pool.run(sum, [1, 2]) == 3
+
+
+def test_a_worker_that_died_idle_is_not_blamed_on_the_next_file(pool):
+    pool.warm()
+    idle = pool._idle.get()
+    idle.process.kill()
+    idle.process.join()
+    pool._idle.put(idle)
+
+    assert pool.run(sum, [1, 2]) == 3
+    assert pool.stats()["retired"] == 1
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="RLIMIT_AS is enforced on Linux")
+def test_a_job_cannot_allocate_past_the_ceiling(pool):
+    with pytest.raises(MemoryError):
+        pool.run(bytearray, 2 * 1024 ** 3)
+
+
+def test_a_file_too_big_for_the_memory_limit_is_not_remembered(text_cache, monkeypatch):
+    def too_big(*args):
+        raise MemoryError
+
+    monkeypatch.setattr(documents, "worker_pool", lambda: None)
+    monkeypatch.setattr(documents, "_from_pdf", too_big)
+    with pytest.raises(DocumentError, match="MB to read") as raised:
+        extract_text(b"%PDF-1.4 large", "resume.pdf")
+
+    assert raised.value.transient
+    assert text_cache.stats()["hits"] == 0
+    with pytest.raises(DocumentError):
+        extract_text(b"%PDF-1.4 large", "resume.pdf")
+    assert text_cache.stats()["hits"] == 0  # read again, not answered from the cache
+
+
+def test_a_slow_read_is_unreadable_but_not_remembered(text_cache, monkeypatch):
+    slow = WorkerPool(size=1, timeout_seconds=0.001, max_jobs=10,
+                      max_rss_mb=10_000, memory_limit_mb=0)
+    monkeypatch.setattr(documents, "_worker_pool", slow)
+    with open(os.path.join(DATA, "resume_01_priya_sharma.pdf"), "rb") as f:
+        data = f.read()
+    try:
+        slow.warm()
+        with pytest.raises(DocumentError, match="too long") as raised:
+            extract_text(data, "resume.pdf")
+    finally:
+        slow.close()
+
+    assert raised.value.transient
+    monkeypatch.setattr(documents, "_worker_pool", None)
+    monkeypatch.setattr("screening.config.EXTRACT_ISOLATION", False)
+    assert "priya" in extract_text(data, "resume.pdf").lower()
+
+
+_W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _docx(body: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        package.writestr("_rels/.rels", (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="word/document.xml" Type="http://schemas.'
+            'openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+            '</Relationships>'
+        ))
+        package.writestr("word/document.xml", f"<w:document {_W_NS}><w:body>{body}</w:body></w:document>")
+    return buffer.getvalue()
+
+
+def _cell(text: str, props: str = "") -> str:
+    return f"<w:tc><w:tcPr>{props}</w:tcPr><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:tc>"
+
+
+def test_docx_is_read_without_python_docx():
+    data = _docx(
+        "<w:tbl><w:tr>"
+        + _cell("Skills", '<w:gridSpan w:val="2"/>')
+        + _cell("Python", '<w:vMerge w:val="restart"/>')
+        + "</w:tr><w:tr>"
+        + _cell("SQL") + _cell("Go") + _cell("", "<w:vMerge/>")
+        + "</w:tr></w:tbl>"
+        "<w:p><w:r><w:t>Priya</w:t><w:tab/><w:t>Sharma</w:t><w:br w:type=\"page\"/></w:r>"
+        "<w:hyperlink><w:r><w:t> · site</w:t></w:r></w:hyperlink></w:p>"
+    )
+    # Body paragraphs before table cells; spans and merges repeat the text,
+    # exactly as python-docx lists them.
+    assert documents._from_docx(data) == "Priya\tSharma · site\nSkills\nSkills\nPython\nSQL\nGo\nPython"
+
+
+def test_an_unusual_docx_without_python_docx_is_unreadable(monkeypatch):
+    monkeypatch.setitem(sys.modules, "docx", None)  # as if not installed
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        package.writestr("word/body.xml", "<w:document/>")
+
+    with pytest.raises(DocumentError, match="could not be read") as caught:
+        documents._from_docx(buffer.getvalue())
+    assert not caught.value.transient
+    assert "python-docx" not in str(caught.value)
+
+
+def test_docx_reader_agrees_with_python_docx():
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    document.add_paragraph("Backend engineer").add_run("\tLondon").add_break()
+    table = document.add_table(rows=3, cols=3)
+    for i, row in enumerate(table.rows):
+        for j, cell in enumerate(row.cells):
+            cell.text = f"r{i}c{j}"
+    table.cell(0, 0).merge(table.cell(1, 1))
+    table.cell(2, 2).add_table(1, 1).cell(0, 0).text = "nested"
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    data = buffer.getvalue()
+    assert documents._from_docx(data) == documents._from_docx_object_model(data)
+
+
 # ── end to end ────────────────────────────────────────────────────────
 
 
@@ -291,3 +628,229 @@ def test_runs_without_an_api_key():
     result = _run("resume_01_priya_sharma.pdf", "jd_01_backend_python_standard.txt")
     assert result["mode"] == "rule_based"
     assert result["candidate"]["skills"]
+
+
+class _SlowParser:
+    """Stands in for an LLM-mode parser: a fixed wait, then a usable answer."""
+
+    def __init__(self, data: dict, wait: float = 0.2) -> None:
+        self.data = data
+        self.wait = wait
+
+    def parse(self, text: str, deadline=None) -> dict:
+        time.sleep(self.wait)
+        return dict(self.data)
+
+    async def parse_async(self, text: str, deadline=None) -> dict:
+        await asyncio.sleep(self.wait)
+        return dict(self.data)
+
+
+def _slow_orchestrator(resume_wait: float = 0.2) -> Orchestrator:
+    orchestrator = Orchestrator()
+    orchestrator.resume_agent = _SlowParser(
+        {"skills": ["Python"], "experience_years": 3, "source": "llm", "note": None},
+        resume_wait,
+    )
+    orchestrator.jd_agent = _SlowParser(
+        {"required_skills": ["Python", "SQL"], "experience_required": None,
+         "jd_clarity": "clear", "source": "llm", "note": None}
+    )
+    return orchestrator
+
+
+def test_parsers_run_side_by_side():
+    orchestrator = _slow_orchestrator()
+
+    started = time.perf_counter()
+    result = orchestrator.run_from_text("resume", "job description")
+    elapsed = time.perf_counter() - started
+
+    # Two 200 ms parses in sequence would take 400 ms.
+    assert elapsed < 0.35
+    resume_step, jd_step = result["trace"][:2]
+    assert [resume_step["agent"], jd_step["agent"]] == ["ResumeParser", "JDParser"]
+    assert resume_step["stage_ms"] == jd_step["stage_ms"]
+    assert resume_step["stage_ms"] < resume_step["duration_ms"] + jd_step["duration_ms"]
+
+
+def test_async_route_reaches_the_same_result():
+    orchestrator = Orchestrator()
+    with open(os.path.join(DATA, "jd_01_backend_python_standard.txt"), encoding="utf-8") as f:
+        jd = f.read()
+    with open(os.path.join(DATA, "resume_01_priya_sharma.pdf"), "rb") as f:
+        resume = extract_text(f.read())
+
+    a = orchestrator.run_from_text(resume, jd)
+    b = asyncio.run(orchestrator.run_from_text_async(resume, jd))
+
+    for result in (a, b):
+        for step in result["trace"]:
+            step.pop("duration_ms")
+            step.pop("stage_ms", None)
+    assert a == b
+
+
+def test_async_screenings_overlap():
+    # The point of the async path: screenings waiting on Gemini share one
+    # event loop instead of queueing behind each other.
+    orchestrator = _slow_orchestrator()
+
+    async def many():
+        return await asyncio.gather(*[
+            orchestrator.run_from_text_async("resume", "job description")
+            for _ in range(10)
+        ])
+
+    started = time.perf_counter()
+    results = asyncio.run(many())
+    assert time.perf_counter() - started < 0.5
+    assert all(r["recommendation"] for r in results)
+
+
+def _sample(name: str) -> bytes:
+    with open(os.path.join(DATA, name), "rb") as f:
+        return f.read()
+
+
+def test_batch_is_ranked_and_isolates_unreadable_resumes():
+    orchestrator = Orchestrator()
+    with open(os.path.join(DATA, "jd_01_backend_python_standard.txt"), encoding="utf-8") as f:
+        jd = f.read()
+    uploads = [
+        ("ananya.pdf", _sample("resume_03_ananya_patel.pdf")),
+        ("broken.pdf", b"not really a pdf"),
+        ("priya.pdf", _sample("resume_01_priya_sharma.pdf")),
+    ]
+
+    batch = asyncio.run(screen_batch_async(
+        orchestrator, uploads, jd, orchestrator.jd_agent.parse(jd)
+    ))
+
+    assert (batch["screened"], batch["failed"]) == (2, 1)
+    assert [r["filename"] for r in batch["results"]] == ["priya.pdf", "ananya.pdf"]
+    assert [r["rank"] for r in batch["results"]] == [1, 2]
+    assert batch["results"][0] == dict(
+        _run("resume_01_priya_sharma.pdf", "jd_01_backend_python_standard.txt"),
+        filename="priya.pdf", rank=1, trace=batch["results"][0]["trace"],
+    )
+    assert batch["errors"] == [
+        {"filename": "broken.pdf", "error": "That file claims to be a PDF but isn't one."}
+    ]
+
+
+def test_batch_screens_resumes_side_by_side():
+    orchestrator = _slow_orchestrator()
+    parsed_jd = {"required_skills": ["Python", "SQL"], "experience_required": None,
+                 "jd_clarity": "clear", "source": "llm", "note": None}
+    resume = _sample("resume_01_priya_sharma.pdf")
+
+    started = time.perf_counter()
+    batch = asyncio.run(screen_batch_async(
+        orchestrator, [(f"{i}.pdf", resume) for i in range(8)], "", parsed_jd
+    ))
+    # Eight 200 ms resume parses one after another would take 1.6 s.
+    assert time.perf_counter() - started < 1.0
+    assert batch["screened"] == 8
+
+
+def _collect(stream) -> list[tuple[float, dict]]:
+    """Each event with the time it arrived."""
+    async def drain():
+        started = time.perf_counter()
+        return [(time.perf_counter() - started, event) async for event in stream]
+    return asyncio.run(drain())
+
+
+def test_stream_sends_each_parser_as_it_finishes():
+    orchestrator = _slow_orchestrator(resume_wait=0.5)
+    events = _collect(orchestrator.stream_from_text("resume", "job description"))
+
+    (jd_at, first), (resume_at, second) = events[:2]
+    assert first["step"]["agent"] == "JDParser"
+    assert jd_at < 0.4  # not held back for the slower resume
+    assert second["step"]["agent"] == "ResumeParser"
+
+    _, last = events[-1]
+    assert last["type"] == "result"
+    assert [e["step"]["agent"] for _, e in events[2:-1]] == [
+        "SkillMatch", "Experience", "Decision", "Explanation",
+    ]
+
+
+def test_batch_stream_ranks_what_it_has_sent():
+    orchestrator = Orchestrator()
+    with open(os.path.join(DATA, "jd_01_backend_python_standard.txt"), encoding="utf-8") as f:
+        jd = f.read()
+    parsed_jd = orchestrator.jd_agent.parse(jd)
+    uploads = [
+        ("ananya.pdf", _sample("resume_03_ananya_patel.pdf")),
+        ("broken.pdf", b"not really a pdf"),
+        ("priya.pdf", _sample("resume_01_priya_sharma.pdf")),
+    ]
+
+    events = [e for _, e in _collect(stream_batch_async(orchestrator, uploads, jd, parsed_jd))]
+    *per_upload, ranking = events
+
+    assert sorted(e["index"] for e in per_upload) == [0, 1, 2]
+    assert [e["type"] for e in per_upload].count("failed") == 1
+    assert ranking["type"] == "ranking"
+    assert [r["filename"] for r in ranking["ranking"]] == ["priya.pdf", "ananya.pdf"]
+
+    batch = asyncio.run(screen_batch_async(orchestrator, uploads, jd, parsed_jd))
+    assert [r["final_score"] for r in ranking["ranking"]] == [
+        r["final_score"] for r in batch["results"]
+    ]
+
+
+# ── the API ───────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def limited():
+    """A client for an app that takes at most 10 bytes at /upload, the body
+    chunks it pulled from the client, and the bodies its route received."""
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+
+    from api.index import _BodyLimit
+
+    app = FastAPI()
+    app.add_middleware(_BodyLimit, limits={"/upload": 10})
+    received = []
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        received.append(await request.body())
+        return {"size": len(received[-1])}
+
+    pulled = []
+
+    def chunks(count: int):
+        for _ in range(count):
+            pulled.append(1)
+            yield b"abcd"
+
+    return TestClient(app), chunks, pulled, received
+
+
+def test_a_declared_oversized_body_is_refused_unread(limited):
+    client, chunks, pulled, received = limited
+
+    response = client.post("/upload", content=chunks(100), headers={"Content-Length": "400"})
+
+    assert response.status_code == 413
+    assert "limit" in response.json()["detail"]
+    assert pulled == [] and received == []
+    assert client.post("/upload", content=b"abcd").json() == {"size": 4}
+
+
+def test_an_undeclared_body_is_cut_off_past_the_limit(limited):
+    client, chunks, _, received = limited
+
+    # A generator is sent chunked, with no Content-Length to go by.
+    response = client.post("/upload", content=chunks(100))
+
+    assert response.status_code == 413
+    assert received == []  # the route never had the body
+    assert client.post("/upload", content=chunks(2)).json() == {"size": 8}